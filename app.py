@@ -1,7 +1,15 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 import logging
+from controllers.conditional import conditional
+from controllers.profiling import request_profiler
+from controllers.request_metrics import create_request_metrics
+from controllers.responses import create_json_provider, create_response_compressor
+from routes.debug import debug_bp
+from routes.events import events_bp
 from routes.individuals import individuals_bp
+from routes.portfolios import portfolios_bp
+from services.redis_service import redis_service
 from services.wealth_service import wealth_service
 
 # Configure logging
@@ -12,10 +20,27 @@ logging.basicConfig(
 
 def create_app():
     app = Flask(__name__)
+    app.json = create_json_provider(app)
     CORS(app)
     
+    # Installed before the compressor so its after_request hook runs last and sees the bytes sent
+    request_metrics = create_request_metrics()
+    if request_metrics:
+        request_metrics.install(app)
+        app.add_url_rule('/metrics', 'metrics', request_metrics.render)
+    
+    compressor = create_response_compressor()
+    if compressor:
+        app.after_request(compressor)
+    
+    if request_profiler.enabled:
+        request_profiler.install(app)
+    
     # Register blueprints
     app.register_blueprint(individuals_bp)
+    app.register_blueprint(portfolios_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(debug_bp)
     
     # Health check route
     @app.route('/health')
@@ -25,7 +50,8 @@ def create_app():
             return jsonify({
                 'status': 'healthy',
                 'redis': 'connected',
-                'redis_info': redis_info
+                'redis_info': redis_info,
+                'redis_pool': redis_service.pool_stats()
             })
         except Exception as e:
             return jsonify({
@@ -37,6 +63,10 @@ def create_app():
     # Statistics route
     @app.route('/stats')
     def get_stats():
+        # Validated against the aggregate counters; redis_info is as of the last full response
+        return conditional(wealth_service.stats_key, stats_response)
+    
+    def stats_response():
         try:
             wealth_stats = wealth_service.get_wealth_statistics()
             redis_info = wealth_service.get_redis_info()
@@ -44,7 +74,8 @@ def create_app():
             return jsonify({
                 'success': True,
                 'wealth_statistics': wealth_stats,
-                'redis_info': redis_info
+                'redis_info': redis_info,
+                'local_cache': wealth_service.get_cache_stats()
             })
         except Exception as e:
             return jsonify({
@@ -76,13 +107,29 @@ if __name__ == '__main__':
     print("Available routes:")
     print("  GET  /health - Health check")
     print("  GET  /stats - System statistics")
+    print("  GET  /metrics - Request and Redis command metrics (Prometheus text format)")
     print("  GET  /individuals - List all individuals")
     print("  POST /individuals - Create new individual")
+    print("  POST /individuals/bulk - Import individuals (JSON, NDJSON or CSV)")
     print("  GET  /individuals/<id> - Get individual by ID")
     print("  PUT  /individuals/<id> - Update individual")
     print("  DELETE /individuals/<id> - Delete individual")
     print("  GET  /individuals/ranking - Wealth ranking")
+    print("  GET  /individuals/ranking/industry/<industry> - Wealth ranking within an industry")
+    print("  GET  /individuals/ranking/state/<state> - Wealth ranking within a state")
+    print("  GET  /individuals/net-worth?min=&max= - Individuals within a net worth range")
+    print("  GET  /individuals/net-worth/count?min=&max= - Count within a net worth range")
+    print("  GET  /individuals/net-worth/histogram - Net worth distribution (log buckets or ?edges=)")
+    print("  GET  /individuals/<id>/rank - Wealth rank and percentile")
+    print("  GET  /individuals/<id>/history?from=&to=&resolution= - Net worth history, downsampled")
+    print("  GET  /individuals/movers?period=&direction= - Largest net worth changes this day/week/month/quarter/year")
     print("  GET  /individuals/industry/<industry> - Filter by industry")
     print("  GET  /individuals/search?q=query - Search individuals")
+    print("  GET  /individuals/export?format=ndjson|csv - Stream all individuals")
+    print("  GET  /portfolios/analytics?group_by= - Asset totals and distributions by industry, tier and risk")
+    print("  GET  /events - Live change events (Server-Sent Events)")
+    print("  GET  /debug/profiles - Captured request profiles (X-Profile-Token)")
+    print("  GET  /debug/profiles/<id> - Download a profile (?format=text for a pstats report)")
+    print("  GET  /debug/slow-operations - Recent slow Redis commands and pipelines")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
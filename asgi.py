@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from controllers.conditional import async_conditional
+from controllers.responses import create_response_compressor
+from routes.async_events import event_routes
+from routes.async_individuals import individual_routes
+from routes.async_portfolios import portfolio_routes
+from services.redis_service import redis_service
+from services.async_wealth_service import async_wealth_service
+from services.wealth_service import wealth_service
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Health check route
+async def health_check(request):
+    try:
+        redis_info = await async_wealth_service.get_redis_info()
+        return JSONResponse({
+            'status': 'healthy',
+            'redis': 'connected',
+            'redis_info': redis_info,
+            'redis_pool': redis_service.pool_stats()
+        })
+    except Exception as e:
+        return JSONResponse({
+            'status': 'unhealthy',
+            'redis': 'disconnected',
+            'error': str(e)
+        }, status_code=500)
+
+# Statistics route
+async def get_stats(request):
+    # Validated against the aggregate counters; redis_info is as of the last full response
+    return await async_conditional(request, wealth_service.stats_key, stats_response)
+
+async def stats_response():
+    try:
+        wealth_stats, redis_info = await asyncio.gather(
+            async_wealth_service.get_wealth_statistics(),
+            async_wealth_service.get_redis_info()
+        )
+        
+        return JSONResponse({
+            'success': True,
+            'wealth_statistics': wealth_stats,
+            'redis_info': redis_info,
+            'local_cache': wealth_service.get_cache_stats()
+        })
+    except Exception as e:
+        return JSONResponse({
+            'success': False,
+            'error': str(e)
+        }, status_code=500)
+
+# Error handlers
+async def not_found(request, exc):
+    return JSONResponse({
+        'success': False,
+        'error': 'Resource not found'
+    }, status_code=404)
+
+async def internal_error(request, exc):
+    return JSONResponse({
+        'success': False,
+        'error': 'Internal server error'
+    }, status_code=500)
+
+def create_asgi_app():
+    """Async counterpart of app.create_app(), served by any ASGI server."""
+    middleware = [Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])]
+    compressor = create_response_compressor()
+    if compressor:
+        # Starlette's middleware negotiates gzip only
+        middleware.append(Middleware(GZipMiddleware, minimum_size=compressor.min_size))
+    routes = [
+        Route('/health', health_check),
+        Route('/stats', get_stats),
+        *individual_routes,
+        *portfolio_routes,
+        *event_routes
+    ]
+    return Starlette(
+        routes=routes,
+        middleware=middleware,
+        exception_handlers={404: not_found, 500: internal_error}
+    )
+
+app = create_asgi_app()
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    print("Starting Wealth Tracker ASGI API...")
+    print("  CRUD, listing, ranking, net worth, history, movers, search, analytics and event routes of app.py")
+    print("  GET  /individuals/<id>?include=portfolio - Individual and portfolio in one call")
+    
+    uvicorn.run('asgi:app', host='0.0.0.0', port=8000)
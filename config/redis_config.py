@@ -1,4 +1,6 @@
+import asyncio
 import redis
+import redis.asyncio
 import os
 from dotenv import load_dotenv
 
@@ -14,20 +16,56 @@ class RedisConfig:
         return cls._instance
     
     def _initialize(self):
+        self.client_class = redis.Redis
         self.client = None
+        self.pool = None
+        self.pid = None
+        self.async_client = None
+        self.async_loop = None
+        self.async_pid = None
+        # A forked worker must never reuse the parent's sockets: drop them in the child
+        # and let the next get_client() build a fresh pool for this process
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
         self.connect()
     
+    def _build_pool(self, module=redis, max_connections=None):
+        """Build a connection pool from REDIS_* environment variables.
+        
+        ``module`` is ``redis`` or ``redis.asyncio``.  REDIS_UNIX_SOCKET
+        switches from TCP to a unix socket; setting REDIS_POOL_TIMEOUT makes
+        callers wait that many seconds for a free connection instead of
+        failing once REDIS_MAX_CONNECTIONS are in use.
+        """
+        kwargs = {
+            'password': os.getenv('REDIS_PASSWORD', None),
+            'db': int(os.getenv('REDIS_DB', 0)),
+            'decode_responses': True,
+            'socket_connect_timeout': 5,
+            'retry_on_timeout': True,
+            'health_check_interval': int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', 30)),
+            'max_connections': max_connections or int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+        }
+        
+        unix_socket = os.getenv('REDIS_UNIX_SOCKET')
+        if unix_socket:
+            kwargs['connection_class'] = module.UnixDomainSocketConnection
+            kwargs['path'] = unix_socket
+        else:
+            kwargs['host'] = os.getenv('REDIS_HOST', 'localhost')
+            kwargs['port'] = int(os.getenv('REDIS_PORT', 6379))
+            kwargs['socket_keepalive'] = os.getenv('REDIS_SOCKET_KEEPALIVE', 'true').lower() in ('1', 'true', 'yes')
+        
+        pool_timeout = os.getenv('REDIS_POOL_TIMEOUT')
+        if pool_timeout:
+            return module.BlockingConnectionPool(timeout=float(pool_timeout), **kwargs)
+        return module.ConnectionPool(**kwargs)
+    
     def connect(self):
         try:
-            self.client = redis.Redis(
-                host=os.getenv('REDIS_HOST', 'localhost'),
-                port=int(os.getenv('REDIS_PORT', 6379)),
-                password=os.getenv('REDIS_PASSWORD', None),
-                db=int(os.getenv('REDIS_DB', 0)),
-                decode_responses=True,
-                socket_connect_timeout=5,
-                retry_on_timeout=True
-            )
+            self.pool = self._build_pool()
+            self.client = self.client_class(connection_pool=self.pool)
+            self.pid = os.getpid()
             
             # Test connection
             self.client.ping()
@@ -40,15 +78,79 @@ class RedisConfig:
             print(f"Unexpected error connecting to Redis: {e}")
             raise
     
+    def _reset_after_fork(self):
+        self.client = None
+        self.pool = None
+        self.pid = None
+        self.async_client = None
+        self.async_loop = None
+        self.async_pid = None
+    
+    def use_client_class(self, client_class) -> None:
+        """Build sync clients as ``client_class`` (a redis.Redis subclass), rewrapping the open pool."""
+        self.client_class = client_class
+        if self.pool is not None:
+            self.client = client_class(connection_pool=self.pool)
+    
     def get_client(self):
-        if self.client is None:
+        if self.client is None or self.pid != os.getpid():
             self.connect()
         return self.client
     
+    def create_dedicated_client(self):
+        """A client with its own one-connection pool, for a long blocking reader kept out of the shared pool.
+        
+        The caller owns it and closes it when done.
+        """
+        return self.client_class(connection_pool=self._build_pool(max_connections=1))
+    
+    def get_async_client(self) -> redis.asyncio.Redis:
+        """redis.asyncio client with its own pool, configured like the sync one.
+        
+        Must be called from a coroutine: asyncio connections belong to the
+        event loop that opened them, so a new loop (or a forked process) gets
+        a new pool.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_client is None or self.async_loop is not loop or self.async_pid != os.getpid():
+            self.async_client = redis.asyncio.Redis(connection_pool=self._build_pool(redis.asyncio))
+            self.async_loop = loop
+            self.async_pid = os.getpid()
+        return self.async_client
+    
+    def pool_stats(self) -> dict:
+        """Connection usage of this process's pool, for /health."""
+        pool = self.pool
+        if pool is None:
+            return {'pid': os.getpid(), 'connected': False}
+        
+        max_connections = pool.max_connections
+        if isinstance(pool, redis.BlockingConnectionPool):
+            created = len([connection for connection in pool._connections if connection is not None])
+            idle = len([connection for connection in list(pool.pool.queue) if connection is not None])
+            in_use = created - idle
+        else:
+            created = pool._created_connections
+            idle = len(pool._available_connections)
+            in_use = len(pool._in_use_connections)
+        
+        return {
+            'pid': self.pid,
+            'pool_class': type(pool).__name__,
+            'max_connections': max_connections,
+            'created_connections': created,
+            'in_use_connections': in_use,
+            'idle_connections': idle,
+            'utilisation': in_use / max_connections if max_connections else 0.0
+        }
+    
     def disconnect(self):
         if self.client:
             self.client.close()
             self.client = None
+        if self.pool:
+            self.pool.disconnect()
+            self.pool = None
 
 # Global instance
-redis_config = RedisConfig()
\ No newline at end of file
+redis_config = RedisConfig()
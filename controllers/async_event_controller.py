@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import queue
+from typing import AsyncIterator
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from controllers.event_controller import EventController
+from services.change_feed import Subscription, change_broadcaster, change_feed
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+class AsyncEventController:
+    """Starlette handler mirroring EventController's stream.
+    
+    Streams share the process's change feed reader and its SSE_MAX_CLIENTS
+    cap with the Flask app.  An open stream waits for the reader's batches
+    on the event loop, so it only borrows a thread-pool worker for the short
+    catch-up reads, never for the life of the connection.
+    """
+    
+    @staticmethod
+    async def stream_events(request: Request):
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        subscription = change_broadcaster.subscribe(lambda: loop.call_soon_threadsafe(ready.set))
+        if subscription is None:
+            return JSONResponse({
+                'success': False,
+                'error': 'Too many live event streams, retry later'
+            }, status_code=503, headers={'Retry-After': '30'})
+        
+        try:
+            last_id = (request.headers.get('Last-Event-ID') or request.query_params.get('last_event_id')
+                       or await run_in_threadpool(change_feed.last_id))
+        except Exception as e:
+            change_broadcaster.unsubscribe(subscription)
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+        
+        # The background task runs once the stream ends, client disconnects included
+        return StreamingResponse(
+            AsyncEventController.event_stream(subscription, ready, last_id),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+            background=BackgroundTask(change_broadcaster.unsubscribe, subscription)
+        )
+    
+    @staticmethod
+    async def event_stream(subscription: Subscription, ready: asyncio.Event, last_id: str,
+                           keepalive_s: float = 15, count: int = 100) -> AsyncIterator[str]:
+        """EventController.event_stream for the event loop; ``ready`` is set whenever a batch is offered."""
+        yield 'retry: 3000\n\n'
+        stats = {}
+        try:
+            while True:
+                events = await run_in_threadpool(EventController.catch_up, last_id, count)
+                if not events:
+                    break
+                for message in EventController.event_messages(events):
+                    yield message
+                last_id = events[-1][0]
+                current = await run_in_threadpool(wealth_service.get_wealth_statistics)
+                stats, message = EventController.stats_message(stats, current)
+                if message:
+                    yield message
+            
+            while True:
+                try:
+                    events, current = subscription.batches.get_nowait()
+                except queue.Empty:
+                    if subscription.dropped:
+                        # Fell too far behind: the client reconnects and catches up from its last event
+                        return
+                    # Cleared before the queue is rechecked, so a batch offered in between still wakes us
+                    ready.clear()
+                    if subscription.batches.empty():
+                        try:
+                            await asyncio.wait_for(ready.wait(), keepalive_s)
+                        except asyncio.TimeoutError:
+                            yield ': keepalive\n\n'
+                    continue
+                
+                events = EventController.events_after(events, last_id)
+                if not events:
+                    continue
+                for message in EventController.event_messages(events):
+                    yield message
+                last_id = events[-1][0]
+                stats, message = EventController.stats_message(stats, current)
+                if message:
+                    yield message
+        except Exception as e:
+            # The client reconnects and resumes from its last event
+            logger.error(f"Error streaming change events after {last_id}: {e}")
+
+async_event_controller = AsyncEventController()
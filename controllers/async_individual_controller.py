@@ -0,0 +1,499 @@
+from datetime import datetime, timezone
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from controllers.conditional import async_conditional
+from services.async_wealth_service import async_wealth_service
+
+class AsyncIndividualController:
+    """Starlette handlers mirroring IndividualController's responses."""
+    
+    @staticmethod
+    async def create_individual(request: Request):
+        try:
+            data = await request.json()
+            individual = await async_wealth_service.create_individual(data)
+            return JSONResponse({
+                'success': True,
+                'individual': individual.to_dict()
+            }, status_code=201)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+    
+    @staticmethod
+    async def get_individual(request: Request):
+        scope = async_wealth_service.record_scope(request.path_params['individual_id'])
+        if request.query_params.get('include') == 'portfolio':
+            # Portfolio writes only stamp the global generation, so those responses are not validated
+            scope = None
+        return await async_conditional(request, scope, lambda: AsyncIndividualController._individual_response(request))
+    
+    @staticmethod
+    async def _individual_response(request: Request):
+        try:
+            individual_id = request.path_params['individual_id']
+            fields = AsyncIndividualController._fields(request)
+            portfolio = None
+            if request.query_params.get('include') == 'portfolio':
+                individual, portfolio = await async_wealth_service.get_individual_with_portfolio(individual_id)
+            else:
+                individual = await async_wealth_service.get_individual(individual_id)
+            
+            if individual:
+                body = {
+                    'success': True,
+                    'individual': individual.to_dict(fields)
+                }
+                if request.query_params.get('include') == 'portfolio':
+                    body['portfolio'] = portfolio.to_dict() if portfolio else None
+                return JSONResponse(body)
+            else:
+                return JSONResponse({
+                    'success': False,
+                    'error': 'Individual not found'
+                }, status_code=404)
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def update_individual(request: Request):
+        try:
+            data = await request.json()
+            individual = await async_wealth_service.update_individual(request.path_params['individual_id'], data)
+            return JSONResponse({
+                'success': True,
+                'individual': individual.to_dict()
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=404)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+    
+    @staticmethod
+    async def delete_individual(request: Request):
+        try:
+            await async_wealth_service.delete_individual(request.path_params['individual_id'])
+            return JSONResponse({
+                'success': True,
+                'message': 'Individual deleted successfully'
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=404)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    def _int_arg(request: Request, name: str, default: int) -> int:
+        # Like Flask's request.args.get(name, default, type=int)
+        try:
+            return int(request.query_params.get(name, default))
+        except ValueError:
+            return default
+    
+    @staticmethod
+    def _page_args(request: Request):
+        limit = AsyncIndividualController._int_arg(request, 'limit', 50)
+        if limit < 1 or limit > 500:
+            raise ValueError('Query parameter "limit" must be between 1 and 500')
+        return request.query_params.get('sort', 'net_worth'), limit, request.query_params.get('cursor')
+    
+    @staticmethod
+    def _fields(request: Request):
+        return async_wealth_service.parse_fields(request.query_params.get('fields'))
+    
+    @staticmethod
+    def _serialize(individuals, fields):
+        # Projected pages already hold dicts
+        return individuals if fields else [ind.to_dict() for ind in individuals]
+    
+    @staticmethod
+    def _filter_args(request: Request):
+        return {
+            field: request.query_params[field]
+            for field in async_wealth_service.filter_index_keys
+            if request.query_params.get(field)
+        }
+    
+    @staticmethod
+    async def get_all_individuals(request: Request):
+        scope = async_wealth_service.listing_scope(
+            request.query_params.get('sort', 'net_worth'), filters=AsyncIndividualController._filter_args(request)
+        )
+        return await async_conditional(request, scope, lambda: AsyncIndividualController._listing_response(request))
+    
+    @staticmethod
+    async def _listing_response(request: Request):
+        try:
+            sort, limit, cursor = AsyncIndividualController._page_args(request)
+            filters = AsyncIndividualController._filter_args(request)
+            fields = AsyncIndividualController._fields(request)
+            page = await async_wealth_service.list_individuals(sort, limit, cursor, filters=filters, fields=fields)
+            return JSONResponse({
+                'success': True,
+                'filters': filters,
+                'individuals': AsyncIndividualController._serialize(page['individuals'], fields),
+                'count': len(page['individuals']),
+                'total': page['total'],
+                'sort': sort,
+                'limit': limit,
+                'next_cursor': page['next_cursor']
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def _ranking(request: Request, segment: str = None, value: str = None):
+        return await async_conditional(
+            request,
+            async_wealth_service.ranking_scope(segment, value),
+            lambda: AsyncIndividualController._ranking_response(request, segment, value)
+        )
+    
+    @staticmethod
+    async def _ranking_response(request: Request, segment: str = None, value: str = None):
+        try:
+            limit = AsyncIndividualController._int_arg(request, 'limit', 10)
+            if limit < 1:
+                raise ValueError('Query parameter "limit" must be a positive integer')
+            limit = min(limit, async_wealth_service.max_ranking_limit)
+            ranking = await async_wealth_service.get_wealth_ranking(
+                limit, segment, value, AsyncIndividualController._fields(request)
+            )
+            body = {
+                'success': True,
+                'ranking': ranking,
+                'limit': limit
+            }
+            if segment:
+                body[segment] = value
+            return JSONResponse(body)
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def get_wealth_ranking(request: Request):
+        return await AsyncIndividualController._ranking(request)
+    
+    @staticmethod
+    async def get_industry_ranking(request: Request):
+        return await AsyncIndividualController._ranking(request, 'industry', request.path_params['industry'])
+    
+    @staticmethod
+    async def get_state_ranking(request: Request):
+        return await AsyncIndividualController._ranking(request, 'state', request.path_params['state'])
+    
+    @staticmethod
+    def _net_worth_bounds(request: Request):
+        bounds = []
+        for name in ('min', 'max'):
+            value = request.query_params.get(name)
+            try:
+                bounds.append(float(value) if value not in (None, '') else None)
+            except ValueError:
+                raise ValueError(f'Query parameter "{name}" must be a number')
+        return bounds
+    
+    @staticmethod
+    async def get_individuals_by_net_worth(request: Request):
+        try:
+            min_worth, max_worth = AsyncIndividualController._net_worth_bounds(request)
+            _, limit, cursor = AsyncIndividualController._page_args(request)
+            include_records = request.query_params.get('include') == 'records'
+            page = await async_wealth_service.get_net_worth_range(
+                min_worth, max_worth, limit, cursor, include_records, AsyncIndividualController._fields(request)
+            )
+            return JSONResponse({
+                'success': True,
+                'min': min_worth,
+                'max': max_worth,
+                'individuals': page['entries'],
+                'count': len(page['entries']),
+                'total': page['total'],
+                'limit': limit,
+                'next_cursor': page['next_cursor']
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def count_by_net_worth(request: Request):
+        try:
+            min_worth, max_worth = AsyncIndividualController._net_worth_bounds(request)
+            return JSONResponse({
+                'success': True,
+                'min': min_worth,
+                'max': max_worth,
+                'count': await async_wealth_service.count_by_net_worth(min_worth, max_worth)
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def get_wealth_histogram(request: Request):
+        try:
+            edges = request.query_params.get('edges')
+            if edges:
+                try:
+                    edges = [float(edge) for edge in edges.split(',')]
+                except ValueError:
+                    raise ValueError('Query parameter "edges" must be comma-separated numbers')
+            histogram = await async_wealth_service.get_wealth_histogram(
+                edges or None, AsyncIndividualController._int_arg(request, 'per_decade', 1)
+            )
+            return JSONResponse({
+                'success': True,
+                **histogram
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def get_wealth_rank(request: Request):
+        try:
+            rank = await async_wealth_service.get_wealth_rank(request.path_params['individual_id'])
+            if rank:
+                return JSONResponse({
+                    'success': True,
+                    **rank
+                })
+            else:
+                return JSONResponse({
+                    'success': False,
+                    'error': 'Individual not found'
+                }, status_code=404)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    def _time_arg(request: Request, name: str):
+        """Unix seconds or an ISO 8601 time (UTC unless it has an offset), None when absent."""
+        value = request.query_params.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f'Query parameter "{name}" must be unix seconds or an ISO 8601 time')
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+    
+    @staticmethod
+    async def get_net_worth_history(request: Request):
+        return await async_conditional(
+            request,
+            async_wealth_service.history_key(request.path_params['individual_id']),
+            lambda: AsyncIndividualController._history_response(request)
+        )
+    
+    @staticmethod
+    async def _history_response(request: Request):
+        try:
+            history = await async_wealth_service.get_net_worth_history(
+                request.path_params['individual_id'],
+                AsyncIndividualController._time_arg(request, 'from'),
+                AsyncIndividualController._time_arg(request, 'to'),
+                request.query_params.get('resolution', 'raw')
+            )
+            if history is None:
+                return JSONResponse({
+                    'success': False,
+                    'error': 'Individual not found'
+                }, status_code=404)
+            return JSONResponse({
+                'success': True,
+                **history,
+                'count': len(history['points'])
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def get_movers(request: Request):
+        period = request.query_params.get('period', 'month')
+        previous = request.query_params.get('previous') == 'true'
+        return await async_conditional(
+            request,
+            async_wealth_service.movers_scope(period),
+            lambda: AsyncIndividualController._movers_response(request, period, previous)
+        )
+    
+    @staticmethod
+    async def _movers_response(request: Request, period: str, previous: bool):
+        try:
+            limit = AsyncIndividualController._int_arg(request, 'limit', 10)
+            if limit < 1:
+                raise ValueError('Query parameter "limit" must be a positive integer')
+            limit = min(limit, async_wealth_service.max_ranking_limit)
+            movers = await async_wealth_service.get_movers(
+                period, request.query_params.get('direction', 'gainers'), limit, previous,
+                AsyncIndividualController._fields(request)
+            )
+            return JSONResponse({
+                'success': True,
+                **movers,
+                'limit': limit
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def get_individuals_by_industry(request: Request):
+        filters = AsyncIndividualController._filter_args(request)
+        filters.pop('industry', None)
+        scope = async_wealth_service.listing_scope(
+            request.query_params.get('sort', 'net_worth'), request.path_params['industry'], filters
+        )
+        return await async_conditional(
+            request, scope, lambda: AsyncIndividualController._industry_listing_response(request)
+        )
+    
+    @staticmethod
+    async def _industry_listing_response(request: Request):
+        try:
+            industry = request.path_params['industry']
+            sort, limit, cursor = AsyncIndividualController._page_args(request)
+            filters = AsyncIndividualController._filter_args(request)
+            filters.pop('industry', None)
+            fields = AsyncIndividualController._fields(request)
+            page = await async_wealth_service.list_individuals(
+                sort, limit, cursor, industry=industry, filters=filters, fields=fields
+            )
+            return JSONResponse({
+                'success': True,
+                'industry': industry,
+                'individuals': AsyncIndividualController._serialize(page['individuals'], fields),
+                'count': len(page['individuals']),
+                'total': page['total'],
+                'sort': sort,
+                'limit': limit,
+                'next_cursor': page['next_cursor']
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+    
+    @staticmethod
+    async def search_individuals(request: Request):
+        try:
+            query = request.query_params.get('q', '')
+            if not query:
+                return JSONResponse({
+                    'success': False,
+                    'error': 'Query parameter "q" is required'
+                }, status_code=400)
+            
+            _, limit, _ = AsyncIndividualController._page_args(request)
+            fields = AsyncIndividualController._fields(request)
+            individuals = await async_wealth_service.search_individuals(query, limit)
+            return JSONResponse({
+                'success': True,
+                'query': query,
+                'limit': limit,
+                'individuals': [ind.to_dict(fields) for ind in individuals],
+                'count': len(individuals)
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+
+async_individual_controller = AsyncIndividualController()
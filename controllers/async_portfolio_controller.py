@@ -0,0 +1,40 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from controllers.conditional import async_conditional
+from services.async_wealth_service import async_wealth_service
+from services.portfolio_analytics import portfolio_analytics
+
+class AsyncPortfolioController:
+    """Starlette handlers mirroring PortfolioController's responses."""
+    
+    @staticmethod
+    async def get_analytics(request: Request):
+        # Aggregates every portfolio and individual, so any write invalidates it
+        return await async_conditional(
+            request, async_wealth_service.dataset_scope(), lambda: AsyncPortfolioController._analytics_response(request)
+        )
+    
+    @staticmethod
+    async def _analytics_response(request: Request):
+        try:
+            group_by = portfolio_analytics.parse_group_by(request.query_params.get('group_by'))
+            # Loading and aggregating every portfolio is blocking and CPU-bound: keep it off the event loop
+            analytics = await run_in_threadpool(portfolio_analytics.get_analytics, group_by)
+            return JSONResponse({
+                'success': True,
+                'group_by': group_by,
+                **analytics
+            })
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+        except Exception as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=500)
+
+async_portfolio_controller = AsyncPortfolioController()
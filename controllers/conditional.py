@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+from flask import make_response, request
+from starlette.requests import Request
+from starlette.responses import Response
+from werkzeug.http import http_date, is_resource_modified, quote_etag
+from services.async_wealth_service import async_wealth_service
+from services.wealth_service import wealth_service
+
+def validator_headers(generation: Tuple[int, float]) -> Dict[str, str]:
+    """ETag and Last-Modified for data last written at ``generation``.
+    
+    ``no-cache`` makes browsers revalidate every poll instead of reusing a
+    copy heuristically, which is what turns repeat polls into 304s.
+    """
+    number, modified = generation
+    return {
+        'ETag': quote_etag(str(number)),
+        'Last-Modified': http_date(datetime.fromtimestamp(modified, timezone.utc)),
+        'Cache-Control': 'no-cache'
+    }
+
+def is_fresh(headers: Mapping[str, str], validators: Dict[str, str]) -> bool:
+    """Whether the client's If-None-Match / If-Modified-Since still match ``validators``."""
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'HTTP_IF_NONE_MATCH': headers.get('If-None-Match', ''),
+        'HTTP_IF_MODIFIED_SINCE': headers.get('If-Modified-Since', '')
+    }
+    if not environ['HTTP_IF_NONE_MATCH'] and not environ['HTTP_IF_MODIFIED_SINCE']:
+        return False
+    return not is_resource_modified(
+        environ,
+        etag=validators['ETag'].strip('"'),
+        last_modified=validators['Last-Modified']
+    )
+
+def conditional(scope: Optional[str], view: Callable[[], Any]):
+    """Answer 304 when the client's copy of ``scope`` is current, otherwise run ``view``.
+    
+    The generation is read before the data, so a write racing the view
+    only makes the ETag older than the body and the next poll refetches.
+    Successful responses carry the validators; errors do not, and neither
+    does data without a single generation (``scope`` None).
+    """
+    generation = wealth_service.get_generation(scope) if scope else None
+    if generation is None:
+        return view()
+    
+    validators = validator_headers(generation)
+    if is_fresh(request.headers, validators):
+        return '', 304, validators
+    
+    response = make_response(view())
+    if response.status_code == 200:
+        response.headers.update(validators)
+    return response
+
+async def async_conditional(request: Request, scope: Optional[str], view: Callable[[], Awaitable[Response]]) -> Response:
+    """Starlette counterpart of ``conditional``."""
+    generation = await async_wealth_service.get_generation(scope) if scope else None
+    if generation is None:
+        return await view()
+    
+    validators = validator_headers(generation)
+    if is_fresh(request.headers, validators):
+        return Response(status_code=304, headers=validators)
+    
+    response = await view()
+    if response.status_code == 200:
+        response.headers.update(validators)
+    return response
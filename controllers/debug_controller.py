@@ -0,0 +1,78 @@
+from flask import Response, jsonify, request
+from controllers.profiling import request_profiler, stats_text
+from services.profile_store import profile_store
+from services.redis_service import redis_service
+
+class DebugController:
+    @staticmethod
+    def require_token():
+        """Guard for every debug route: 404 without a configured PROFILE_TOKEN, 403 for a missing or wrong one."""
+        if request_profiler.authorized():
+            return None
+        if not request_profiler.token:
+            return jsonify({
+                'success': False,
+                'error': 'Resource not found'
+            }), 404
+        return jsonify({
+            'success': False,
+            'error': 'The X-Profile-Token header is missing or wrong'
+        }), 403
+    
+    @staticmethod
+    def list_profiles():
+        try:
+            profiles = profile_store.list_recent()
+            return jsonify({
+                'success': True,
+                'data': profiles,
+                'count': len(profiles)
+            })
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def get_profile(profile_id):
+        """Download a capture: pstats data (or ``?format=text`` for its report) or a sampling HTML report."""
+        try:
+            profile = profile_store.get(profile_id)
+            if not profile:
+                return jsonify({
+                    'success': False,
+                    'error': 'Profile not found'
+                }), 404
+            
+            if profile['format'] == 'html':
+                return Response(profile['data'], mimetype='text/html')
+            if request.args.get('format') == 'text':
+                sort = request.args.get('sort', 'cumulative')
+                return Response(stats_text(profile['data'], sort, request.args.get('limit', 50, type=int)),
+                                mimetype='text/plain')
+            return Response(
+                profile['data'],
+                mimetype='application/octet-stream',
+                headers={'Content-Disposition': f'attachment; filename="{profile_id}.prof"'}
+            )
+        except KeyError as e:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown sort key {e}"
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def get_slow_operations():
+        return jsonify({
+            'success': True,
+            'threshold_ms': redis_service.slow_log.threshold * 1000,
+            'data': redis_service.slow_log.recent()
+        })
+
+debug_controller = DebugController()
\ No newline at end of file
@@ -0,0 +1,128 @@
+import json
+import logging
+import queue
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from flask import Response, jsonify, request
+from services.change_feed import Subscription, change_broadcaster, change_feed, entry_order
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+class EventController:
+    @staticmethod
+    def stream_events():
+        """Server-Sent Events for live dashboards.
+        
+        ``individual`` events carry each create, update and delete from the
+        change feed (with the new global rank), ``portfolio`` events each
+        stored portfolio, and ``stats`` the wealth statistics that changed
+        since the previous ``stats`` event (all of them the first time).
+        Browsers reconnect on their own and resume after Last-Event-ID.
+        Streams share one change feed reader per process and are capped at
+        SSE_MAX_CLIENTS; past that the request gets 503.
+        """
+        subscription = change_broadcaster.subscribe()
+        if subscription is None:
+            return jsonify({
+                'success': False,
+                'error': 'Too many live event streams, retry later'
+            }), 503, {'Retry-After': '30'}
+        
+        try:
+            last_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or change_feed.last_id()
+        except Exception as e:
+            change_broadcaster.unsubscribe(subscription)
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+        
+        response = Response(
+            EventController.event_stream(subscription, last_id),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        # Also runs when the client leaves before the stream starts
+        response.call_on_close(lambda: change_broadcaster.unsubscribe(subscription))
+        return response
+    
+    @staticmethod
+    def event_stream(subscription: Subscription, last_id: str, keepalive_s: float = 15, count: int = 100) -> Iterator[str]:
+        """SSE messages for one subscription after ``last_id``; blocking, so ASGI servers iterate it in a thread.
+        
+        The ASGI app uses AsyncEventController.event_stream instead, which
+        holds no thread while it waits.
+        """
+        yield 'retry: 3000\n\n'
+        stats = {}
+        try:
+            # Catch up on what was written after last_id, then follow the shared reader's batches;
+            # entries delivered by both are skipped by ID
+            while True:
+                events = EventController.catch_up(last_id, count)
+                if not events:
+                    break
+                yield from EventController.event_messages(events)
+                last_id = events[-1][0]
+                stats, message = EventController.stats_message(stats, wealth_service.get_wealth_statistics())
+                if message:
+                    yield message
+            
+            while True:
+                try:
+                    events, current = subscription.batches.get(timeout=keepalive_s)
+                except queue.Empty:
+                    if subscription.dropped:
+                        # Fell too far behind: the client reconnects and catches up from its last event
+                        return
+                    yield ': keepalive\n\n'
+                    continue
+                
+                events = EventController.events_after(events, last_id)
+                if not events:
+                    continue
+                yield from EventController.event_messages(events)
+                last_id = events[-1][0]
+                stats, message = EventController.stats_message(stats, current)
+                if message:
+                    yield message
+        except Exception as e:
+            # The client reconnects and resumes from its last event
+            logger.error(f"Error streaming change events after {last_id}: {e}")
+    
+    @staticmethod
+    def catch_up(last_id: str, count: int = 100) -> List[Tuple[str, Dict[str, Any]]]:
+        """Up to ``count`` events written after ``last_id``, individuals with their current rank; [] once caught up."""
+        events = change_feed.read(last_id, count)
+        if events:
+            for (_, event), rank in zip(events, change_feed.ranks(events)):
+                if event['type'] != 'portfolio':
+                    event['rank'] = rank
+        return events
+    
+    @staticmethod
+    def events_after(events: List[Tuple[str, Dict[str, Any]]], last_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """The events of a broadcast batch not yet sent, i.e. after ``last_id``."""
+        after = entry_order(last_id)
+        return [(entry_id, event) for entry_id, event in events if entry_order(entry_id) > after]
+    
+    @staticmethod
+    def event_messages(events: List[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+        for entry_id, event in events:
+            yield EventController._message('portfolio' if event['type'] == 'portfolio' else 'individual', event, entry_id)
+    
+    @staticmethod
+    def stats_message(previous: Dict[str, Any], current: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """The statistics now sent, and a ``stats`` message of those that changed (None if none did)."""
+        changed = {key: value for key, value in current.items() if previous.get(key) != value}
+        return current, EventController._message('stats', {'wealth_statistics': changed}) if changed else None
+    
+    @staticmethod
+    def _message(name: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+        lines = [f"event: {name}"]
+        if event_id:
+            lines.append(f"id: {event_id}")
+        lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+        return '\n'.join(lines) + '\n\n'
+
+event_controller = EventController()
\ No newline at end of file
@@ -1,5 +1,12 @@
-from flask import jsonify, request
-from typing import Dict, Any
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timezone
+from flask import Response, jsonify, request
+from typing import Dict, Any, Iterator
+from controllers.conditional import conditional
+from services.bulk_import import FORMATS, detect_format, parse_rows
 from services.wealth_service import wealth_service
 
 class IndividualController:
@@ -18,20 +25,61 @@ class IndividualController:
                 'error': str(e)
             }), 400
     
+    @staticmethod
+    def bulk_create_individuals():
+        try:
+            file_format = request.args.get('format') or detect_format(request.content_type)
+            if file_format not in FORMATS:
+                return jsonify({
+                    'success': False,
+                    'error': f'Unsupported import format, expected one of {", ".join(FORMATS)} '
+                             '(set Content-Type or ?format=)'
+                }), 400
+            
+            stream = io.TextIOWrapper(request.stream, encoding='utf-8')
+            report = wealth_service.bulk_create_individuals(parse_rows(stream, file_format))
+            return jsonify({
+                'success': report['failed'] == 0,
+                **report
+            }), 201 if report['failed'] == 0 else 207
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
     @staticmethod
     def get_individual(individual_id: str):
+        return conditional(
+            wealth_service.record_scope(individual_id),
+            lambda: IndividualController._individual_response(individual_id)
+        )
+    
+    @staticmethod
+    def _individual_response(individual_id: str):
         try:
+            fields = IndividualController._fields()
             individual = wealth_service.get_individual(individual_id)
             if individual:
                 return jsonify({
                     'success': True,
-                    'individual': individual.to_dict()
+                    'individual': individual.to_dict(fields)
                 })
             else:
                 return jsonify({
                     'success': False,
                     'error': 'Individual not found'
                 }), 404
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -77,15 +125,93 @@ class IndividualController:
                 'error': str(e)
             }), 500
     
+    @staticmethod
+    def _page_args():
+        limit = request.args.get('limit', 50, type=int)
+        if limit < 1 or limit > 500:
+            raise ValueError('Query parameter "limit" must be between 1 and 500')
+        return request.args.get('sort', 'net_worth'), limit, request.args.get('cursor')
+    
+    @staticmethod
+    def _fields():
+        return wealth_service.parse_fields(request.args.get('fields'))
+    
+    @staticmethod
+    def _serialize(individuals, fields):
+        # Projected pages already hold dicts
+        return individuals if fields else [ind.to_dict() for ind in individuals]
+    
+    @staticmethod
+    def _filter_args():
+        return {
+            field: request.args[field]
+            for field in wealth_service.filter_index_keys
+            if request.args.get(field)
+        }
+    
     @staticmethod
     def get_all_individuals():
+        scope = wealth_service.listing_scope(
+            request.args.get('sort', 'net_worth'), filters=IndividualController._filter_args()
+        )
+        return conditional(scope, IndividualController._listing_response)
+    
+    @staticmethod
+    def _listing_response():
         try:
-            individuals = wealth_service.get_all_individuals()
+            sort, limit, cursor = IndividualController._page_args()
+            filters = IndividualController._filter_args()
+            fields = IndividualController._fields()
+            page = wealth_service.list_individuals(sort, limit, cursor, filters=filters, fields=fields)
             return jsonify({
                 'success': True,
-                'individuals': [ind.to_dict() for ind in individuals],
-                'count': len(individuals)
+                'filters': filters,
+                'individuals': IndividualController._serialize(page['individuals'], fields),
+                'count': len(page['individuals']),
+                'total': page['total'],
+                'sort': sort,
+                'limit': limit,
+                'next_cursor': page['next_cursor']
             })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def _ranking(segment: str = None, value: str = None):
+        return conditional(
+            wealth_service.ranking_scope(segment, value),
+            lambda: IndividualController._ranking_response(segment, value)
+        )
+    
+    @staticmethod
+    def _ranking_response(segment: str = None, value: str = None):
+        try:
+            limit = request.args.get('limit', 10, type=int)
+            if limit < 1:
+                raise ValueError('Query parameter "limit" must be a positive integer')
+            limit = min(limit, wealth_service.max_ranking_limit)
+            ranking = wealth_service.get_wealth_ranking(limit, segment, value, IndividualController._fields())
+            body = {
+                'success': True,
+                'ranking': ranking,
+                'limit': limit
+            }
+            if segment:
+                body[segment] = value
+            return jsonify(body)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -94,14 +220,209 @@ class IndividualController:
     
     @staticmethod
     def get_wealth_ranking():
+        return IndividualController._ranking()
+    
+    @staticmethod
+    def get_industry_ranking(industry: str):
+        return IndividualController._ranking('industry', industry)
+    
+    @staticmethod
+    def get_state_ranking(state: str):
+        return IndividualController._ranking('state', state)
+    
+    @staticmethod
+    def _net_worth_bounds():
+        bounds = []
+        for name in ('min', 'max'):
+            value = request.args.get(name)
+            try:
+                bounds.append(float(value) if value not in (None, '') else None)
+            except ValueError:
+                raise ValueError(f'Query parameter "{name}" must be a number')
+        return bounds
+    
+    @staticmethod
+    def get_individuals_by_net_worth():
+        try:
+            min_worth, max_worth = IndividualController._net_worth_bounds()
+            _, limit, cursor = IndividualController._page_args()
+            include_records = request.args.get('include') == 'records'
+            page = wealth_service.get_net_worth_range(
+                min_worth, max_worth, limit, cursor, include_records, IndividualController._fields()
+            )
+            return jsonify({
+                'success': True,
+                'min': min_worth,
+                'max': max_worth,
+                'individuals': page['entries'],
+                'count': len(page['entries']),
+                'total': page['total'],
+                'limit': limit,
+                'next_cursor': page['next_cursor']
+            })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def count_by_net_worth():
+        try:
+            min_worth, max_worth = IndividualController._net_worth_bounds()
+            return jsonify({
+                'success': True,
+                'min': min_worth,
+                'max': max_worth,
+                'count': wealth_service.count_by_net_worth(min_worth, max_worth)
+            })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def get_wealth_histogram():
+        try:
+            edges = request.args.get('edges')
+            if edges:
+                try:
+                    edges = [float(edge) for edge in edges.split(',')]
+                except ValueError:
+                    raise ValueError('Query parameter "edges" must be comma-separated numbers')
+            histogram = wealth_service.get_wealth_histogram(
+                edges or None, request.args.get('per_decade', 1, type=int)
+            )
+            return jsonify({
+                'success': True,
+                **histogram
+            })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def get_wealth_rank(individual_id: str):
+        try:
+            rank = wealth_service.get_wealth_rank(individual_id)
+            if rank:
+                return jsonify({
+                    'success': True,
+                    **rank
+                })
+            else:
+                return jsonify({
+                    'success': False,
+                    'error': 'Individual not found'
+                }), 404
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def _time_arg(name: str):
+        """Unix seconds or an ISO 8601 time (UTC unless it has an offset), None when absent."""
+        value = request.args.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f'Query parameter "{name}" must be unix seconds or an ISO 8601 time')
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+    
+    @staticmethod
+    def get_net_worth_history(individual_id: str):
+        return conditional(
+            wealth_service.history_key(individual_id),
+            lambda: IndividualController._history_response(individual_id)
+        )
+    
+    @staticmethod
+    def _history_response(individual_id: str):
+        try:
+            history = wealth_service.get_net_worth_history(
+                individual_id,
+                IndividualController._time_arg('from'),
+                IndividualController._time_arg('to'),
+                request.args.get('resolution', 'raw')
+            )
+            if history is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Individual not found'
+                }), 404
+            return jsonify({
+                'success': True,
+                **history,
+                'count': len(history['points'])
+            })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @staticmethod
+    def get_movers():
+        period = request.args.get('period', 'month')
+        previous = request.args.get('previous') == 'true'
+        return conditional(
+            wealth_service.movers_scope(period),
+            lambda: IndividualController._movers_response(period, previous)
+        )
+    
+    @staticmethod
+    def _movers_response(period: str, previous: bool):
         try:
             limit = request.args.get('limit', 10, type=int)
-            ranking = wealth_service.get_wealth_ranking(limit)
+            if limit < 1:
+                raise ValueError('Query parameter "limit" must be a positive integer')
+            limit = min(limit, wealth_service.max_ranking_limit)
+            movers = wealth_service.get_movers(
+                period, request.args.get('direction', 'gainers'), limit, previous, IndividualController._fields()
+            )
             return jsonify({
                 'success': True,
-                'ranking': ranking,
+                **movers,
                 'limit': limit
             })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -110,14 +431,34 @@ class IndividualController:
     
     @staticmethod
     def get_individuals_by_industry(industry: str):
+        filters = IndividualController._filter_args()
+        filters.pop('industry', None)
+        scope = wealth_service.listing_scope(request.args.get('sort', 'net_worth'), industry, filters)
+        return conditional(scope, lambda: IndividualController._industry_listing_response(industry))
+    
+    @staticmethod
+    def _industry_listing_response(industry: str):
         try:
-            individuals = wealth_service.get_individuals_by_industry(industry)
+            sort, limit, cursor = IndividualController._page_args()
+            filters = IndividualController._filter_args()
+            filters.pop('industry', None)
+            fields = IndividualController._fields()
+            page = wealth_service.list_individuals(sort, limit, cursor, industry=industry, filters=filters, fields=fields)
             return jsonify({
                 'success': True,
                 'industry': industry,
-                'individuals': [ind.to_dict() for ind in individuals],
-                'count': len(individuals)
+                'individuals': IndividualController._serialize(page['individuals'], fields),
+                'count': len(page['individuals']),
+                'total': page['total'],
+                'sort': sort,
+                'limit': limit,
+                'next_cursor': page['next_cursor']
             })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -134,17 +475,86 @@ class IndividualController:
                     'error': 'Query parameter "q" is required'
                 }), 400
             
-            individuals = wealth_service.search_individuals(query)
+            _, limit, _ = IndividualController._page_args()
+            fields = IndividualController._fields()
+            individuals = wealth_service.search_individuals(query, limit)
             return jsonify({
                 'success': True,
                 'query': query,
-                'individuals': [ind.to_dict() for ind in individuals],
+                'limit': limit,
+                'individuals': [ind.to_dict(fields) for ind in individuals],
                 'count': len(individuals)
             })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
+    
+    @staticmethod
+    def export_individuals():
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in ('ndjson', 'csv'):
+            return jsonify({
+                'success': False,
+                'error': 'Query parameter "format" must be "ndjson" or "csv"'
+            }), 400
+        try:
+            fields = IndividualController._fields()
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        use_gzip = 'gzip' in request.accept_encodings
+        batches = wealth_service.iter_individual_batches()
+        body = IndividualController._export_ndjson(batches, fields) if export_format == 'ndjson' \
+            else IndividualController._export_csv(batches, fields)
+        if use_gzip:
+            body = IndividualController._gzip_stream(body)
+        
+        headers = {
+            'Content-Disposition': f'attachment; filename=individuals.{export_format}'
+        }
+        if use_gzip:
+            headers['Content-Encoding'] = 'gzip'
+            headers['Vary'] = 'Accept-Encoding'
+        
+        mimetype = 'application/x-ndjson' if export_format == 'ndjson' else 'text/csv'
+        return Response(body, mimetype=mimetype, headers=headers)
+    
+    @staticmethod
+    def _export_ndjson(batches, fields=None) -> Iterator[str]:
+        for individuals in batches:
+            yield ''.join(json.dumps(ind.to_dict(fields)) + '\n' for ind in individuals)
+    
+    @staticmethod
+    def _export_csv(batches, fields=None) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = None
+        for individuals in batches:
+            rows = [ind.to_dict(fields) for ind in individuals]
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+                writer.writeheader()
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    @staticmethod
+    def _gzip_stream(chunks: Iterator[str]) -> Iterator[bytes]:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk.encode('utf-8'))
+            if compressed:
+                yield compressed
+        yield compressor.flush()
 
 individual_controller = IndividualController()
\ No newline at end of file
@@ -0,0 +1,33 @@
+from flask import jsonify, request
+from controllers.conditional import conditional
+from services.portfolio_analytics import portfolio_analytics
+from services.wealth_service import wealth_service
+
+class PortfolioController:
+    @staticmethod
+    def get_analytics():
+        # Aggregates every portfolio and individual, so any write invalidates it
+        return conditional(wealth_service.dataset_scope(), PortfolioController._analytics_response)
+    
+    @staticmethod
+    def _analytics_response():
+        try:
+            group_by = portfolio_analytics.parse_group_by(request.args.get('group_by'))
+            analytics = portfolio_analytics.get_analytics(group_by)
+            return jsonify({
+                'success': True,
+                'group_by': group_by,
+                **analytics
+            })
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+portfolio_controller = PortfolioController()
\ No newline at end of file
@@ -0,0 +1,144 @@
+import cProfile
+import hmac
+import io
+import logging
+import marshal
+import os
+import pstats
+import time
+from typing import Any, Optional, Sequence, Tuple
+from flask import Flask, Response, g, request
+from services.profile_store import profile_store
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+logger = logging.getLogger(__name__)
+
+PROFILERS = ('cprofile', 'sampling')
+TOKEN_HEADER = 'X-Profile-Token'
+MODE_HEADER = 'X-Profile-Mode'
+
+class _LoadedStats:
+    """Marshalled pstats data in the shape pstats.Stats loads from a profiler."""
+    
+    def __init__(self, data: bytes):
+        self.stats = marshal.loads(data)
+    
+    def create_stats(self) -> None:
+        pass
+
+def stats_text(data: bytes, sort: str = 'cumulative', limit: int = 50) -> str:
+    """The ``python -m pstats`` report of a stored cProfile capture, ``limit`` functions long."""
+    output = io.StringIO()
+    pstats.Stats(_LoadedStats(data), stream=output).sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+class RequestProfiler:
+    """Captures a profile of selected requests and stores it for download from /debug/profiles.
+    
+    A request is profiled when it carries ``X-Profile-Token`` matching
+    PROFILE_TOKEN, or when its path or URL rule is listed in PROFILE_ROUTES
+    (``*`` for every route).  Reading captures (/debug/*) always needs the
+    token.  ``cprofile`` records every call (exact counts,
+    noticeable overhead); ``sampling`` uses pyinstrument, when installed, and
+    barely slows the request.  The response names the capture in
+    ``X-Profile-Id``.  Streamed responses are profiled up to their first byte.
+    """
+    
+    def __init__(self, token: Optional[str] = None, routes: Sequence[str] = (), mode: str = 'cprofile'):
+        if mode not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{mode}', expected one of {', '.join(PROFILERS)}")
+        if mode == 'sampling' and pyinstrument is None:
+            raise RuntimeError("The sampling profiler needs pyinstrument, which is not installed")
+        self.token = token
+        self.routes = frozenset(routes)
+        self.mode = mode
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token or self.routes)
+    
+    def authorized(self) -> bool:
+        """Whether the request carries PROFILE_TOKEN; always False when no token is configured."""
+        if not self.token:
+            return False
+        return hmac.compare_digest(request.headers.get(TOKEN_HEADER, ''), self.token)
+    
+    def install(self, app: Flask) -> None:
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.teardown_request(self.teardown_request)
+    
+    def _wanted(self) -> bool:
+        if request.blueprint == 'debug':
+            return False
+        if self.token and TOKEN_HEADER in request.headers:
+            return self.authorized()
+        rule = request.url_rule.rule if request.url_rule else None
+        return '*' in self.routes or request.path in self.routes or rule in self.routes
+    
+    def _mode(self) -> str:
+        mode = request.headers.get(MODE_HEADER, self.mode).lower()
+        if mode == 'sampling' and pyinstrument is None:
+            return 'cprofile'
+        return mode if mode in PROFILERS else self.mode
+    
+    def before_request(self) -> None:
+        if not self._wanted():
+            return
+        mode = self._mode()
+        if mode == 'sampling':
+            profiler = pyinstrument.Profiler(async_mode='disabled')
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        g.profiler = (mode, profiler, time.perf_counter())
+    
+    def _finish(self, mode: str, profiler: Any) -> Tuple[bytes, str]:
+        if mode == 'sampling':
+            profiler.stop()
+            return profiler.output_html().encode('utf-8'), 'html'
+        profiler.disable()
+        profiler.create_stats()
+        return marshal.dumps(profiler.stats), 'pstats'
+    
+    def after_request(self, response: Response) -> Response:
+        capture = g.pop('profiler', None)
+        if capture is None:
+            return response
+        
+        mode, profiler, started = capture
+        data, data_format = self._finish(mode, profiler)
+        try:
+            profile_id = profile_store.save(data, {
+                'format': data_format,
+                'method': request.method,
+                'path': request.full_path.rstrip('?'),
+                'route': request.url_rule.rule if request.url_rule else '',
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 3)
+            })
+        except Exception as e:
+            # The profiled response is still sent
+            logger.error(f"Error storing profile of {request.path}: {e}")
+            return response
+        
+        response.headers['X-Profile-Id'] = profile_id
+        return response
+    
+    def teardown_request(self, error=None) -> None:
+        # A response that failed before after_request leaves its profiler running
+        capture = g.pop('profiler', None)
+        if capture is not None:
+            self._finish(capture[0], capture[1])
+
+def create_request_profiler() -> RequestProfiler:
+    """Build the profiler from PROFILE_TOKEN, PROFILE_ROUTES (comma-separated) and PROFILER."""
+    routes = [route.strip() for route in os.getenv('PROFILE_ROUTES', '').split(',') if route.strip()]
+    return RequestProfiler(os.getenv('PROFILE_TOKEN') or None, routes, os.getenv('PROFILER', 'cprofile').lower())
+
+request_profiler = create_request_profiler()
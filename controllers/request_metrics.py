@@ -0,0 +1,81 @@
+import time
+from typing import Optional
+from flask import Flask, Response, g, request
+from services.metrics import COUNT_BUCKETS, SIZE_BUCKETS, metrics
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+class RequestMetrics:
+    """Flask hooks recording latency, status, payload sizes and Redis round trips per route.
+    
+    Routes are labelled by their URL rule (``/individuals/<individual_id>``),
+    never the raw path, so the number of series stays bounded.  The
+    after_request hook must be registered before any hook that rewrites the
+    body (compression) so that it runs last and sees the bytes actually sent.
+    Streamed responses are timed up to their first byte and their size is
+    not recorded.
+    """
+    
+    def __init__(self):
+        self.duration = metrics.histogram(
+            'http_request_duration_seconds', 'Time to build a response, per route', ['method', 'route']
+        )
+        self.requests = metrics.counter(
+            'http_requests_total', 'Responses sent, per route and status code', ['method', 'route', 'status']
+        )
+        self.request_size = metrics.histogram(
+            'http_request_size_bytes', 'Request body size, per route', ['method', 'route'], SIZE_BUCKETS
+        )
+        self.response_size = metrics.histogram(
+            'http_response_size_bytes', 'Response body size as sent, per route', ['method', 'route'], SIZE_BUCKETS
+        )
+        self.round_trips = metrics.histogram(
+            'http_request_redis_round_trips', 'Redis round trips (commands and pipelines) per request',
+            ['method', 'route'], COUNT_BUCKETS
+        )
+        self.commands = metrics.histogram(
+            'http_request_redis_commands', 'Redis commands, pipelined ones included, per request',
+            ['method', 'route'], COUNT_BUCKETS
+        )
+    
+    def install(self, app: Flask) -> None:
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.teardown_request(self.teardown_request)
+    
+    def before_request(self) -> None:
+        g.metrics_started = time.perf_counter()
+        g.metrics_token = metrics.begin_request()
+    
+    def after_request(self, response: Response) -> Response:
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+        
+        method = request.method
+        route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+        self.duration.observe(time.perf_counter() - started, method, route)
+        self.requests.inc(method, route, str(response.status_code))
+        self.request_size.observe(request.content_length or 0, method, route)
+        if not response.is_streamed:
+            self.response_size.observe(response.calculate_content_length() or 0, method, route)
+        
+        scope = metrics.current_request()
+        if scope is not None:
+            self.round_trips.observe(scope.round_trips, method, route)
+            self.commands.observe(scope.commands, method, route)
+        return response
+    
+    def teardown_request(self, error=None) -> None:
+        token = g.pop('metrics_token', None)
+        if token is not None:
+            metrics.end_request(token)
+    
+    def render(self) -> Response:
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+def create_request_metrics() -> Optional[RequestMetrics]:
+    """Build the request hooks and /metrics renderer, or None when METRICS_ENABLED is false."""
+    if not metrics.enabled:
+        return None
+    return RequestMetrics()
\ No newline at end of file
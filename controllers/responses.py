@@ -0,0 +1,96 @@
+import gzip
+import os
+from typing import Any, Optional
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, several times faster than the stdlib encoder.
+    
+    Types orjson does not handle natively (and datetimes, so they keep
+    Flask's HTTP date format) go through the default provider's hook.  Keys
+    are not sorted.
+    """
+    
+    def __init__(self, app: Flask):
+        super().__init__(app)
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._options).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return self._orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self._orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._options)
+        return self._app.response_class(body, mimetype='application/json')
+
+JSON_PROVIDERS = {'default': DefaultJSONProvider, 'orjson': OrjsonProvider}
+
+def create_json_provider(app: Flask) -> JSONProvider:
+    """Build the provider named by JSON_PROVIDER (default or orjson)."""
+    name = os.getenv('JSON_PROVIDER', 'default').lower()
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Unknown JSON provider '{name}', expected one of {', '.join(JSON_PROVIDERS)}")
+    try:
+        return JSON_PROVIDERS[name](app)
+    except ImportError as e:
+        raise RuntimeError(f"JSON provider '{name}' needs an optional package that is not installed: {e}") from e
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class ResponseCompressor:
+    """Compresses buffered responses above a size threshold with the best encoding the client accepts.
+    
+    Brotli is offered when the ``brotli`` package is installed, gzip always.
+    Streamed responses (exports) manage their own encoding and are left
+    alone.  A compressed response's ETag is made weak, so conditional
+    requests still match it whatever the encoding.
+    """
+    
+    def __init__(self, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = (['br'] if brotli else []) + ['gzip']
+    
+    def _negotiate(self) -> Optional[str]:
+        accepted = request.accept_encodings
+        best = max(self.encodings, key=lambda encoding: accepted[encoding])
+        return best if accepted[best] else None
+    
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, self.gzip_level)
+    
+    def __call__(self, response: Response) -> Response:
+        if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+                or 'Content-Encoding' in response.headers):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        encoding = self._negotiate() if len(data) >= self.min_size else None
+        if encoding is None:
+            return response
+        
+        response.set_data(self.compress(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+def create_response_compressor() -> Optional[ResponseCompressor]:
+    """Build the after_request compressor from RESPONSE_COMPRESSION and COMPRESSION_MIN_SIZE."""
+    if os.getenv('RESPONSE_COMPRESSION', 'true').lower() != 'true':
+        return None
+    return ResponseCompressor(int(os.getenv('COMPRESSION_MIN_SIZE', 1024)))
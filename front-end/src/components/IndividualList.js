@@ -5,6 +5,8 @@ import SearchBar from './SearchBar';
 import { wealthAPI } from '../services/api';
 import './IndividualList.css';
 
+const PAGE_SIZE = 50;
+
 const IndividualList = () => {
   const [individuals, setIndividuals] = useState([]);
   const [filteredIndividuals, setFilteredIndividuals] = useState([]);
@@ -13,6 +15,9 @@ const IndividualList = () => {
   const [showForm, setShowForm] = useState(false);
   const [editingIndividual, setEditingIndividual] = useState(null);
   const [searchQuery, setSearchQuery] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [total, setTotal] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     loadIndividuals();
@@ -25,9 +30,11 @@ const IndividualList = () => {
   const loadIndividuals = async () => {
     try {
       setLoading(true);
-      const response = await wealthAPI.getAllIndividuals();
+      const response = await wealthAPI.getAllIndividuals({ limit: PAGE_SIZE });
       if (response.data.success) {
         setIndividuals(response.data.individuals);
+        setNextCursor(response.data.next_cursor);
+        setTotal(response.data.total);
       }
     } catch (err) {
       setError('Failed to load individuals');
@@ -37,6 +44,23 @@ const IndividualList = () => {
     }
   };
 
+  const loadMoreIndividuals = async () => {
+    try {
+      setLoadingMore(true);
+      const response = await wealthAPI.getAllIndividuals({ limit: PAGE_SIZE, cursor: nextCursor });
+      if (response.data.success) {
+        setIndividuals(prev => [...prev, ...response.data.individuals]);
+        setNextCursor(response.data.next_cursor);
+        setTotal(response.data.total);
+      }
+    } catch (err) {
+      setError('Failed to load more individuals');
+      console.error('Error loading more individuals:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const filterIndividuals = () => {
     if (!searchQuery.trim()) {
       setFilteredIndividuals(individuals);
@@ -69,6 +93,7 @@ const IndividualList = () => {
         const response = await wealthAPI.deleteIndividual(id);
         if (response.data.success) {
           setIndividuals(prev => prev.filter(ind => ind.id !== id));
+          setTotal(prev => prev - 1);
         }
       } catch (err) {
         setError('Failed to delete individual');
@@ -88,6 +113,7 @@ const IndividualList = () => {
     } else {
       // Add new individual
       setIndividuals(prev => [...prev, savedIndividual]);
+      setTotal(prev => prev + 1);
     }
     setShowForm(false);
     setEditingIndividual(null);
@@ -134,7 +160,7 @@ const IndividualList = () => {
       />
 
       <div className="list-stats">
-        <span>Showing {filteredIndividuals.length} of {individuals.length} individuals</span>
+        <span>Showing {filteredIndividuals.length} of {total} individuals</span>
       </div>
 
       <div className="individuals-grid">
@@ -148,6 +174,18 @@ const IndividualList = () => {
         ))}
       </div>
 
+      {nextCursor && (
+        <div className="load-more">
+          <button
+            onClick={loadMoreIndividuals}
+            className="btn btn-secondary"
+            disabled={loadingMore}
+          >
+            {loadingMore ? 'Loading...' : 'Load More'}
+          </button>
+        </div>
+      )}
+
       {filteredIndividuals.length === 0 && !loading && (
         <div className="empty-state">
           <h3>No individuals found</h3>
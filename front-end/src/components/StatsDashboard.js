@@ -23,6 +23,11 @@ const StatsDashboard = () => {
 
   useEffect(() => {
     loadStats();
+    // Stats events carry only the statistics that changed
+    const source = wealthAPI.subscribeToChanges({
+      stats: (delta) => setStats((current) => current && { ...current, ...delta.wealth_statistics })
+    });
+    return () => source.close();
   }, []);
 
   const loadStats = async () => {
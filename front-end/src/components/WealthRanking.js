@@ -1,22 +1,65 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { wealthAPI } from '../services/api';
 import './WealthRanking.css';
 
+const RANKING_SIZE = 20;
+const EVENT_FIELDS = ['id', 'first_name', 'last_name', 'company', 'industry', 'state', 'wealth_tier', 'net_worth'];
+
 const WealthRanking = () => {
   const [ranking, setRanking] = useState([]);
+  const rankingRef = useRef([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [segment, setSegment] = useState('all');
+  const [segmentValue, setSegmentValue] = useState('');
+  const [industries, setIndustries] = useState([]);
 
   useEffect(() => {
-    loadRanking();
+    loadIndustries();
   }, []);
 
+  useEffect(() => {
+    loadRanking();
+    const source = wealthAPI.subscribeToChanges({ individual: applyChange });
+    return () => source.close();
+  }, [segment, segmentValue]);
+
+  const updateRanking = (next) => {
+    rankingRef.current = next;
+    setRanking(next);
+  };
+
+  const loadIndustries = async () => {
+    try {
+      const response = await wealthAPI.getStats();
+      if (response.data.success) {
+        setIndustries(Object.keys(response.data.wealth_statistics.industry_distribution || {}).sort());
+      }
+    } catch (err) {
+      console.error('Error loading industries:', err);
+    }
+  };
+
   const loadRanking = async () => {
+    if (segment !== 'all' && !segmentValue) {
+      updateRanking([]);
+      setLoading(false);
+      return;
+    }
+
     try {
       setLoading(true);
-      const response = await wealthAPI.getWealthRanking(20);
+      setError('');
+      let response;
+      if (segment === 'industry') {
+        response = await wealthAPI.getIndustryRanking(segmentValue, RANKING_SIZE);
+      } else if (segment === 'state') {
+        response = await wealthAPI.getStateRanking(segmentValue, RANKING_SIZE);
+      } else {
+        response = await wealthAPI.getWealthRanking(RANKING_SIZE);
+      }
       if (response.data.success) {
-        setRanking(response.data.ranking);
+        updateRanking(response.data.ranking);
       }
     } catch (err) {
       setError('Failed to load wealth ranking');
@@ -26,6 +69,38 @@ const WealthRanking = () => {
     }
   };
 
+  const inSegment = (change) => {
+    if (segment === 'industry') return change.industry === segmentValue;
+    if (segment === 'state') return change.state === segmentValue;
+    return segment === 'all';
+  };
+
+  // Patch the list from a change event instead of re-fetching it. Only when someone leaves a
+  // full list is it reloaded, since whoever moves up into it is not in the event.
+  const applyChange = (change) => {
+    const current = rankingRef.current;
+    const existing = current.find((item) => item.individual.id === change.id);
+    const rest = current.filter((item) => item.individual.id !== change.id);
+
+    if (change.type === 'deleted' || !inSegment(change)) {
+      if (existing) loadRanking();
+      return;
+    }
+
+    const fields = Object.fromEntries(EVENT_FIELDS.map((field) => [field, change[field]]));
+    const entry = {
+      individual: { ...(existing ? existing.individual : {}), ...fields },
+      net_worth: change.net_worth
+    };
+    const next = [...rest, entry].sort((a, b) => b.net_worth - a.net_worth);
+    const position = next.indexOf(entry);
+    if (current.length >= RANKING_SIZE && position >= RANKING_SIZE - (existing ? 1 : 0)) {
+      if (existing) loadRanking();
+      return;
+    }
+    updateRanking(next.slice(0, RANKING_SIZE));
+  };
+
   const formatCurrency = (amount) => {
     return new Intl.NumberFormat('en-US', {
       style: 'currency',
@@ -35,17 +110,39 @@ const WealthRanking = () => {
     }).format(amount);
   };
 
-  if (loading) {
-    return <div className="loading">Loading wealth ranking...</div>;
-  }
-
-  if (error) {
-    return <div className="error-message">{error}</div>;
-  }
+  const changeSegment = (event) => {
+    setSegment(event.target.value);
+    setSegmentValue('');
+  };
 
   return (
     <div className="wealth-ranking">
       <h2>Wealth Ranking</h2>
+      <div className="ranking-segment">
+        <select value={segment} onChange={changeSegment}>
+          <option value="all">All individuals</option>
+          <option value="industry">By industry</option>
+          <option value="state">By state</option>
+        </select>
+        {segment === 'industry' && (
+          <select value={segmentValue} onChange={(event) => setSegmentValue(event.target.value)}>
+            <option value="">Choose an industry</option>
+            {industries.map((industry) => (
+              <option key={industry} value={industry}>{industry}</option>
+            ))}
+          </select>
+        )}
+        {segment === 'state' && (
+          <input
+            type="text"
+            placeholder="State, e.g. CA"
+            value={segmentValue}
+            onChange={(event) => setSegmentValue(event.target.value.toUpperCase())}
+          />
+        )}
+      </div>
+      {loading && <div className="loading">Loading wealth ranking...</div>}
+      {error && <div className="error-message">{error}</div>}
       <div className="ranking-list">
         {ranking.map((item, index) => (
           <div key={item.individual.id} className="ranking-item">
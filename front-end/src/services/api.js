@@ -27,15 +27,30 @@ export const wealthAPI = {
 
   // Individual CRUD operations
   createIndividual: (data) => api.post('/individuals', data),
-  getAllIndividuals: () => api.get('/individuals'),
+  getAllIndividuals: (params = {}) => api.get('/individuals', { params }),
   getIndividual: (id) => api.get(`/individuals/${id}`),
   updateIndividual: (id, data) => api.put(`/individuals/${id}`, data),
   deleteIndividual: (id) => api.delete(`/individuals/${id}`),
 
   // Query operations
   getWealthRanking: (limit = 10) => api.get(`/individuals/ranking?limit=${limit}`),
-  getIndividualsByIndustry: (industry) => api.get(`/individuals/industry/${industry}`),
+  getIndustryRanking: (industry, limit = 10) =>
+    api.get(`/individuals/ranking/industry/${encodeURIComponent(industry)}`, { params: { limit } }),
+  getStateRanking: (state, limit = 10) =>
+    api.get(`/individuals/ranking/state/${encodeURIComponent(state)}`, { params: { limit } }),
+  getIndividualsByIndustry: (industry, params = {}) =>
+    api.get(`/individuals/industry/${encodeURIComponent(industry)}`, { params }),
   searchIndividuals: (query) => api.get(`/individuals/search?q=${encodeURIComponent(query)}`),
+
+  // Live changes over Server-Sent Events; the browser reconnects and resumes on its own.
+  // handlers maps an event name (individual, portfolio, stats) to a callback. Close the returned source when done.
+  subscribeToChanges: (handlers) => {
+    const source = new EventSource(`${API_BASE_URL}/events`);
+    Object.entries(handlers).forEach(([name, handler]) => {
+      source.addEventListener(name, (event) => handler(JSON.parse(event.data)));
+    });
+    return source;
+  },
 };
 
 export default api;
\ No newline at end of file
@@ -3,8 +3,17 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 class Portfolio:
+    """Slotted like WealthyIndividual; not modified after construction, so ``to_dict`` is cached."""
+    
+    __slots__ = (
+        'id', 'individual_id', 'assets', 'investments', 'liquid_assets', 'real_estate_value',
+        'stock_portfolio_value', 'private_equity_value', 'risk_tolerance', 'last_valuation_date',
+        'created_at', 'updated_at', '_dict'
+    )
+    
     def __init__(self, data: Dict[str, Any]):
-        self.id = data.get('id', f"port_{uuid.uuid4().hex[:8]}")
+        now = datetime.now().isoformat()
+        self.id = data['id'] if 'id' in data else f"port_{uuid.uuid4().hex[:8]}"
         self.individual_id = data['individual_id']
         self.assets = data.get('assets', [])
         self.investments = data.get('investments', [])
@@ -13,35 +22,57 @@ class Portfolio:
         self.stock_portfolio_value = float(data.get('stock_portfolio_value', 0))
         self.private_equity_value = float(data.get('private_equity_value', 0))
         self.risk_tolerance = data.get('risk_tolerance', 'Moderate')  # Conservative, Moderate, Aggressive
-        self.last_valuation_date = data.get('last_valuation_date', datetime.now().isoformat())
-        self.created_at = data.get('created_at', datetime.now().isoformat())
-        self.updated_at = datetime.now().isoformat()
+        self.last_valuation_date = data.get('last_valuation_date', now)
+        self.created_at = data.get('created_at', now)
+        self.updated_at = now
+        self._dict = None
     
     @property
     def total_value(self) -> float:
-        return (self.liquid_assets + self.real_estate_value + 
+        return (self.liquid_assets + self.real_estate_value +
                 self.stock_portfolio_value + self.private_equity_value)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'individual_id': self.individual_id,
-            'assets': self.assets,
-            'investments': self.investments,
-            'liquid_assets': self.liquid_assets,
-            'real_estate_value': self.real_estate_value,
-            'stock_portfolio_value': self.stock_portfolio_value,
-            'private_equity_value': self.private_equity_value,
-            'total_value': self.total_value,
-            'risk_tolerance': self.risk_tolerance,
-            'last_valuation_date': self.last_valuation_date,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+        if self._dict is None:
+            self._dict = {
+                'id': self.id,
+                'individual_id': self.individual_id,
+                'assets': self.assets,
+                'investments': self.investments,
+                'liquid_assets': self.liquid_assets,
+                'real_estate_value': self.real_estate_value,
+                'stock_portfolio_value': self.stock_portfolio_value,
+                'private_equity_value': self.private_equity_value,
+                'total_value': self.total_value,
+                'risk_tolerance': self.risk_tolerance,
+                'last_valuation_date': self.last_valuation_date,
+                'created_at': self.created_at,
+                'updated_at': self.updated_at
+            }
+        return dict(self._dict)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Portfolio':
-        return cls(data)
+        """Load a stored record without re-validating it, keeping its timestamps."""
+        portfolio = cls.__new__(cls)
+        try:
+            portfolio.id = data['id']
+            portfolio.individual_id = data['individual_id']
+            portfolio.assets = data['assets']
+            portfolio.investments = data['investments']
+            portfolio.liquid_assets = data['liquid_assets']
+            portfolio.real_estate_value = data['real_estate_value']
+            portfolio.stock_portfolio_value = data['stock_portfolio_value']
+            portfolio.private_equity_value = data['private_equity_value']
+            portfolio.risk_tolerance = data['risk_tolerance']
+            portfolio.last_valuation_date = data['last_valuation_date']
+            portfolio.created_at = data['created_at']
+            portfolio.updated_at = data['updated_at']
+        except KeyError:
+            portfolio = cls(data)
+            portfolio.updated_at = data.get('updated_at', portfolio.updated_at)
+        portfolio._dict = None
+        return portfolio
     
     def __str__(self):
-        return f"Portfolio {self.id} - Total Value: ${self.total_value:,.2f}"
\ No newline at end of file
+        return f"Portfolio {self.id} - Total Value: ${self.total_value:,.2f}"
@@ -1,10 +1,26 @@
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 class WealthyIndividual:
+    """A donor record.
+    
+    Slotted to keep the many instances held by list pages and the local cache
+    small.  Instances are not modified after construction (updates build a new
+    one), so ``to_dict`` can cache its result.
+    """
+    
+    __slots__ = (
+        'id', 'first_name', 'last_name', 'company', 'title', 'net_worth', 'industry',
+        'source_of_wealth', 'email', 'phone', 'city', 'state', 'wealth_tier',
+        'last_contact_date', 'created_at', 'updated_at', '_dict'
+    )
+    # Public fields, in to_dict order
+    FIELDS = __slots__[:-1]
+    
     def __init__(self, data: Dict[str, Any]):
-        self.id = data.get('id', f"ind_{uuid.uuid4().hex[:8]}")
+        now = datetime.now().isoformat()
+        self.id = data['id'] if 'id' in data else f"ind_{uuid.uuid4().hex[:8]}"
         self.first_name = data['first_name']
         self.last_name = data['last_name']
         self.company = data['company']
@@ -16,10 +32,11 @@ class WealthyIndividual:
         self.phone = data.get('phone', '')
         self.city = data.get('city', '')
         self.state = data.get('state', '')
-        self.wealth_tier = data.get('wealth_tier', self._calculate_wealth_tier())
-        self.last_contact_date = data.get('last_contact_date', datetime.now().isoformat())
-        self.created_at = data.get('created_at', datetime.now().isoformat())
-        self.updated_at = datetime.now().isoformat()
+        self.wealth_tier = data['wealth_tier'] if 'wealth_tier' in data else self._calculate_wealth_tier()
+        self.last_contact_date = data.get('last_contact_date', now)
+        self.created_at = data.get('created_at', now)
+        self.updated_at = now
+        self._dict = None
     
     def _calculate_wealth_tier(self) -> str:
         if self.net_worth >= 1_000_000_000:
@@ -29,29 +46,62 @@ class WealthyIndividual:
         else:
             return "Affluent"
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'company': self.company,
-            'title': self.title,
-            'net_worth': self.net_worth,
-            'industry': self.industry,
-            'source_of_wealth': self.source_of_wealth,
-            'email': self.email,
-            'phone': self.phone,
-            'city': self.city,
-            'state': self.state,
-            'wealth_tier': self.wealth_tier,
-            'last_contact_date': self.last_contact_date,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        if fields is not None:
+            # Sparse fieldset: read just those attributes, without building the full dict
+            return {field: getattr(self, field) for field in fields}
+        if self._dict is None:
+            self._dict = {
+                'id': self.id,
+                'first_name': self.first_name,
+                'last_name': self.last_name,
+                'company': self.company,
+                'title': self.title,
+                'net_worth': self.net_worth,
+                'industry': self.industry,
+                'source_of_wealth': self.source_of_wealth,
+                'email': self.email,
+                'phone': self.phone,
+                'city': self.city,
+                'state': self.state,
+                'wealth_tier': self.wealth_tier,
+                'last_contact_date': self.last_contact_date,
+                'created_at': self.created_at,
+                'updated_at': self.updated_at
+            }
+        # Callers get their own copy so the cached dict cannot be changed under us
+        return dict(self._dict)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WealthyIndividual':
-        return cls(data)
+        """Load a stored record without re-validating it, keeping its timestamps.
+        
+        Records missing a field (written by older versions) go through the
+        validating constructor instead.
+        """
+        individual = cls.__new__(cls)
+        try:
+            individual.id = data['id']
+            individual.first_name = data['first_name']
+            individual.last_name = data['last_name']
+            individual.company = data['company']
+            individual.title = data['title']
+            individual.net_worth = data['net_worth']
+            individual.industry = data['industry']
+            individual.source_of_wealth = data['source_of_wealth']
+            individual.email = data['email']
+            individual.phone = data['phone']
+            individual.city = data['city']
+            individual.state = data['state']
+            individual.wealth_tier = data['wealth_tier']
+            individual.last_contact_date = data['last_contact_date']
+            individual.created_at = data['created_at']
+            individual.updated_at = data['updated_at']
+        except KeyError:
+            individual = cls(data)
+            individual.updated_at = data.get('updated_at', individual.updated_at)
+        individual._dict = None
+        return individual
     
     def __str__(self):
-        return f"{self.first_name} {self.last_name} ({self.company}) - ${self.net_worth:,.2f}"
\ No newline at end of file
+        return f"{self.first_name} {self.last_name} ({self.company}) - ${self.net_worth:,.2f}"
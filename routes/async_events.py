@@ -0,0 +1,7 @@
+from starlette.routing import Route
+from controllers.async_event_controller import async_event_controller
+
+event_routes = [
+    # Live change events (Server-Sent Events)
+    Route('/events', async_event_controller.stream_events, methods=['GET'])
+]
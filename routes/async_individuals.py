@@ -0,0 +1,25 @@
+from starlette.routing import Route
+from controllers.async_individual_controller import async_individual_controller
+
+# Static paths come before /individuals/{individual_id}: Starlette matches in order
+individual_routes = [
+    # Query routes
+    Route('/individuals/ranking', async_individual_controller.get_wealth_ranking, methods=['GET']),
+    Route('/individuals/ranking/industry/{industry}', async_individual_controller.get_industry_ranking, methods=['GET']),
+    Route('/individuals/ranking/state/{state}', async_individual_controller.get_state_ranking, methods=['GET']),
+    Route('/individuals/net-worth', async_individual_controller.get_individuals_by_net_worth, methods=['GET']),
+    Route('/individuals/net-worth/count', async_individual_controller.count_by_net_worth, methods=['GET']),
+    Route('/individuals/net-worth/histogram', async_individual_controller.get_wealth_histogram, methods=['GET']),
+    Route('/individuals/movers', async_individual_controller.get_movers, methods=['GET']),
+    Route('/individuals/industry/{industry}', async_individual_controller.get_individuals_by_industry, methods=['GET']),
+    Route('/individuals/search', async_individual_controller.search_individuals, methods=['GET']),
+    
+    # CRUD routes
+    Route('/individuals', async_individual_controller.create_individual, methods=['POST']),
+    Route('/individuals', async_individual_controller.get_all_individuals, methods=['GET']),
+    Route('/individuals/{individual_id}', async_individual_controller.get_individual, methods=['GET']),
+    Route('/individuals/{individual_id}/rank', async_individual_controller.get_wealth_rank, methods=['GET']),
+    Route('/individuals/{individual_id}/history', async_individual_controller.get_net_worth_history, methods=['GET']),
+    Route('/individuals/{individual_id}', async_individual_controller.update_individual, methods=['PUT']),
+    Route('/individuals/{individual_id}', async_individual_controller.delete_individual, methods=['DELETE'])
+]
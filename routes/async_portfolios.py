@@ -0,0 +1,7 @@
+from starlette.routing import Route
+from controllers.async_portfolio_controller import async_portfolio_controller
+
+portfolio_routes = [
+    # Analytics routes
+    Route('/portfolios/analytics', async_portfolio_controller.get_analytics, methods=['GET'])
+]
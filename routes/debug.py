@@ -0,0 +1,12 @@
+from flask import Blueprint
+from controllers.debug_controller import debug_controller
+
+debug_bp = Blueprint('debug', __name__)
+
+# Every debug route needs X-Profile-Token
+debug_bp.before_request(debug_controller.require_token)
+
+# Profiling routes
+debug_bp.route('/debug/profiles', methods=['GET'])(debug_controller.list_profiles)
+debug_bp.route('/debug/profiles/<profile_id>', methods=['GET'])(debug_controller.get_profile)
+debug_bp.route('/debug/slow-operations', methods=['GET'])(debug_controller.get_slow_operations)
\ No newline at end of file
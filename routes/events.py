@@ -0,0 +1,7 @@
+from flask import Blueprint
+from controllers.event_controller import event_controller
+
+events_bp = Blueprint('events', __name__)
+
+# Live change events (Server-Sent Events)
+events_bp.route('/events', methods=['GET'])(event_controller.stream_events)
\ No newline at end of file
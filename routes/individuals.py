@@ -5,6 +5,7 @@ individuals_bp = Blueprint('individuals', __name__)
 
 # CRUD routes
 individuals_bp.route('/individuals', methods=['POST'])(individual_controller.create_individual)
+individuals_bp.route('/individuals/bulk', methods=['POST'])(individual_controller.bulk_create_individuals)
 individuals_bp.route('/individuals', methods=['GET'])(individual_controller.get_all_individuals)
 individuals_bp.route('/individuals/<string:individual_id>', methods=['GET'])(individual_controller.get_individual)
 individuals_bp.route('/individuals/<string:individual_id>', methods=['PUT'])(individual_controller.update_individual)
@@ -12,5 +13,14 @@ individuals_bp.route('/individuals/<string:individual_id>', methods=['DELETE'])(
 
 # Query routes
 individuals_bp.route('/individuals/ranking', methods=['GET'])(individual_controller.get_wealth_ranking)
+individuals_bp.route('/individuals/ranking/industry/<string:industry>', methods=['GET'])(individual_controller.get_industry_ranking)
+individuals_bp.route('/individuals/ranking/state/<string:state>', methods=['GET'])(individual_controller.get_state_ranking)
+individuals_bp.route('/individuals/net-worth', methods=['GET'])(individual_controller.get_individuals_by_net_worth)
+individuals_bp.route('/individuals/net-worth/count', methods=['GET'])(individual_controller.count_by_net_worth)
+individuals_bp.route('/individuals/net-worth/histogram', methods=['GET'])(individual_controller.get_wealth_histogram)
+individuals_bp.route('/individuals/<string:individual_id>/rank', methods=['GET'])(individual_controller.get_wealth_rank)
+individuals_bp.route('/individuals/<string:individual_id>/history', methods=['GET'])(individual_controller.get_net_worth_history)
+individuals_bp.route('/individuals/movers', methods=['GET'])(individual_controller.get_movers)
 individuals_bp.route('/individuals/industry/<string:industry>', methods=['GET'])(individual_controller.get_individuals_by_industry)
-individuals_bp.route('/individuals/search', methods=['GET'])(individual_controller.search_individuals)
\ No newline at end of file
+individuals_bp.route('/individuals/search', methods=['GET'])(individual_controller.search_individuals)
+individuals_bp.route('/individuals/export', methods=['GET'])(individual_controller.export_individuals)
\ No newline at end of file
@@ -0,0 +1,7 @@
+from flask import Blueprint
+from controllers.portfolio_controller import portfolio_controller
+
+portfolios_bp = Blueprint('portfolios', __name__)
+
+# Analytics routes
+portfolios_bp.route('/portfolios/analytics', methods=['GET'])(portfolio_controller.get_analytics)
\ No newline at end of file
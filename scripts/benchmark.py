@@ -0,0 +1,290 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+SEARCH_QUERIES = ['chen', 'tech', 'capital', 'ro', 'holdings', 'finance', 'sterling', 'pa']
+
+def start_redis_server(port: int) -> subprocess.Popen:
+    """Start a throwaway, non-persistent redis-server and wait until it answers PING."""
+    if not shutil.which('redis-server'):
+        raise SystemExit("redis-server not found on PATH (use --no-server to benchmark an existing Redis)")
+    
+    workdir = tempfile.mkdtemp(prefix='wealth-bench-')
+    process = subprocess.Popen(
+        ['redis-server', '--port', str(port), '--save', '', '--appendonly', 'no', '--dir', workdir],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('localhost', port), timeout=0.2) as connection:
+                connection.sendall(b'PING\r\n')
+                if connection.recv(16).startswith(b'+PONG'):
+                    return process
+        except OSError:
+            time.sleep(0.05)
+    
+    process.kill()
+    raise SystemExit(f"redis-server did not start on port {port}")
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+def summarize(latencies_ns: list) -> dict:
+    """ops/sec and latency percentiles (milliseconds) for one benchmark."""
+    ordered = sorted(latencies_ns)
+    total_s = sum(ordered) / 1e9
+    
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] / 1e6
+    
+    return {
+        'iterations': len(ordered),
+        'ops_per_sec': len(ordered) / total_s if total_s else 0.0,
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99)
+    }
+
+def measure(operation, iterations: int, warmup: int = 5) -> dict:
+    for _ in range(min(warmup, iterations)):
+        operation()
+    
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        operation()
+        latencies.append(time.perf_counter_ns() - started)
+    return summarize(latencies)
+
+def run_size(size: int, iterations: int, workers: int, rng: random.Random) -> dict:
+    """Seed ``size`` records into an empty database and time every service method and route."""
+    from app import create_app
+    from scripts.seed_data import generate_individual, seed_synthetic
+    from services.redis_service import redis_service
+    from services.wealth_service import wealth_service
+    
+    redis_service.flushdb()
+    seed_synthetic(size, workers=workers, seed=size)
+    
+    sample_ids = [
+        member for batch in redis_service.sscan_batches(wealth_service.individuals_set_key, 1000)
+        for member in batch
+    ][:10_000]
+    client = create_app().test_client()
+    
+    def create():
+        row = generate_individual(rng)
+        del row['id']
+        wealth_service.create_individual(row)
+    
+    def check(response):
+        if response.status_code >= 400:
+            raise RuntimeError(f"{response.request.path} returned {response.status_code}")
+    
+    sample_keys = [f"{wealth_service.individual_prefix}{individual_id}" for individual_id in sample_ids]
+    ranking_call = wealth_service.leaderboard_call(10)
+    
+    def pipelined_gets():
+        pipe = redis_service.pipeline()
+        for key in rng.sample(sample_keys, min(50, len(sample_keys))):
+            pipe.get(key)
+        pipe.execute()
+    
+    # Mutating benchmarks run last so every read is timed against the seeded dataset size
+    benchmarks = {
+        'redis.get': lambda: redis_service.get(rng.choice(sample_keys)),
+        'redis.mget': lambda: redis_service.mget(rng.sample(sample_keys, min(50, len(sample_keys)))),
+        'redis.pipeline': pipelined_gets,
+        'redis.evalsha': lambda: redis_service.evalsha('ranked_records', *ranking_call, raw=True),
+        'redis.scan_batch': lambda: next(redis_service.scan_batches(f"{wealth_service.individual_prefix}*"), None),
+        'service.get_individual': lambda: wealth_service.get_individual(rng.choice(sample_ids)),
+        'service.list_individuals': lambda: wealth_service.list_individuals(limit=50),
+        'service.get_wealth_ranking': lambda: wealth_service.get_wealth_ranking(10),
+        'service.search_individuals': lambda: wealth_service.search_individuals(rng.choice(SEARCH_QUERIES)),
+        'service.get_wealth_statistics': wealth_service.get_wealth_statistics,
+        'route.get_individual': lambda: check(client.get(f"/individuals/{rng.choice(sample_ids)}")),
+        'route.list_individuals': lambda: check(client.get('/individuals?limit=50')),
+        'route.ranking': lambda: check(client.get('/individuals/ranking?limit=10')),
+        'route.search': lambda: check(client.get(f"/individuals/search?q={rng.choice(SEARCH_QUERIES)}")),
+        'route.stats': lambda: check(client.get('/stats')),
+        'service.create_individual': create
+    }
+    
+    results = {}
+    for name, operation in benchmarks.items():
+        results[name] = measure(operation, iterations)
+        print(f"  {name:32} {results[name]['ops_per_sec']:>10,.0f} ops/s  "
+              f"p50 {results[name]['p50_ms']:7.3f} ms  p95 {results[name]['p95_ms']:7.3f} ms  "
+              f"p99 {results[name]['p99_ms']:7.3f} ms")
+    return results
+
+def model_footprint(count: int = 100_000) -> dict:
+    """Traced memory of ``count`` models loaded with from_dict, and per-object load/construct cost."""
+    from models.portfolio import Portfolio
+    from models.wealthy_individual import WealthyIndividual
+    from scripts.seed_data import generate_individual, generate_portfolio
+    
+    rng = random.Random(0)
+    row = generate_individual(rng)
+    rows = {
+        'individual': (WealthyIndividual, WealthyIndividual(row).to_dict()),
+        'portfolio': (Portfolio, Portfolio(generate_portfolio(rng, row)).to_dict())
+    }
+    
+    results = {}
+    for name, (model, stored) in rows.items():
+        records = [dict(stored, id=f"{stored['id']}_{i}") for i in range(count)]
+        tracemalloc.start()
+        loaded = [model.from_dict(record) for record in records]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            'bytes_per_100k': memory * 100_000 // count,
+            'from_dict': measure(lambda: model.from_dict(stored), 10_000),
+            'construct': measure(lambda: model(stored), 10_000),
+            'to_dict': measure(loaded[0].to_dict, 10_000)
+        }
+        print(f"  {name:32} {memory * 100_000 / count / 1e6:7.1f} MB per 100k  "
+              f"from_dict p50 {results[name]['from_dict']['p50_ms'] * 1000:6.2f} us  "
+              f"construct p50 {results[name]['construct']['p50_ms'] * 1000:6.2f} us")
+    return results
+
+def response_encoding(count: int = 10_000) -> dict:
+    """Payload size and encode time of a ``count``-row /individuals body per JSON provider and projection."""
+    from flask import Flask
+    from controllers.responses import JSON_PROVIDERS, ResponseCompressor, brotli
+    from models.wealthy_individual import WealthyIndividual
+    from scripts.seed_data import generate_individual
+    
+    rng = random.Random(0)
+    individuals = [WealthyIndividual(generate_individual(rng)) for _ in range(count)]
+    projections = {'all_fields': None, 'ranking_fields': ['id', 'first_name', 'last_name', 'company', 'net_worth']}
+    compressor = ResponseCompressor()
+    
+    results = {}
+    for provider_name, provider_class in JSON_PROVIDERS.items():
+        try:
+            provider = provider_class(Flask(__name__))
+        except ImportError:
+            continue
+        for projection, fields in projections.items():
+            def encode():
+                return provider.dumps({
+                    'success': True,
+                    'individuals': [ind.to_dict(fields) for ind in individuals],
+                    'count': count
+                })
+            
+            body = encode().encode('utf-8')
+            result = {
+                'bytes': len(body),
+                'encode': measure(encode, 20, warmup=2),
+                'gzip_bytes': len(compressor.compress(body, 'gzip')),
+                'gzip': measure(lambda: compressor.compress(body, 'gzip'), 20, warmup=2)
+            }
+            if brotli:
+                result['br_bytes'] = len(compressor.compress(body, 'br'))
+                result['br'] = measure(lambda: compressor.compress(body, 'br'), 20, warmup=2)
+            results[f"{provider_name}.{projection}"] = result
+            print(f"  {provider_name + ' ' + projection:32} {result['bytes'] / 1e6:6.2f} MB  "
+                  f"encode p50 {result['encode']['p50_ms']:7.2f} ms  "
+                  f"gzip {result['gzip_bytes'] / 1e6:5.2f} MB in {result['gzip']['p50_ms']:6.2f} ms")
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Benchmarks whose throughput dropped by more than ``threshold`` against the baseline run."""
+    regressions = []
+    for size, benchmarks in results['results'].items():
+        for name, current in benchmarks.items():
+            previous = baseline.get('results', {}).get(size, {}).get(name)
+            if not previous or not previous['ops_per_sec']:
+                continue
+            change = current['ops_per_sec'] / previous['ops_per_sec'] - 1
+            if change < -threshold:
+                regressions.append(f"{size} {name}: {previous['ops_per_sec']:,.0f} -> "
+                                   f"{current['ops_per_sec']:,.0f} ops/s ({change:+.1%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark WealthService, RedisService and the Flask routes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='dataset sizes to seed')
+    parser.add_argument('--iterations', type=int, default=200, help='timed calls per benchmark')
+    parser.add_argument('--workers', type=int, default=4, help='seeding worker processes')
+    parser.add_argument('--output', default='bench_results.json', help='where to write the JSON results')
+    parser.add_argument('--baseline', help='previous results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='fail when ops/sec drops by more than this fraction of the baseline')
+    parser.add_argument('--no-server', action='store_true',
+                        help='use the Redis from REDIS_HOST/REDIS_PORT instead of starting one (it will be flushed)')
+    args = parser.parse_args()
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    
+    server = None
+    if not args.no_server:
+        port = free_port()
+        server = start_redis_server(port)
+        os.environ.update({'REDIS_HOST': 'localhost', 'REDIS_PORT': str(port), 'REDIS_DB': '0'})
+        os.environ.pop('REDIS_PASSWORD', None)
+    
+    # Quiet the per-request INFO logging so it does not dominate the timings
+    logging.disable(logging.INFO)
+    
+    try:
+        rng = random.Random(42)
+        results = {
+            'meta': {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'iterations': args.iterations
+            },
+            'results': {}
+        }
+        print("Model footprint")
+        results['models'] = model_footprint()
+        print("Response encoding (10,000 rows)")
+        results['responses'] = response_encoding()
+        for size in args.sizes:
+            print(f"Dataset size {size:,}")
+            results['results'][str(size)] = run_size(size, args.iterations, args.workers, rng)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+    print(f"Results written to {args.output}")
+    
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions against baseline")
+
+if __name__ == '__main__':
+    main()
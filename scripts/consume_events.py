@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+import socket
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.change_feed import change_feed
+
+def consume(group: str, consumer: str, from_start: bool = False, count: int = 100, block_ms: int = 5000,
+            claim_idle_ms: int = 60000, limit: int = 0) -> int:
+    """Print change feed events as a member of a consumer group, acknowledging each batch once printed.
+    
+    Events this consumer read but never acknowledged (it crashed) are
+    replayed first, then events idle for ``claim_idle_ms`` at other consumers
+    are taken over, then new events are read until ``limit`` (0: forever).
+    """
+    if change_feed.ensure_group(group, '0' if from_start else '$'):
+        print(f"Created consumer group {group}")
+    
+    handled = 0
+    pending = True
+    while not limit or handled < limit:
+        events = change_feed.read_group(group, consumer, count, pending=True) if pending else []
+        if not events:
+            pending = False
+            events = change_feed.claim_stale(group, consumer, claim_idle_ms, count)
+        if not events:
+            events = change_feed.read_group(group, consumer, count, block_ms)
+        for entry_id, event in events:
+            print(f"{entry_id} {json.dumps(event)}")
+        change_feed.ack(group, *[entry_id for entry_id, _ in events])
+        handled += len(events)
+    return handled
+
+def main():
+    parser = argparse.ArgumentParser(description='Follow the change feed as a consumer group member')
+    parser.add_argument('--group', default='console', help='consumer group (its offset is kept in Redis)')
+    parser.add_argument('--consumer', default=f"{socket.gethostname()}-{os.getpid()}",
+                        help='consumer name; reuse it to replay what it read but never acknowledged')
+    parser.add_argument('--from-start', action='store_true',
+                        help='start a new group at the oldest retained event instead of new ones')
+    parser.add_argument('--count', type=int, default=100, help='events per read')
+    parser.add_argument('--limit', type=int, default=0, help='stop after this many events (0 follows forever)')
+    args = parser.parse_args()
+    
+    try:
+        consume(args.group, args.consumer, args.from_start, args.count, limit=args.limit)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
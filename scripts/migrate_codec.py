@@ -0,0 +1,122 @@
+import argparse
+import json
+import logging
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import Counter
+from services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+def is_legacy_member(member: str) -> bool:
+    """Members written before raw storage are JSON-encoded strings."""
+    return member[:1] == '"'
+
+def migrate_values(keys: list, stats: Counter, dry_run: bool) -> None:
+    """Re-encode stored values with the configured codec; refs documents only get raw members."""
+    raw_values = redis_service.execute_raw('MGET', *keys)
+    calls = []
+    for key, raw in zip(keys, raw_values):
+        if raw is None:
+            continue
+        try:
+            if key.endswith(':refs'):
+                refs = json.loads(raw)
+                zsets = refs.get('zsets', [])
+                if not any(len(entry) > 2 and is_legacy_member(entry[2]) for entry in zsets):
+                    continue
+                refs['zsets'] = [entry[:2] + [redis_service.decode_member(member) for member in entry[2:]] for entry in zsets]
+                rewritten = json.dumps(refs)
+            else:
+                if redis_service.codec.is_current(raw):
+                    continue
+                rewritten = redis_service.encode_value(redis_service.decode_value(raw))
+        except ValueError as e:
+            logger.warning(f"Skipping {key}: not a codec payload ({e})")
+            stats['skipped'] += 1
+            continue
+        calls.append(([key], [raw, rewritten]))
+    
+    if calls and not dry_run:
+        replaced = redis_service.evalsha_many('replace_value', calls)
+        stats['values'] += sum(replaced)
+        stats['changed_during_migration'] += len(replaced) - sum(replaced)
+    elif calls:
+        stats['values'] += len(calls)
+
+def migrate_members(key: str, key_type: str, stats: Counter, dry_run: bool) -> None:
+    """Rewrite JSON-encoded set/sorted-set members as raw strings.
+    
+    Reads through the raw client: RedisService's scan helpers would already
+    decode the legacy members this looks for.
+    """
+    client = redis_service.client
+    if key_type == 'set':
+        members = client.sscan_iter(key, count=redis_service.batch_size)
+    else:
+        members = (member for member, _ in client.zscan_iter(key, count=redis_service.batch_size))
+    
+    pairs = []
+    for member in members:
+        if is_legacy_member(member):
+            pairs.extend([member, redis_service.decode_member(member)])
+    
+    for start in range(0, len(pairs), redis_service.batch_size * 2):
+        chunk = pairs[start:start + redis_service.batch_size * 2]
+        if dry_run:
+            stats['members'] += len(chunk) // 2
+        else:
+            stats['members'] += redis_service.evalsha('rename_members', [key], [key_type, *chunk])
+
+def migrate(batch_size: int, dry_run: bool = False) -> Counter:
+    """Walk the keyspace with SCAN and bring every key to the current storage format"""
+    stats = Counter()
+    keys = []
+    
+    def flush():
+        pipe = redis_service.pipeline()
+        for key in keys:
+            pipe.type(key)
+        string_keys = []
+        for key, key_type in zip(keys, pipe.execute()):
+            stats['scanned'] += 1
+            if key_type == 'string':
+                string_keys.append(key)
+            elif key_type in ('set', 'zset'):
+                migrate_members(key, key_type, stats, dry_run)
+        if string_keys:
+            migrate_values(string_keys, stats, dry_run)
+        keys.clear()
+    
+    for batch in redis_service.scan_batches(count=batch_size):
+        keys.extend(batch)
+        if len(keys) >= batch_size:
+            flush()
+    if keys:
+        flush()
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rewrite stored values with the REDIS_CODEC format and index members as raw strings'
+    )
+    parser.add_argument('--batch-size', type=int, default=redis_service.batch_size, help='keys per SCAN batch')
+    parser.add_argument('--dry-run', action='store_true', help='count what would change without writing')
+    args = parser.parse_args()
+    
+    print(f"Migrating to codec '{redis_service.codec.name}'{' (dry run)' if args.dry_run else ''}...")
+    stats = migrate(args.batch_size, args.dry_run)
+    
+    print("Migration completed!")
+    print(f"Keys scanned: {stats['scanned']}")
+    print(f"Values rewritten: {stats['values']}")
+    print(f"Members rewritten: {stats['members']}")
+    if stats['changed_during_migration']:
+        print(f"Values changed by concurrent writes (left as written): {stats['changed_during_migration']}")
+    if stats['skipped']:
+        print(f"Values skipped: {stats['skipped']}")
+
+if __name__ == '__main__':
+    main()
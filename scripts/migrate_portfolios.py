@@ -0,0 +1,15 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.wealth_service import wealth_service
+
+def migrate():
+    """Move portfolios from the per-individual copies to single records behind the portfolio index"""
+    
+    print("Migrating portfolios...")
+    count = wealth_service.migrate_portfolios()
+    print(f"Migrated {count} portfolios")
+
+if __name__ == '__main__':
+    migrate()
\ No newline at end of file
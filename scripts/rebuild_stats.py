@@ -0,0 +1,19 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.wealth_service import wealth_service
+
+def rebuild_stats():
+    """Recompute the /stats aggregate counters from the stored individuals"""
+    
+    print("Rebuilding wealth statistics...")
+    stats = wealth_service.rebuild_statistics()
+    
+    print("Rebuild completed!")
+    print(f"Total individuals: {stats.get('total_individuals', 0)}")
+    print(f"Total wealth: ${stats.get('total_wealth', 0):,.2f}")
+    print(f"Average wealth: ${stats.get('average_wealth', 0):,.2f}")
+
+if __name__ == '__main__':
+    rebuild_stats()
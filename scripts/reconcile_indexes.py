@@ -0,0 +1,277 @@
+import argparse
+import fnmatch
+import json
+import logging
+import multiprocessing
+import re
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import Counter
+from models.wealthy_individual import WealthyIndividual
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+# Expected index contents are built under this prefix, compared against the
+# live keys, and (with --repair) RENAMEd over the keys that differ.
+SHADOW_PREFIX = "reconcile:shadow:"
+
+# Records are partitioned by the last character of their ID (generated IDs
+# end in a hex digit); the final partition catches any other ID.
+PARTITIONS = list('0123456789abcdef') + [None]
+
+def shadow_key(key: str) -> str:
+    return f"{SHADOW_PREFIX}{key}"
+
+def partition_pattern(partition) -> str:
+    prefix = wealth_service.individual_prefix
+    return f"{prefix}*{partition}" if partition else f"{prefix}*[^0-9a-f]"
+
+def run_tasks(function, tasks: list, workers: int):
+    """Yield each task's result as it completes, from a process pool unless ``workers`` is 1."""
+    if workers > 1 and len(tasks) > 1:
+        # Spawned workers import the services afresh and open their own Redis connections
+        with multiprocessing.get_context('spawn').Pool(min(workers, len(tasks))) as pool:
+            yield from pool.imap_unordered(function, tasks)
+    else:
+        yield from map(function, tasks)
+
+def build_partition(args) -> tuple:
+    """Stream one partition's records and write the index entries they imply to shadow keys.
+    
+    Returns the partition, its counts, the expected aggregate counters and
+    the index keys written.  With ``repair`` stale refs documents are
+    rewritten too.
+    """
+    partition, batch_size, repair = args
+    prefix = wealth_service.individual_prefix
+    stats = Counter()
+    counters = Counter()
+    index_keys = set()
+    started = time.perf_counter()
+    
+    for batch in redis_service.scan_batches(partition_pattern(partition), batch_size, key_type='string'):
+        # Skip the :refs keys and legacy :portfolio copies that share the prefix
+        record_keys = [key for key in batch if ':' not in key[len(prefix):]]
+        if not record_keys:
+            continue
+        values = redis_service.execute_raw('MGET', *record_keys, *[f"{key}:refs" for key in record_keys])
+        pipe = redis_service.pipeline()
+        
+        for key, raw, stored_refs in zip(record_keys, values, values[len(record_keys):]):
+            if raw is None:
+                continue
+            try:
+                individual = WealthyIndividual.from_dict(redis_service.decode_value(raw))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable record {key}: {e}")
+                stats['unreadable'] += 1
+                continue
+            
+            refs = wealth_service.index_refs(individual)
+            if stored_refs is None or json.loads(stored_refs) != refs:
+                stats['stale_refs'] += 1
+                if repair:
+                    pipe.set(f"{key}:refs", json.dumps(refs))
+            
+            member = redis_service.encode_member(individual.id)
+            for index_key in refs['sets']:
+                pipe.sadd(shadow_key(index_key), member)
+                index_keys.add(index_key)
+            for entry in refs['zsets']:
+                pipe.zadd(shadow_key(entry[0]), {entry[2] if len(entry) > 2 else member: entry[1]})
+                index_keys.add(entry[0])
+            for hash_key, field, amount in refs['counters']:
+                counters[(hash_key, field)] += float(amount)
+            stats['records'] += 1
+        
+        pipe.execute()
+    
+    return partition, stats, counters, index_keys, time.perf_counter() - started
+
+def compare_keys(args) -> tuple:
+    """Diff each index key against its shadow; returns the number compared and the differing keys."""
+    index_keys, batch_size, sample_size = args
+    client = redis_service.client
+    differences = []
+    
+    for key in index_keys:
+        shadow = shadow_key(key)
+        key_type = client.type(key)
+        if key_type == 'none':
+            key_type = client.type(shadow)
+        
+        if key_type == 'zset':
+            actual = dict(client.zscan_iter(key, count=batch_size))
+            expected = dict(client.zscan_iter(shadow, count=batch_size))
+            mismatched = [member for member in actual.keys() & expected.keys() if actual[member] != expected[member]]
+        elif key_type == 'set':
+            actual = set(client.sscan_iter(key, count=batch_size))
+            expected = set(client.sscan_iter(shadow, count=batch_size))
+            mismatched = []
+        else:
+            continue
+        
+        missing = expected.keys() - actual.keys() if key_type == 'zset' else expected - actual
+        extra = actual.keys() - expected.keys() if key_type == 'zset' else actual - expected
+        if missing or extra or mismatched:
+            differences.append({
+                'key': key,
+                'type': key_type,
+                'missing': len(missing),
+                'extra': len(extra),
+                'mismatched': len(mismatched),
+                'sample': sorted(missing)[:sample_size] + sorted(extra)[:sample_size] + sorted(mismatched)[:sample_size],
+                'rebuildable': bool(expected)
+            })
+    
+    return len(index_keys), differences
+
+def live_index_keys(batch_size: int) -> set:
+    """Every existing key matching an index pattern, found with one SCAN pass."""
+    matcher = re.compile('|'.join(fnmatch.translate(pattern) for pattern in wealth_service.index_key_patterns()))
+    return {
+        key
+        for batch in redis_service.scan_batches(count=batch_size)
+        for key in batch
+        if matcher.match(key)
+    }
+
+def compare_counters(expected: Counter) -> list:
+    """Differences between the aggregate hashes and the counters implied by the records."""
+    differences = []
+    for hash_key in {hash_key for hash_key, _ in expected} | {wealth_service.stats_key}:
+        actual = {field: float(value) for field, value in redis_service.client.hgetall(hash_key).items()}
+        wanted = {field: amount for (key, field), amount in expected.items() if key == hash_key and amount}
+        for field in actual.keys() | wanted.keys():
+            if abs(actual.get(field, 0) - wanted.get(field, 0)) > 1e-6 * max(1, abs(wanted.get(field, 0))):
+                differences.append((hash_key, field, actual.get(field), wanted.get(field)))
+    return differences
+
+def repair(differences: list, counter_differences: list, expected_counters: Counter) -> int:
+    """Swap every differing index for its rebuilt shadow with RENAME, one transaction per batch.
+    
+    Indexes with no expected entries are removed.  Writes that landed after
+    their key's shadow was built are lost, so run this while writes are
+    paused (or re-run the report afterwards).
+    """
+    repaired = 0
+    for start in range(0, len(differences), redis_service.batch_size):
+        batch = differences[start:start + redis_service.batch_size]
+        pipe = redis_service.pipeline(transaction=True)
+        for difference in batch:
+            if difference['rebuildable']:
+                pipe.rename(shadow_key(difference['key']), difference['key'])
+            else:
+                pipe.unlink(difference['key'])
+            repaired += 1
+        pipe.execute()
+        # Invalidate HTTP validators of the rebuilt indexes
+        wealth_service.touch_generations(*[difference['key'] for difference in batch])
+    
+    for hash_key in sorted({hash_key for hash_key, *_ in counter_differences}):
+        mapping = {field: repr(amount) for (key, field), amount in expected_counters.items() if key == hash_key and amount}
+        pipe = redis_service.pipeline(transaction=True)
+        if mapping:
+            pipe.hset(shadow_key(hash_key), mapping=mapping)
+            pipe.rename(shadow_key(hash_key), hash_key)
+        else:
+            pipe.unlink(hash_key)
+        pipe.execute()
+        wealth_service.touch_generations(hash_key)
+        repaired += 1
+    
+    # Cached filter intersections may have been computed from the broken indexes
+    redis_service.delete_matching(f"{wealth_service.filter_cache_key}:*")
+    return repaired
+
+def reconcile(workers: int, batch_size: int, fix: bool = False, sample_size: int = 3) -> dict:
+    """Check every index against the stored records, optionally rebuilding the ones that differ"""
+    redis_service.delete_matching(f"{SHADOW_PREFIX}*")
+    started = time.perf_counter()
+    totals = Counter()
+    expected_counters = Counter()
+    expected_keys = set()
+    
+    print(f"Scanning records in {len(PARTITIONS)} partitions with {workers} worker(s)...")
+    tasks = [(partition, batch_size, fix) for partition in PARTITIONS]
+    for done, (partition, stats, counters, index_keys, elapsed) in enumerate(run_tasks(build_partition, tasks, workers), 1):
+        totals.update(stats)
+        expected_counters.update(counters)
+        expected_keys |= index_keys
+        rate = totals['records'] / (time.perf_counter() - started)
+        print(f"  [{done}/{len(PARTITIONS)}] partition {partition or 'other'}: {stats['records']} records "
+              f"in {elapsed:.1f}s; {totals['records']} total, {rate:,.0f} records/s")
+    
+    index_keys = sorted(expected_keys | live_index_keys(batch_size))
+    chunk_size = max(1, len(index_keys) // (max(workers, 1) * 4))
+    tasks = [(index_keys[start:start + chunk_size], batch_size, sample_size)
+             for start in range(0, len(index_keys), chunk_size)]
+    
+    print(f"Comparing {len(index_keys)} index keys...")
+    compare_started = time.perf_counter()
+    compared = 0
+    differences = []
+    for count, key_differences in run_tasks(compare_keys, tasks, workers):
+        compared += count
+        differences += key_differences
+        rate = compared / (time.perf_counter() - compare_started)
+        print(f"  {compared}/{len(index_keys)} keys compared, {rate:,.0f} keys/s")
+    
+    counter_differences = compare_counters(expected_counters)
+    report = {
+        'records': totals['records'],
+        'unreadable_records': totals['unreadable'],
+        'stale_refs': totals['stale_refs'],
+        'index_keys': len(index_keys),
+        'differences': sorted(differences, key=lambda d: d['missing'] + d['extra'] + d['mismatched'], reverse=True),
+        'counter_differences': counter_differences,
+        'repaired': repair(differences, counter_differences, expected_counters) if fix else 0,
+        'elapsed': time.perf_counter() - started
+    }
+    redis_service.delete_matching(f"{SHADOW_PREFIX}*")
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Check every index against the stored individual records and optionally rebuild it'
+    )
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (1 runs everything in this process)')
+    parser.add_argument('--batch-size', type=int, default=redis_service.batch_size, help='keys per SCAN batch')
+    parser.add_argument('--repair', action='store_true',
+                        help='replace differing indexes with rebuilt copies (pause writes while this runs)')
+    parser.add_argument('--show', type=int, default=20, help='differing keys to list')
+    args = parser.parse_args()
+    
+    report = reconcile(args.workers, args.batch_size, args.repair)
+    differences = report['differences']
+    
+    print("Reconciliation completed!")
+    print(f"Records checked: {report['records']} in {report['elapsed']:.1f}s "
+          f"({report['records'] / report['elapsed']:,.0f} records/s)")
+    if report['unreadable_records']:
+        print(f"Unreadable records: {report['unreadable_records']}")
+    print(f"Stale refs documents: {report['stale_refs']}")
+    print(f"Index keys checked: {report['index_keys']}, differing: {len(differences)}")
+    print(f"  missing entries: {sum(d['missing'] for d in differences)}")
+    print(f"  orphaned or stale entries: {sum(d['extra'] for d in differences)}")
+    print(f"  wrong scores: {sum(d['mismatched'] for d in differences)}")
+    for difference in differences[:args.show]:
+        print(f"  {difference['key']} ({difference['type']}): -{difference['missing']} +{difference['extra']} "
+              f"~{difference['mismatched']} e.g. {', '.join(difference['sample'])}")
+    for hash_key, field, actual, expected in report['counter_differences']:
+        print(f"  {hash_key} {field}: {actual} (expected {expected})")
+    
+    if args.repair:
+        print(f"Keys rebuilt: {report['repaired']}")
+    elif differences or report['counter_differences'] or report['stale_refs']:
+        print("Run with --repair to rebuild the differing indexes")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
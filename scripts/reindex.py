@@ -0,0 +1,15 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.wealth_service import wealth_service
+
+def reindex():
+    """Rebuild the index entries (search, ranking, industry) of every stored individual"""
+    
+    print("Reindexing individuals...")
+    count = wealth_service.reindex_individuals()
+    print(f"Reindexed {count} individuals")
+
+if __name__ == '__main__':
+    reindex()
@@ -1,9 +1,56 @@
+import argparse
+import multiprocessing
+import random
 import sys
 import os
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from services.bulk_import import FORMATS, detect_format, parse_rows
 from services.wealth_service import wealth_service
 
+# Synthetic data: (industry, weight, sources of wealth)
+INDUSTRIES = [
+    ('Technology', 0.24, ['Software', 'E-commerce', 'Semiconductors', 'Social Media']),
+    ('Finance', 0.20, ['Investments', 'Hedge Funds', 'Private Equity', 'Banking']),
+    ('Real Estate', 0.12, ['Development', 'Inheritance & Development', 'REITs']),
+    ('Healthcare', 0.09, ['Pharmaceuticals', 'Medical Devices', 'Biotech']),
+    ('Retail', 0.08, ['Department Stores', 'Consumer Brands', 'E-commerce']),
+    ('Energy', 0.07, ['Oil & Gas', 'Renewables', 'Utilities']),
+    ('Manufacturing', 0.07, ['Industrial Equipment', 'Automotive', 'Chemicals']),
+    ('Media & Entertainment', 0.06, ['Film', 'Music', 'Sports Franchises']),
+    ('Food & Beverage', 0.05, ['Restaurants', 'Beverages', 'Agriculture']),
+    ('Telecom', 0.02, ['Wireless', 'Cable'])
+]
+
+FIRST_NAMES = [
+    'James', 'Sophia', 'Marcus', 'Isabella', 'Alexander', 'Olivia', 'William', 'Emma', 'Benjamin', 'Ava',
+    'Henry', 'Charlotte', 'Daniel', 'Amelia', 'Michael', 'Harper', 'David', 'Evelyn', 'Samuel', 'Abigail',
+    'Joseph', 'Emily', 'Thomas', 'Elizabeth', 'Charles', 'Sofia', 'Andrew', 'Victoria', 'Richard', 'Grace',
+    'Hiroshi', 'Priya', 'Mateo', 'Aisha', 'Wei', 'Lucia', 'Omar', 'Ingrid', 'Rafael', 'Mei'
+]
+
+LAST_NAMES = [
+    'Rutherford', 'Chen', 'Vanderbilt', 'Rodriguez', 'Thompson', 'Whitmore', 'Patel', 'Nakamura', 'Sullivan',
+    'Kowalski', 'Okafor', 'Lindqvist', 'Moreau', 'Castellano', 'Goldberg', 'Hartley', 'Ivanova', 'Fitzgerald',
+    'Delacroix', 'Bennett', 'Kim', 'Singh', 'Alvarez', 'Morgan', 'Sterling', 'Ashford', 'Blackwood', 'Carrington',
+    'Donovan', 'Ellsworth', 'Hale', 'Kensington', 'Lancaster', 'Montague', 'Pemberton', 'Quinn', 'Rockwell',
+    'Sinclair', 'Townsend', 'Wakefield'
+]
+
+COMPANY_SUFFIXES = ['Holdings', 'Capital', 'Enterprises', 'Group', 'Partners', 'Industries', 'Ventures', 'Inc.']
+
+TITLES = ['CEO', 'CEO & Founder', 'Founder', 'Chairman', 'Managing Partner', 'President', 'Principal', 'Investor']
+
+CITIES = [
+    ('New York', 'NY', '212'), ('San Francisco', 'CA', '415'), ('Los Angeles', 'CA', '310'),
+    ('Chicago', 'IL', '312'), ('Boston', 'MA', '617'), ('Miami', 'FL', '305'), ('Dallas', 'TX', '214'),
+    ('Houston', 'TX', '713'), ('Seattle', 'WA', '206'), ('Greenwich', 'CT', '203'), ('Palo Alto', 'CA', '650'),
+    ('Austin', 'TX', '512'), ('Denver', 'CO', '303'), ('Atlanta', 'GA', '404'), ('Palm Beach', 'FL', '561')
+]
+
+RISK_TOLERANCES = [('Conservative', 0.3), ('Moderate', 0.45), ('Aggressive', 0.25)]
+
 def seed_sample_data():
     """Seed the database with sample wealthy individuals data"""
     
@@ -132,5 +179,142 @@ def seed_sample_data():
     print(f"Total wealth: ${stats.get('total_wealth', 0):,.2f}")
     print(f"Average wealth: ${stats.get('average_wealth', 0):,.2f}")
 
+def generate_individual(rng: random.Random) -> dict:
+    """Generate one synthetic individual.
+    
+    Industries follow INDUSTRIES weights and net worth follows a Pareto tail
+    above $30M, so most records are Affluent with a few percent in the
+    upper tiers.
+    """
+    industry, _, sources = rng.choices(INDUSTRIES, weights=[weight for _, weight, _ in INDUSTRIES])[0]
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+    city, state, area_code = rng.choice(CITIES)
+    company = f"{rng.choice(LAST_NAMES)} {rng.choice(COMPANY_SUFFIXES)}"
+    net_worth = min(30_000_000 * rng.paretovariate(1.16), 300_000_000_000)
+    
+    return {
+        'id': f"ind_{rng.getrandbits(32):08x}",
+        'first_name': first_name,
+        'last_name': last_name,
+        'company': company,
+        'title': rng.choice(TITLES),
+        'net_worth': round(net_worth, -6),
+        'industry': industry,
+        'source_of_wealth': rng.choice(sources),
+        'email': f"{first_name.lower()}.{last_name.lower()}{rng.randint(1, 999)}@{company.split()[0].lower()}.com",
+        'phone': f"({area_code}) 555-{rng.randint(0, 9999):04d}",
+        'city': city,
+        'state': state
+    }
+
+def generate_portfolio(rng: random.Random, individual: dict) -> dict:
+    """Split part of an individual's net worth across the four asset classes."""
+    invested = individual['net_worth'] * rng.uniform(0.6, 0.95)
+    weights = [rng.gammavariate(2, 1) for _ in range(4)]
+    total_weight = sum(weights)
+    liquid, real_estate, stocks, private_equity = (invested * weight / total_weight for weight in weights)
+    
+    return {
+        'individual_id': individual['id'],
+        'liquid_assets': round(liquid, -3),
+        'real_estate_value': round(real_estate, -3),
+        'stock_portfolio_value': round(stocks, -3),
+        'private_equity_value': round(private_equity, -3),
+        'risk_tolerance': rng.choices(
+            [name for name, _ in RISK_TOLERANCES],
+            weights=[weight for _, weight in RISK_TOLERANCES]
+        )[0],
+        'assets': rng.sample(['Primary Residence', 'Commercial Real Estate', 'Tech Stocks', 'Blue Chip Stocks',
+                              'Art Collection', 'Vineyard', 'Private Jet', 'Yacht'], 2),
+        'investments': rng.sample(['VC Fund', 'Hedge Fund', 'Private Equity', 'Growth Funds',
+                                   'Real Estate Trusts', 'Municipal Bonds'], 2)
+    }
+
+def _seed_synthetic_worker(args) -> tuple:
+    """Create ``count`` synthetic individuals from one worker process."""
+    count, seed, batch_size, portfolio_ratio = args
+    rng = random.Random(seed)
+    created = 0
+    portfolios = 0
+    
+    while created < count:
+        rows = [generate_individual(rng) for _ in range(min(batch_size, count - created))]
+        report = wealth_service.bulk_create_individuals(rows, batch_size, max_errors=len(rows))
+        if not report['created']:
+            break
+        
+        # Rows can only fail on a random ID collision; they are regenerated by the next batch
+        failed_rows = {error['row'] for error in report['errors']}
+        created_rows = [row for row_number, row in enumerate(rows, 1) if row_number not in failed_rows]
+        portfolios += wealth_service.bulk_create_portfolios(
+            generate_portfolio(rng, row) for row in created_rows if rng.random() < portfolio_ratio
+        )
+        created += report['created']
+    
+    return created, portfolios
+
+def seed_synthetic(count: int, workers: int = 1, batch_size: int = 500,
+                   portfolio_ratio: float = 0.6, seed: int = 0):
+    """Seed ``count`` synthetic individuals split across ``workers`` processes"""
+    
+    print(f"Seeding {count} synthetic individuals with {workers} worker(s)...")
+    started = time.perf_counter()
+    
+    shares = [count // workers + (1 if index < count % workers else 0) for index in range(workers)]
+    tasks = [(share, seed + index, batch_size, portfolio_ratio) for index, share in enumerate(shares) if share]
+    
+    if workers > 1:
+        # Spawned workers import the services afresh and open their own Redis connections
+        with multiprocessing.get_context('spawn').Pool(len(tasks)) as pool:
+            results = pool.map(_seed_synthetic_worker, tasks)
+    else:
+        results = [_seed_synthetic_worker(task) for task in tasks]
+    
+    created = sum(individuals for individuals, _ in results)
+    portfolios = sum(portfolio_count for _, portfolio_count in results)
+    elapsed = time.perf_counter() - started
+    
+    print("Seed data completed!")
+    print(f"Created {created} individuals and {portfolios} portfolios in {elapsed:.1f}s "
+          f"({created / elapsed if elapsed else 0:,.0f} individuals/s)")
+
+def import_file(path: str, file_format: str = None, batch_size: int = 500):
+    """Import individuals from a JSON, NDJSON or CSV file"""
+    
+    file_format = file_format or detect_format(filename=path)
+    if file_format not in FORMATS:
+        raise SystemExit(f"Cannot tell the format of {path}, pass --format ({', '.join(FORMATS)})")
+    
+    print(f"Importing {path} as {file_format}...")
+    with open(path, newline='', encoding='utf-8') as stream:
+        report = wealth_service.bulk_create_individuals(parse_rows(stream, file_format), batch_size)
+    
+    print(f"Created {report['created']} individuals, {report['failed']} failed")
+    for error in report['errors']:
+        print(f"  row {error['row']}: {error['error']}")
+    if report['failed'] > len(report['errors']):
+        print(f"  ... {report['failed'] - len(report['errors'])} more errors not shown")
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed the wealth tracker database')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--file', help='import individuals from a JSON, NDJSON or CSV file')
+    source.add_argument('--synthetic', type=int, metavar='N', help='generate N synthetic individuals')
+    parser.add_argument('--format', choices=FORMATS, help='format of --file (default: from the extension)')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes for --synthetic')
+    parser.add_argument('--batch-size', type=int, default=500, help='records per pipelined batch')
+    parser.add_argument('--portfolio-ratio', type=float, default=0.6,
+                        help='share of synthetic individuals that get a portfolio')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for --synthetic')
+    args = parser.parse_args()
+    
+    if args.file:
+        import_file(args.file, args.format, args.batch_size)
+    elif args.synthetic:
+        seed_synthetic(args.synthetic, max(args.workers, 1), args.batch_size, args.portfolio_ratio, args.seed)
+    else:
+        seed_sample_data()
+
 if __name__ == '__main__':
-    seed_sample_data()
\ No newline at end of file
+    main()
\ No newline at end of file
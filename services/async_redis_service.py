@@ -0,0 +1,133 @@
+import logging
+from typing import Any, Dict, List, Optional, Union
+from redis.client import NEVER_DECODE
+from redis.exceptions import NoScriptError
+from config.redis_config import redis_config
+from services.redis_scripts import SCRIPTS
+from services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+class AsyncRedisService:
+    """redis.asyncio counterpart of RedisService for the ASGI app.
+    
+    Values and members are serialized exactly like RedisService, so both
+    services read and write the same keys.
+    """
+    
+    def __init__(self):
+        self.batch_size = redis_service.batch_size
+        self.script_shas: Dict[str, str] = {}
+    
+    @property
+    def client(self):
+        return redis_config.get_async_client()
+    
+    # Serialization helpers
+    def encode_value(self, value: Any) -> bytes:
+        return redis_service.encode_value(value)
+    
+    def encode_member(self, member: Any) -> str:
+        return redis_service.encode_member(member)
+    
+    def decode_member(self, member: str) -> Any:
+        return redis_service.decode_member(member)
+    
+    def decode_value(self, value: Optional[Union[bytes, str]]) -> Optional[Any]:
+        return redis_service.decode_value(value)
+    
+    # Basic Key-Value operations
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            return self.decode_value(await self.client.execute_command('GET', key, **{NEVER_DECODE: True}))
+        except Exception as e:
+            logger.error(f"Redis GET error for key {key}: {e}")
+            raise
+    
+    async def mget(self, keys: List[str], chunk_size: Optional[int] = None) -> List[Optional[Any]]:
+        """Fetch many keys with one MGET per chunk, all sent in one pipelined round trip.
+        
+        The chunks share a single pooled connection, so any number of keys
+        fits within REDIS_MAX_CONNECTIONS.  Results are returned in the same
+        order as ``keys``; missing keys come back as ``None``.
+        """
+        chunk_size = chunk_size or self.batch_size
+        try:
+            if not keys:
+                return []
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(keys), chunk_size):
+                pipe.execute_command('MGET', *keys[start:start + chunk_size], **{NEVER_DECODE: True})
+            return [self.decode_value(value) for values in await pipe.execute() for value in values]
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            raise
+    
+    # Set operations
+    async def smembers(self, key: str) -> List[Any]:
+        try:
+            return [self.decode_member(member) for member in await self.client.smembers(key)]
+        except Exception as e:
+            logger.error(f"Redis SMEMBERS error for key {key}: {e}")
+            raise
+    
+    async def sinter(self, *keys: str) -> List[Any]:
+        try:
+            return [self.decode_member(member) for member in await self.client.sinter(*keys)]
+        except Exception as e:
+            logger.error(f"Redis SINTER error for keys {keys}: {e}")
+            raise
+    
+    # Sorted Set operations
+    async def zrevrange(self, key: str, start: int, stop: int, withscores: bool = False) -> List[Any]:
+        try:
+            result = await self.client.zrevrange(key, start, stop, withscores=withscores)
+            if withscores:
+                return [(self.decode_member(member), score) for member, score in result]
+            return [self.decode_member(member) for member in result]
+        except Exception as e:
+            logger.error(f"Redis ZREVRANGE error for key {key}: {e}")
+            raise
+    
+    # Pipelines
+    def pipeline(self, transaction: bool = False):
+        return self.client.pipeline(transaction=transaction)
+    
+    # Lua scripts
+    async def load_scripts(self) -> None:
+        try:
+            for name, source in SCRIPTS.items():
+                self.script_shas[name] = await self.client.script_load(source)
+        except Exception as e:
+            logger.error(f"Redis SCRIPT LOAD error: {e}")
+            raise
+    
+    async def evalsha(self, name: str, keys: List[str], args: List[Any], raw: bool = False) -> Any:
+        """Run a registered script by SHA, loading the scripts on first use or after NOSCRIPT.
+        
+        ``raw`` returns the reply undecoded, for scripts that return stored values.
+        """
+        options = {NEVER_DECODE: True} if raw else {}
+        try:
+            if name not in self.script_shas:
+                await self.load_scripts()
+            try:
+                return await self.client.execute_command('EVALSHA', self.script_shas[name], len(keys), *keys, *args, **options)
+            except NoScriptError:
+                logger.warning(f"Script {name} missing from Redis script cache, reloading")
+                await self.load_scripts()
+                return await self.client.execute_command('EVALSHA', self.script_shas[name], len(keys), *keys, *args, **options)
+        except Exception as e:
+            logger.error(f"Redis EVALSHA error for script {name}: {e}")
+            raise
+    
+    # Database operations
+    async def info(self) -> Dict[str, Any]:
+        try:
+            return await self.client.info()
+        except Exception as e:
+            logger.error(f"Redis INFO error: {e}")
+            raise
+
+# Global instance
+async_redis_service = AsyncRedisService()
@@ -0,0 +1,310 @@
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from models.wealthy_individual import WealthyIndividual
+from models.portfolio import Portfolio
+from services.async_redis_service import async_redis_service
+from services.wealth_keyspace import WealthKeyspace
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+class AsyncWealthService(WealthKeyspace):
+    """Async WealthService for the ASGI app.
+    
+    Key layout, script calls, cursors, listing plans and search ranking
+    come from WealthKeyspace, shared with the sync WealthService, so both
+    stacks read and write the same data; only the Redis I/O differs, and
+    independent fetches run concurrently.  The in-process cache is the sync
+    service's, so a process running both holds one copy and one listener.
+    """
+    
+    def __init__(self):
+        super().__init__(wealth_service.cache)
+    
+    # Individual CRUD operations
+    async def create_individual(self, individual_data: Dict[str, Any]) -> WealthyIndividual:
+        try:
+            individual = WealthyIndividual(individual_data)
+            keys, args = self.upsert_call('create', individual)
+            if not await async_redis_service.evalsha('upsert_individual', keys, args):
+                raise ValueError(f"Individual {individual.id} already exists")
+            self.invalidate_local(keys[0])
+            
+            logger.info(f"Created individual: {individual.id}")
+            return individual
+            
+        except Exception as e:
+            logger.error(f"Error creating individual: {e}")
+            raise
+    
+    async def get_individual(self, individual_id: str, use_cache: bool = True) -> Optional[WealthyIndividual]:
+        try:
+            individuals = await self.get_individuals([individual_id], use_cache=use_cache)
+            return individuals[0] if individuals else None
+            
+        except Exception as e:
+            logger.error(f"Error getting individual {individual_id}: {e}")
+            raise
+    
+    async def get_individual_with_portfolio(self, individual_id: str) -> tuple:
+        """Fetch an individual and their portfolio concurrently."""
+        return await asyncio.gather(
+            self.get_individual(individual_id),
+            self.get_portfolio_by_individual_id(individual_id)
+        )
+    
+    async def update_individual(self, individual_id: str, update_data: Dict[str, Any]) -> Optional[WealthyIndividual]:
+        try:
+            existing = await self.get_individual(individual_id, use_cache=False)
+            if not existing:
+                raise ValueError(f"Individual {individual_id} not found")
+            
+            updated_individual = self.merge_update(existing, update_data)
+            
+            keys, args = self.upsert_call('update', updated_individual, previous=existing)
+            updated = await async_redis_service.evalsha('upsert_individual', keys, args)
+            self.invalidate_local(keys[0])
+            if not updated:
+                raise ValueError(f"Individual {individual_id} not found")
+            
+            return updated_individual
+            
+        except Exception as e:
+            logger.error(f"Error updating individual {individual_id}: {e}")
+            raise
+    
+    async def delete_individual(self, individual_id: str) -> bool:
+        try:
+            keys, args = self.delete_call(individual_id)
+            
+            result = await async_redis_service.evalsha('delete_individual', keys, args)
+            if result == -1:
+                # Record predates refs tracking: derive its index entries from the record
+                individual = await self.get_individual(individual_id, use_cache=False)
+                if individual:
+                    result = await async_redis_service.evalsha('delete_individual', *self.delete_call(
+                        individual_id, self.refs_json(individual)
+                    ))
+            self.invalidate_local(keys[0])
+            
+            if result != 1:
+                raise ValueError(f"Individual {individual_id} not found")
+            
+            logger.info(f"Deleted individual: {individual_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error deleting individual {individual_id}: {e}")
+            raise
+    
+    # Portfolio operations
+    async def get_portfolio_by_individual_id(self, individual_id: str) -> Optional[Portfolio]:
+        try:
+            portfolio_cache_key = self.portfolio_cache_key(individual_id)
+            local_cache = self.local_cache()
+            if local_cache:
+                portfolio = local_cache.get(portfolio_cache_key)
+                if portfolio:
+                    return portfolio
+                generation = local_cache.generation
+            
+            keys, args = self.portfolio_lookup_call(individual_id)
+            cached = async_redis_service.decode_value(
+                await async_redis_service.evalsha('individual_portfolio', keys, args, raw=True)
+            )
+            if cached:
+                portfolio = Portfolio.from_dict(cached)
+                if local_cache:
+                    local_cache.set(portfolio_cache_key, portfolio, generation)
+                return portfolio
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error getting portfolio for individual {individual_id}: {e}")
+            raise
+    
+    # Query operations
+    async def get_individuals(self, individual_ids: List[str], use_cache: bool = True) -> List[WealthyIndividual]:
+        """Load many individuals, preserving order; MGET chunks are pipelined on one connection."""
+        try:
+            keys = [f"{self.individual_prefix}{individual_id}" for individual_id in individual_ids]
+            local_cache = self.local_cache() if use_cache else None
+            found = {key: local_cache.get(key) if local_cache else None for key in keys}
+            generation = local_cache.generation if local_cache else None
+            
+            missing = [key for key, individual in found.items() if individual is None]
+            for key, data in zip(missing, await async_redis_service.mget(missing)):
+                if data:
+                    found[key] = WealthyIndividual.from_dict(data)
+                    if local_cache:
+                        local_cache.set(key, found[key], generation)
+            
+            return [found[key] for key in keys if found[key] is not None]
+            
+        except Exception as e:
+            logger.error(f"Error getting {len(individual_ids)} individuals: {e}")
+            raise
+    
+    async def list_individuals(self, sort: str = 'net_worth', limit: int = 50, cursor: Optional[str] = None,
+                               industry: Optional[str] = None, filters: Optional[Dict[str, str]] = None,
+                               fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        try:
+            plan = self.plan_listing(sort, limit, cursor, industry, filters, fields)
+            
+            reply = await async_redis_service.evalsha(plan['script'], *plan['call'])
+            
+            if plan['index_only']:
+                individuals = self.listing_entries(plan, reply[0])
+            else:
+                individuals = await self.get_individuals(self.listing_ids(plan, reply[0]))
+                if fields:
+                    individuals = [ind.to_dict(fields) for ind in individuals]
+            
+            return self.listing_result(plan, individuals, reply)
+            
+        except Exception as e:
+            logger.error(f"Error listing individuals sorted by {sort}: {e}")
+            raise
+    
+    async def get_generation(self, scope: str) -> Optional[Tuple[int, float]]:
+        try:
+            stamps = await async_redis_service.client.hmget(self.generation_key, scope, 'global')
+            return self.parse_generation(stamps)
+            
+        except Exception as e:
+            logger.error(f"Error getting generation of {scope}: {e}")
+            raise
+    
+    async def get_wealth_ranking(self, limit: int = 10, segment: Optional[str] = None,
+                                 value: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        try:
+            keys, args = self.leaderboard_call(limit, segment, value, fields)
+            reply = await async_redis_service.evalsha('ranked_records', keys, args, raw=True)
+            return self.ranked_entries(reply, fields)
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth ranking: {e}")
+            raise
+    
+    # Net worth queries
+    async def get_net_worth_range(self, min_worth: Optional[float] = None, max_worth: Optional[float] = None,
+                                  limit: int = 50, cursor: Optional[str] = None,
+                                  include_records: bool = False, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        try:
+            low, high = self._score_bounds(min_worth, max_worth)
+            offset = self.decode_cursor(cursor, 'net_worth_range')[0] if cursor else 0
+            
+            pipe = async_redis_service.pipeline()
+            self.queue_net_worth_range(pipe, low, high, offset, limit)
+            ranked, total = await pipe.execute()
+            page = self.net_worth_range_page(ranked, offset, total)
+            if include_records:
+                individuals = await self.get_individuals([entry['id'] for entry in page['entries']])
+                self.attach_records(page['entries'], individuals, fields)
+            return page
+            
+        except Exception as e:
+            logger.error(f"Error getting net worth range {min_worth}-{max_worth}: {e}")
+            raise
+    
+    async def count_by_net_worth(self, min_worth: Optional[float] = None, max_worth: Optional[float] = None) -> int:
+        try:
+            low, high = self._score_bounds(min_worth, max_worth)
+            return await async_redis_service.client.zcount(self.wealth_ranking_key, low, high)
+            
+        except Exception as e:
+            logger.error(f"Error counting net worth range {min_worth}-{max_worth}: {e}")
+            raise
+    
+    async def get_wealth_rank(self, individual_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            result = await async_redis_service.evalsha('wealth_rank', *self.wealth_rank_call(individual_id))
+            return self.format_wealth_rank(individual_id, result)
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth rank for {individual_id}: {e}")
+            raise
+    
+    async def get_wealth_histogram(self, edges: Optional[List[float]] = None, per_decade: int = 1) -> Dict[str, Any]:
+        try:
+            if edges is None:
+                pipe = async_redis_service.pipeline()
+                self.queue_net_worth_extremes(pipe)
+                edges = self.histogram_edges(*await pipe.execute(), per_decade)
+                if edges is None:
+                    return self.format_histogram(None, [])
+            
+            pipe = async_redis_service.pipeline()
+            self.queue_histogram_counts(pipe, edges)
+            return self.format_histogram(edges, await pipe.execute())
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth histogram: {e}")
+            raise
+    
+    # Net worth history
+    async def get_net_worth_history(self, individual_id: str, start: Optional[float] = None,
+                                    end: Optional[float] = None, resolution: str = 'raw') -> Optional[Dict[str, Any]]:
+        bounds, width = self.history_query(start, end, resolution)
+        
+        try:
+            key = self.history_key(individual_id)
+            if width:
+                reply = await async_redis_service.evalsha('history_buckets', [key], [*bounds, width])
+            else:
+                reply = await async_redis_service.client.zrangebyscore(key, *bounds)
+            history = self.format_history(individual_id, resolution, width, reply)
+            
+            if not history['points'] and not await self.get_individual(individual_id):
+                return None
+            return history
+            
+        except Exception as e:
+            logger.error(f"Error getting net worth history of {individual_id}: {e}")
+            raise
+    
+    async def get_movers(self, period: str = 'month', direction: str = 'gainers', limit: int = 10,
+                         previous: bool = False, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        label, keys, args = self.movers_call(period, direction, limit, previous)
+        
+        try:
+            reply = await async_redis_service.evalsha('movers', keys, args)
+            individuals = await self.get_individuals(self.mover_ids(reply))
+            return self.format_movers(period, label, direction, reply, individuals, fields)
+            
+        except Exception as e:
+            logger.error(f"Error getting {direction} for {period} {label}: {e}")
+            raise
+    
+    async def search_individuals(self, query: str, limit: int = 50) -> List[WealthyIndividual]:
+        try:
+            search_term, candidate_keys = self.search_candidate_keys(query)
+            candidates = await self.get_individuals(await async_redis_service.sinter(*candidate_keys))
+            return self.rank_matches(candidates, search_term, limit)
+            
+        except Exception as e:
+            logger.error(f"Error searching individuals: {e}")
+            raise
+    
+    # Analytics
+    async def get_wealth_statistics(self) -> Dict[str, Any]:
+        try:
+            pipe = async_redis_service.pipeline()
+            pipe.hgetall(self.stats_key)
+            self.queue_net_worth_extremes(pipe)
+            return self.format_statistics(*await pipe.execute())
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth statistics: {e}")
+            raise
+    
+    async def get_redis_info(self) -> Dict[str, Any]:
+        try:
+            return self.format_redis_info(await async_redis_service.info())
+        except Exception as e:
+            logger.error(f"Error getting Redis info: {e}")
+            raise
+
+# Global instance
+async_wealth_service = AsyncWealthService()
@@ -0,0 +1,64 @@
+import csv
+import json
+from typing import Any, IO, Iterator, Optional
+
+FORMATS = ('json', 'ndjson', 'csv')
+
+CONTENT_TYPES = {
+    'application/json': 'json',
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv'
+}
+
+EXTENSIONS = {
+    '.json': 'json',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv'
+}
+
+def detect_format(content_type: Optional[str] = None, filename: Optional[str] = None) -> Optional[str]:
+    """Guess the import format from a MIME type or file name."""
+    if content_type:
+        mimetype = content_type.split(';')[0].strip().lower()
+        if mimetype in CONTENT_TYPES:
+            return CONTENT_TYPES[mimetype]
+    if filename:
+        for extension, file_format in EXTENSIONS.items():
+            if filename.lower().endswith(extension):
+                return file_format
+    return None
+
+def parse_rows(stream: IO[str], file_format: str) -> Iterator[Any]:
+    """Yield import rows from a text stream.
+    
+    JSON accepts an array or an object with an ``individuals`` array and is
+    read whole; NDJSON and CSV are read line by line.  An NDJSON line that
+    is not valid JSON is yielded as the ValueError describing it so that it
+    can be reported against its row number.  Empty CSV cells are dropped so
+    that model defaults apply.
+    """
+    if file_format == 'json':
+        data = json.load(stream)
+        if isinstance(data, dict):
+            data = data.get('individuals', [])
+        if not isinstance(data, list):
+            raise ValueError('JSON import must be an array or an object with an "individuals" array')
+        yield from data
+        
+    elif file_format == 'ndjson':
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield e
+                
+    elif file_format == 'csv':
+        for row in csv.DictReader(stream):
+            yield {field: value for field, value in row.items() if field and value not in ('', None)}
+            
+    else:
+        raise ValueError(f"Unsupported import format '{file_format}', expected one of {', '.join(FORMATS)}")
@@ -0,0 +1,239 @@
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from redis.exceptions import ResponseError
+from config.redis_config import redis_config
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+class ChangeFeed:
+    """Reads the change feed stream the mutation scripts append to.
+    
+    Each entry is one create, update or delete (``type`` created, updated,
+    deleted or portfolio) with the individual's ID, their net worth before
+    the write and, for individuals, the fields listed in
+    WealthService.event_fields after it.  The stream is capped at
+    STREAM_MAX_LENGTH entries (approximately), so a reader that falls
+    further behind than that misses events and should reload in full.
+    
+    Plain reads resume from an entry ID the caller keeps (an SSE client's
+    Last-Event-ID); consumer groups keep the offset in Redis, per group,
+    and redeliver unacknowledged entries to the consumer that read them.
+    """
+    
+    def __init__(self):
+        self.keys = wealth_service
+    
+    def parse(self, entries: List[Tuple[str, Dict[str, str]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """(entry ID, event) pairs with the net worth fields as floats."""
+        events = []
+        for entry_id, fields in entries:
+            event = dict(fields)
+            for field in ('net_worth', 'previous_net_worth', 'total_value'):
+                if field in event:
+                    event[field] = float(event[field]) if event[field] != '' else None
+            events.append((entry_id, event))
+        return events
+    
+    def last_id(self) -> str:
+        """ID of the newest entry ('0-0' when the stream is empty), to read only what follows."""
+        try:
+            newest = redis_service.client.xrevrange(self.keys.events_stream_key, count=1)
+            return newest[0][0] if newest else '0-0'
+            
+        except Exception as e:
+            logger.error(f"Error reading the change feed head: {e}")
+            raise
+    
+    def read(self, after_id: str, count: int = 100, block_ms: Optional[int] = None,
+             client=None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Events after ``after_id``, oldest first, waiting up to ``block_ms`` for the first one.
+        
+        A blocking read holds its connection for the whole wait; long-lived
+        readers pass a dedicated ``client`` rather than use the shared pool.
+        """
+        try:
+            reply = (client or redis_service.client).xread({self.keys.events_stream_key: after_id}, count=count, block=block_ms)
+            return self.parse(reply[0][1]) if reply else []
+            
+        except Exception as e:
+            logger.error(f"Error reading the change feed after {after_id}: {e}")
+            raise
+    
+    def ensure_group(self, group: str, start_id: str = '$') -> bool:
+        """Create a consumer group reading from ``start_id`` ('$' new events, '0' the whole stream).
+        
+        Returns False if the group already exists; its offset is kept.
+        """
+        try:
+            redis_service.client.xgroup_create(self.keys.events_stream_key, group, id=start_id, mkstream=True)
+            return True
+        except ResponseError as e:
+            if 'BUSYGROUP' in str(e):
+                return False
+            logger.error(f"Error creating consumer group {group}: {e}")
+            raise
+    
+    def read_group(self, group: str, consumer: str, count: int = 100, block_ms: Optional[int] = None,
+                   pending: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+        """Next events for ``consumer`` of ``group``, to be acknowledged with ``ack`` once handled.
+        
+        ``pending`` re-reads the events this consumer was given but never
+        acknowledged (after a crash) instead of new ones.
+        """
+        try:
+            reply = redis_service.client.xreadgroup(
+                group, consumer, {self.keys.events_stream_key: '0' if pending else '>'}, count=count, block=block_ms
+            )
+            return self.parse(reply[0][1]) if reply else []
+            
+        except Exception as e:
+            logger.error(f"Error reading the change feed for {group}/{consumer}: {e}")
+            raise
+    
+    def ack(self, group: str, *entry_ids: str) -> int:
+        try:
+            return redis_service.client.xack(self.keys.events_stream_key, group, *entry_ids) if entry_ids else 0
+            
+        except Exception as e:
+            logger.error(f"Error acknowledging {len(entry_ids)} events for {group}: {e}")
+            raise
+    
+    def claim_stale(self, group: str, consumer: str, min_idle_ms: int = 60000,
+                    count: int = 100) -> List[Tuple[str, Dict[str, Any]]]:
+        """Take over events another consumer of ``group`` left unacknowledged for ``min_idle_ms``."""
+        try:
+            reply = redis_service.client.xautoclaim(
+                self.keys.events_stream_key, group, consumer, min_idle_ms, start_id='0-0', count=count
+            )
+            return self.parse([entry for entry in reply[1] if entry[1] is not None])
+            
+        except Exception as e:
+            logger.error(f"Error claiming stale events for {group}/{consumer}: {e}")
+            raise
+    
+    def ranks(self, events: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[int]]:
+        """1-based net worth rank of each event's individual now, None for deleted or unranked ones."""
+        pipe = redis_service.pipeline()
+        for _, event in events:
+            pipe.zrevrank(self.keys.wealth_ranking_key, event['id'])
+        return [None if rank is None else rank + 1 for rank in pipe.execute()]
+
+def entry_order(entry_id: str) -> Tuple[int, int]:
+    """Sort key of a stream entry ID ('<ms>-<seq>')."""
+    milliseconds, _, sequence = entry_id.partition('-')
+    return int(milliseconds), int(sequence or 0)
+
+class Subscription:
+    """One subscriber's queue of (events, statistics) batches.
+    
+    ``dropped`` is set when the subscriber fell ``max_pending`` batches
+    behind and stopped receiving; it should end and resume from its last
+    entry ID.  ``notify``, when given, is called from the reader thread
+    after each batch is offered, so a subscriber on an event loop can wait
+    without blocking a thread on the queue.
+    """
+    
+    def __init__(self, max_pending: int, notify: Optional[Callable[[], None]] = None):
+        self.batches: queue.Queue = queue.Queue(max_pending)
+        self.dropped = False
+        self.notify = notify
+
+class ChangeBroadcaster:
+    """Fans the change feed out to every live subscriber (SSE stream) of this process.
+    
+    A single reader thread, started with the first subscriber and stopped
+    after the last one leaves, blocks on XREAD over its own dedicated
+    connection, so open streams hold no connection of the shared pool.
+    Ranks and wealth statistics are fetched once per batch for all
+    subscribers.  At most ``max_subscribers`` may subscribe at a time.
+    """
+    
+    def __init__(self, feed: ChangeFeed, max_subscribers: int = 100, max_pending: int = 1000,
+                 block_ms: int = 5000, count: int = 100):
+        self.feed = feed
+        self.max_subscribers = max_subscribers
+        self.max_pending = max_pending
+        self.block_ms = block_ms
+        self.count = count
+        self._subscribers: set = set()
+        self._lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+        self._reader_pid: Optional[int] = None
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    def subscribe(self, notify: Optional[Callable[[], None]] = None) -> Optional[Subscription]:
+        """Register a subscriber, or return None when ``max_subscribers`` are already connected."""
+        with self._lock:
+            if self._reader_pid != os.getpid():
+                # Forked: the parent's subscribers and reader thread do not exist here
+                self._subscribers = set()
+                self._reader = None
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscription = Subscription(self.max_pending, notify)
+            self._subscribers.add(subscription)
+            if self._reader is None:
+                self._reader = threading.Thread(target=self._run, name='change-feed-broadcaster', daemon=True)
+                self._reader_pid = os.getpid()
+                self._reader.start()
+            return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+    
+    def _publish(self, batch: Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Any]]) -> None:
+        with self._lock:
+            for subscription in list(self._subscribers):
+                try:
+                    subscription.batches.put_nowait(batch)
+                except queue.Full:
+                    subscription.dropped = True
+                    self._subscribers.discard(subscription)
+                if subscription.notify:
+                    subscription.notify()
+    
+    def _run(self) -> None:
+        client = redis_config.create_dedicated_client()
+        try:
+            last_id = self.feed.last_id()
+            while True:
+                with self._lock:
+                    if not self._subscribers:
+                        self._reader = None
+                        return
+                try:
+                    events = self.feed.read(last_id, self.count, self.block_ms, client=client)
+                    if not events:
+                        continue
+                    last_id = events[-1][0]
+                    for (_, event), rank in zip(events, self.feed.ranks(events)):
+                        if event['type'] != 'portfolio':
+                            event['rank'] = rank
+                    self._publish((events, wealth_service.get_wealth_statistics()))
+                except Exception as e:
+                    logger.error(f"Error broadcasting change events after {last_id}: {e}")
+                    time.sleep(1)
+        except Exception as e:
+            logger.error(f"Change feed broadcaster stopped: {e}")
+            with self._lock:
+                self._reader = None
+                for subscription in self._subscribers:
+                    subscription.dropped = True
+                    if subscription.notify:
+                        subscription.notify()
+                self._subscribers.clear()
+        finally:
+            client.connection_pool.disconnect()
+
+change_feed = ChangeFeed()
+change_broadcaster = ChangeBroadcaster(change_feed, int(os.getenv('SSE_MAX_CLIENTS', 100)))
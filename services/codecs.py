@@ -0,0 +1,105 @@
+import json
+import os
+from typing import Any, Dict, Optional, Union
+
+# Every payload written through a codec starts with TAG_PREFIX and a one-byte
+# format tag, so a store can hold several formats while it is being migrated.
+# Values without the prefix predate tagging and are plain JSON.
+TAG_PREFIX = b'\x00'
+
+class JsonCodec:
+    """Standard library JSON; needs no extra dependency."""
+    
+    name = 'json'
+    tag = b'J'
+    
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+    
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+class OrjsonCodec:
+    """orjson: JSON-compatible output, several times faster than the stdlib."""
+    
+    name = 'orjson'
+    tag = b'O'
+    
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+    
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+    
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+class MsgpackCodec:
+    """MessagePack: compact binary payloads, read back through undecoded replies."""
+    
+    name = 'msgpack'
+    tag = b'M'
+    
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+    
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+    
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+
+class ValueCodec:
+    """Encodes values with the configured codec and decodes any tagged (or legacy) payload."""
+    
+    def __init__(self, name: str = 'json'):
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec '{name}', expected one of {', '.join(CODECS)}")
+        self.codec = self._load(name)
+        self.name = name
+        self.tag = TAG_PREFIX + self.codec.tag
+        self._by_tag: Dict[bytes, Any] = {self.codec.tag: self.codec}
+    
+    @staticmethod
+    def _load(name: str):
+        try:
+            return CODECS[name]()
+        except ImportError as e:
+            raise RuntimeError(f"Codec '{name}' needs an optional package that is not installed: {e}") from e
+    
+    def encode(self, value: Any) -> bytes:
+        return self.tag + self.codec.dumps(value)
+    
+    def decode(self, data: Optional[Union[bytes, str]]) -> Optional[Any]:
+        if not data:
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if data[:1] != TAG_PREFIX:
+            return json.loads(data)
+        return self._codec_for(data[1:2]).loads(data[2:])
+    
+    def is_current(self, data: Optional[Union[bytes, str]]) -> bool:
+        """Whether ``data`` is already in the configured format."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return bool(data) and data[:2] == self.tag
+    
+    def _codec_for(self, tag: bytes):
+        codec = self._by_tag.get(tag)
+        if codec is None:
+            for codec_class in CODECS.values():
+                if codec_class.tag == tag:
+                    codec = self._by_tag[tag] = self._load(codec_class.name)
+                    break
+            else:
+                raise ValueError(f"Unknown payload format tag {tag!r}")
+        return codec
+
+def create_value_codec() -> ValueCodec:
+    """Build the codec named by REDIS_CODEC (json, orjson or msgpack)."""
+    return ValueCodec(os.getenv('REDIS_CODEC', 'json').lower())
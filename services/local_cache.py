@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class LocalCache:
+    """Size-bounded LRU cache with TTL for deserialized records, local to one process.
+    
+    Entries are dropped when an invalidation for their key arrives on a Redis
+    pub/sub channel (published by the mutation scripts), so several app
+    workers stay consistent.  A generation counter guards against caching a
+    value that was read before a concurrent invalidation.
+    """
+    
+    def __init__(self, max_size: int = 10000, ttl: float = 30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._listener = None
+        self._listener_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    @property
+    def generation(self) -> int:
+        """Read before fetching from Redis and pass to ``set`` to detect racing invalidations."""
+        return self._generation
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any, generation: Optional[int] = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                # An invalidation landed while the value was being read; it may be stale
+                return
+            
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': True,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+    
+    # Invalidation
+    def ensure_listener(self, client, channel: str) -> None:
+        """Subscribe to the invalidation channel once per process.
+        
+        Called on every cache access; after a fork the child starts its own
+        listener thread and drops anything inherited from the parent.
+        """
+        if self._listener_pid == os.getpid():
+            return
+        
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._entries.clear()
+            self._generation += 1
+            
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: self._on_invalidation})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._on_listener_error
+            )
+            self._listener_pid = os.getpid()
+            logger.info(f"Local cache listening for invalidations on {channel}")
+    
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        self.invalidate(message['data'])
+    
+    def _on_listener_error(self, error: Exception, pubsub, thread) -> None:
+        # Invalidations may have been missed while disconnected; start from empty.
+        # The next get_message reconnects and resubscribes.
+        logger.warning(f"Local cache invalidation listener error, clearing cache: {error}")
+        self.clear()
+        time.sleep(1.0)
+
+def create_local_cache() -> Optional[LocalCache]:
+    """Build the cache from LOCAL_CACHE_* settings, or return None when it is disabled."""
+    if os.getenv('LOCAL_CACHE_ENABLED', 'false').lower() not in ('1', 'true', 'yes'):
+        return None
+    return LocalCache(
+        max_size=int(os.getenv('LOCAL_CACHE_SIZE', 10000)),
+        ttl=float(os.getenv('LOCAL_CACHE_TTL', 30))
+    )
@@ -0,0 +1,193 @@
+import abc
+import os
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds; an observation lands in the first bucket it does not exceed
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = tuple(2 ** exponent for exponent in range(7, 25, 2))  # 128 B to 16 MiB
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500, 1000)
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric(abc.ABC):
+    type_name = ''
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        # Cleared by a disabled registry, turning recording into a no-op
+        self.enabled = True
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+    
+    def _labels(self, labels: Tuple[str, ...], extra: str = '') -> str:
+        pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(self.labelnames, labels)]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+    
+    def _snapshot(self) -> List[Tuple[Tuple[str, ...], list]]:
+        with self._lock:
+            return [(labels, list(series)) for labels, series in sorted(self._series.items())]
+    
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Exposition lines of every series, without the HELP and TYPE header."""
+    
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples()
+        ]
+
+class Counter(_Metric):
+    """Monotonic count per label combination."""
+    
+    type_name = 'counter'
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0]
+            series[0] += amount
+    
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            series = self._series.get(labels)
+            return series[0] if series else 0
+    
+    def samples(self) -> List[str]:
+        return [f"{self.name}{self._labels(labels)} {_format_value(series[0])}" for labels, series in self._snapshot()]
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets, per label combination.
+    
+    Each series is a plain list of per-bucket counts (the last one for
+    values above every bound) followed by the sum, so an observation is a
+    bisect and two increments under the lock; buckets are only made
+    cumulative when rendered.
+    """
+    
+    type_name = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, *labels: str) -> None:
+        if not self.enabled:
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0]
+            series[index] += 1
+            series[-1] += value
+    
+    def count(self, *labels: str) -> int:
+        with self._lock:
+            series = self._series.get(labels)
+            return sum(series[:-1]) if series else 0
+    
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, series in self._snapshot():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{self._labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {cumulative}")
+        return lines
+
+class RequestScope:
+    """Per-request tallies that the Redis client adds to while a request is being handled."""
+    
+    __slots__ = ('round_trips', 'commands')
+    
+    def __init__(self):
+        self.round_trips = 0
+        self.commands = 0
+
+class MetricsRegistry:
+    """In-process metrics rendered in the Prometheus text exposition format.
+    
+    Metrics are kept per process, like the connection pool: behind a
+    multi-worker server each worker reports its own, distinguished by the
+    scrape target or the ``pid`` in /health.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._scope: ContextVar[Optional[RequestScope]] = ContextVar('metrics_request_scope', default=None)
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        metric.enabled = self.enabled
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with different labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    # Request scope
+    def begin_request(self):
+        """Start tallying for the current request; pass the returned token to ``end_request``."""
+        return self._scope.set(RequestScope())
+    
+    def current_request(self) -> Optional[RequestScope]:
+        return self._scope.get()
+    
+    def end_request(self, token) -> None:
+        self._scope.reset(token)
+    
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = [line for metric in metrics for line in metric.render()]
+        return '\n'.join(lines) + '\n'
+
+metrics = MetricsRegistry(os.getenv('METRICS_ENABLED', 'true').lower() == 'true')
+
+# Redis client instrumentation, recorded by services.redis_service.InstrumentedRedis
+redis_command_duration = metrics.histogram(
+    'redis_command_duration_seconds', 'Round trip time of Redis commands and pipelines', ['command']
+)
+redis_command_errors = metrics.counter(
+    'redis_command_errors_total', 'Redis commands and pipelines that raised', ['command', 'error']
+)
+redis_blocking_wait = metrics.histogram(
+    'redis_blocking_read_seconds', 'Time blocking stream reads waited for entries', ['command'],
+    buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0)
+)
+redis_pipeline_size = metrics.histogram(
+    'redis_pipeline_commands', 'Commands sent per pipeline round trip', buckets=COUNT_BUCKETS
+)
@@ -0,0 +1,195 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+logger = logging.getLogger(__name__)
+
+# Stored asset values, in column order; total_value is derived from them
+ASSET_COLUMNS = ('liquid_assets', 'real_estate_value', 'stock_portfolio_value', 'private_equity_value')
+VALUE_COLUMNS = ASSET_COLUMNS + ('total_value',)
+# Individual fields are resolved through their filter index sets, risk tolerance from the portfolio
+GROUP_FIELDS = ('industry', 'wealth_tier', 'risk_tolerance')
+# Stats hash counter prefix of each individual field, listing the values that have index sets
+COUNTER_PREFIXES = {'industry': 'industry:', 'wealth_tier': 'tier:'}
+PERCENTILES = (25, 50, 75, 90)
+UNKNOWN = 'Unknown'
+
+class PortfolioAnalytics:
+    """Asset totals and distributions across every portfolio, overall and per group.
+    
+    Portfolios are streamed from the portfolio index in pipelined batches
+    into NumPy columns (one float per asset class and one integer group code
+    per grouping field), then aggregated with bincount and a single sort per
+    column instead of a Python loop over records.
+    """
+    
+    def __init__(self):
+        self.keys = wealth_service
+    
+    def parse_group_by(self, group_by: Optional[str]) -> List[str]:
+        """Split a comma-separated ``group_by`` parameter; every field when it is empty."""
+        if not group_by:
+            return list(GROUP_FIELDS)
+        fields = [field.strip() for field in group_by.split(',') if field.strip()]
+        unknown = [field for field in fields if field not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown group_by field(s): {', '.join(unknown)}; expected {', '.join(GROUP_FIELDS)}")
+        return list(dict.fromkeys(fields))
+    
+    # Loading
+    def _index_sets(self, field: str, counters: Dict[str, str]) -> List[Tuple[str, str]]:
+        """(value, set key) of every filter index set of an individual field.
+        
+        The values are those with a positive counter in the stats hash, which
+        every write keeps in step with the index sets, so no keyspace scan is
+        needed.
+        """
+        prefix = COUNTER_PREFIXES[field]
+        return sorted(
+            (name[len(prefix):], f"{self.keys.filter_index_keys[field]}:{name[len(prefix):]}")
+            for name, count in counters.items()
+            if name.startswith(prefix) and float(count) > 0
+        )
+    
+    def _membership_codes(self, individual_ids: List[str], set_keys: List[str]) -> np.ndarray:
+        """Index of the set each individual belongs to, len(set_keys) for none.
+        
+        One SMISMEMBER per set, pipelined, gives a sets x individuals
+        membership matrix whose argmax is the group code.
+        """
+        if not set_keys:
+            return np.zeros(len(individual_ids), dtype=np.intp)
+        members = [redis_service.encode_member(individual_id) for individual_id in individual_ids]
+        pipe = redis_service.pipeline()
+        for key in set_keys:
+            pipe.smismember(key, members)
+        membership = np.array(pipe.execute(), dtype=bool)
+        codes = membership.argmax(axis=0)
+        codes[~membership.any(axis=0)] = len(set_keys)
+        return codes
+    
+    def _label_codes(self, values: List[str], labels: List[str]) -> np.ndarray:
+        """Code of each value in ``labels``, appending the values not seen before."""
+        uniques, inverse = np.unique(np.array(values, dtype=object), return_inverse=True)
+        lookup = {label: code for code, label in enumerate(labels)}
+        for value in uniques:
+            if value not in lookup:
+                lookup[value] = len(labels)
+                labels.append(value)
+        return np.array([lookup[value] for value in uniques], dtype=np.intp)[inverse]
+    
+    def load_columns(self, group_by: List[str],
+                     batch_size: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, List[str]]]:
+        """Load every portfolio column-wise.
+        
+        Returns an (n, len(VALUE_COLUMNS)) value matrix, the group codes of
+        each row per ``group_by`` field and the label of each code.
+        Portfolios whose individual is missing from an index are labelled
+        UNKNOWN.
+        """
+        set_keys = {}
+        labels = {}
+        counters = redis_service.client.hgetall(self.keys.stats_key) if set(group_by) & set(COUNTER_PREFIXES) else {}
+        for field in group_by:
+            if field in COUNTER_PREFIXES:
+                index_sets = self._index_sets(field, counters)
+                set_keys[field] = [key for _, key in index_sets]
+                labels[field] = [value for value, _ in index_sets] + [UNKNOWN]
+            else:
+                labels[field] = []
+        
+        value_batches = []
+        code_batches = {field: [] for field in group_by}
+        for batch in self.keys.iter_portfolio_batches(batch_size):
+            value_batches.append(np.array([[row[column] for column in ASSET_COLUMNS] for row in batch], dtype=np.float64))
+            individual_ids = [row['individual_id'] for row in batch]
+            for field in group_by:
+                if field in set_keys:
+                    codes = self._membership_codes(individual_ids, set_keys[field])
+                else:
+                    codes = self._label_codes([row.get(field) or UNKNOWN for row in batch], labels[field])
+                code_batches[field].append(codes)
+        
+        if not value_batches:
+            return np.empty((0, len(VALUE_COLUMNS))), {field: np.empty(0, dtype=np.intp) for field in group_by}, labels
+        
+        assets = np.concatenate(value_batches)
+        values = np.column_stack([assets, assets.sum(axis=1)])
+        return values, {field: np.concatenate(code_batches[field]) for field in group_by}, labels
+    
+    # Aggregation
+    def _group_percentiles(self, values: np.ndarray, codes: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """(groups, columns, PERCENTILES) array, linearly interpolated like np.percentile.
+        
+        Rows are sorted by value, then stably by group (a cheap integer sort),
+        once per column, so each group is a contiguous ordered run and every
+        percentile is an interpolation between two gathered positions.
+        """
+        starts = np.cumsum(counts) - counts
+        positions = starts[:, None] + np.maximum(counts - 1, 0)[:, None] * (np.array(PERCENTILES) / 100)[None, :]
+        lower = np.minimum(np.floor(positions).astype(np.intp), len(codes) - 1)
+        upper = np.minimum(np.ceil(positions).astype(np.intp), len(codes) - 1)
+        weight = positions - np.floor(positions)
+        
+        result = np.empty((len(counts), values.shape[1], len(PERCENTILES)))
+        for column in range(values.shape[1]):
+            by_value = np.argsort(values[:, column])
+            ordered = values[by_value[np.argsort(codes[by_value], kind='stable')], column]
+            result[:, column] = ordered[lower] * (1 - weight) + ordered[upper] * weight
+        return result
+    
+    def aggregate(self, values: np.ndarray, codes: np.ndarray, labels: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Summaries of the rows of each non-empty group, keyed by label."""
+        if not len(codes):
+            return {}
+        counts = np.bincount(codes, minlength=len(labels))
+        sums = np.column_stack([
+            np.bincount(codes, weights=values[:, column], minlength=len(labels))
+            for column in range(values.shape[1])
+        ])
+        percentiles = self._group_percentiles(values, codes, counts)
+        return {
+            labels[code]: self._summary(int(counts[code]), sums[code], percentiles[code])
+            for code in np.flatnonzero(counts)
+        }
+    
+    def _summary(self, count: int, sums: np.ndarray, percentiles: np.ndarray) -> Dict[str, Any]:
+        total = sums[-1]
+        summary = {'count': count}
+        for column, name in enumerate(VALUE_COLUMNS):
+            summary[name] = {
+                'total': float(sums[column]),
+                'mean': float(sums[column] / count),
+                **{f"p{p}": value for p, value in zip(PERCENTILES, percentiles[column].tolist())}
+            }
+            if name != 'total_value':
+                summary[name]['share'] = float(sums[column] / total) if total else 0.0
+        return summary
+    
+    def get_analytics(self, group_by: Optional[List[str]] = None, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Asset totals, means, shares and percentiles overall and per value of each ``group_by`` field."""
+        group_by = list(GROUP_FIELDS) if group_by is None else group_by
+        try:
+            started = time.perf_counter()
+            values, codes, labels = self.load_columns(group_by, batch_size)
+            loaded = time.perf_counter()
+            
+            count = len(values)
+            analytics = {
+                'portfolios': count,
+                'overall': self.aggregate(values, np.zeros(count, dtype=np.intp), ['all']).get('all'),
+                'groups': {field: self.aggregate(values, codes[field], labels[field]) for field in group_by}
+            }
+            
+            logger.info(f"Aggregated {count} portfolios (load {loaded - started:.3f}s, "
+                        f"aggregate {time.perf_counter() - loaded:.3f}s)")
+            return analytics
+            
+        except Exception as e:
+            logger.error(f"Error computing portfolio analytics: {e}")
+            raise
+
+portfolio_analytics = PortfolioAnalytics()
@@ -0,0 +1,91 @@
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+METADATA_FIELDS = ('id', 'format', 'method', 'path', 'route', 'status', 'duration_ms', 'created_at')
+
+class ProfileStore:
+    """Captured request profiles, kept in Redis for ``ttl`` seconds so any worker can serve them.
+    
+    A profile is a hash of its metadata and ``data``: marshalled pstats for
+    cProfile captures (the format ``pstats`` and snakeviz load), or an HTML
+    report for sampling captures.  Only the newest ``max_profiles`` are
+    listed.
+    """
+    
+    def __init__(self, ttl: int = 3600, max_profiles: int = 100):
+        self.profile_prefix = "profile:"
+        self.recent_key = "profiles:recent"
+        self.ttl = ttl
+        self.max_profiles = max_profiles
+    
+    def save(self, data: bytes, metadata: Dict[str, Any]) -> str:
+        """Store a profile and return its ID."""
+        try:
+            profile_id = f"prof_{uuid.uuid4().hex[:12]}"
+            now = time.time()
+            key = f"{self.profile_prefix}{profile_id}"
+            
+            pipe = redis_service.pipeline()
+            pipe.hset(key, mapping={**metadata, 'id': profile_id, 'created_at': now, 'data': data})
+            pipe.expire(key, self.ttl)
+            pipe.zadd(self.recent_key, {profile_id: now})
+            pipe.zremrangebyscore(self.recent_key, '-inf', now - self.ttl)
+            pipe.zremrangebyrank(self.recent_key, 0, -self.max_profiles - 1)
+            pipe.execute()
+            return profile_id
+            
+        except Exception as e:
+            logger.error(f"Error saving profile: {e}")
+            raise
+    
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata and ``data`` (bytes) of a profile, None once it has expired."""
+        try:
+            fields = redis_service.execute_raw('HGETALL', f"{self.profile_prefix}{profile_id}")
+            if not fields:
+                return None
+            profile = {key.decode('utf-8'): value for key, value in fields.items()}
+            data = profile.pop('data', b'')
+            return {**self._metadata(profile), 'data': data}
+            
+        except Exception as e:
+            logger.error(f"Error getting profile {profile_id}: {e}")
+            raise
+    
+    def list_recent(self) -> List[Dict[str, Any]]:
+        """Metadata of the stored profiles, newest first."""
+        try:
+            profile_ids = redis_service.client.zrevrange(self.recent_key, 0, self.max_profiles - 1)
+            pipe = redis_service.pipeline()
+            for profile_id in profile_ids:
+                pipe.hmget(f"{self.profile_prefix}{profile_id}", METADATA_FIELDS)
+            return [
+                self._metadata(dict(zip(METADATA_FIELDS, values)))
+                for values in (pipe.execute() if profile_ids else [])
+                if values[0] is not None
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error listing profiles: {e}")
+            raise
+    
+    def _metadata(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = {
+            field: value.decode('utf-8') if isinstance(value, bytes) else value
+            for field, value in fields.items()
+        }
+        for field, convert in (('status', int), ('duration_ms', float), ('created_at', float)):
+            if metadata.get(field) is not None:
+                metadata[field] = convert(metadata[field])
+        return metadata
+
+def create_profile_store() -> ProfileStore:
+    return ProfileStore(int(os.getenv('PROFILE_TTL', 3600)), int(os.getenv('PROFILE_MAX_STORED', 100)))
+
+profile_store = create_profile_store()
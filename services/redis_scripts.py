@@ -0,0 +1,466 @@
+"""Server-side Lua scripts used by RedisService.
+
+Every mutation of an individual stores, next to the record, a small JSON
+"refs" document describing every index entry the record owns.  The scripts
+below use it to remove stale index entries and add the new ones in the same
+atomic round trip as the record write, so the indexes never drift from the
+records and an industry change moves the member between index sets.
+Aggregate counters (hash fields bumped with HINCRBYFLOAT) are tracked the
+same way and reversed when the record changes or is deleted.  Each
+mutation also publishes the record key on INVALIDATION_CHANNEL so that
+in-process caches in every worker can drop it, and stamps the dataset
+generations (see touch_generations) used for HTTP conditional requests.
+Net worth changes are appended to a per-individual history and summed into
+per-period movers rankings in the same round trip (see record_history), and
+every mutation is appended to the change feed stream (see append_event).
+
+Index keys are derived from the refs document rather than passed in KEYS,
+so these scripts assume a single (non-cluster) Redis deployment.
+"""
+
+# Channel on which the keys of changed records are published for in-process caches
+INVALIDATION_CHANNEL = 'cache:invalidate'
+
+# Helpers shared by the individual mutation scripts.  Counter amounts are
+# passed as strings so large scores keep their precision.
+_REFS_HELPERS = """
+local function negate(amount)
+    if string.sub(amount, 1, 1) == '-' then
+        return string.sub(amount, 2)
+    end
+    return '-' .. amount
+end
+
+local function add_refs(refs, member)
+    for _, key in ipairs(refs.sets or {}) do
+        redis.call('SADD', key, member)
+    end
+    for _, entry in ipairs(refs.zsets or {}) do
+        redis.call('ZADD', entry[1], entry[2], entry[3] or member)
+    end
+    for _, entry in ipairs(refs.counters or {}) do
+        redis.call('HINCRBYFLOAT', entry[1], entry[2], entry[3])
+    end
+end
+
+-- Generations: one counter in the generations hash numbers every write; the
+-- 'global' field and each touched scope (record key, sorted set index or
+-- counter hash) are set to "<generation> <unix time>" of the latest write.
+local function touch_generations(key, scopes, now)
+    local stamp = redis.call('HINCRBY', key, 'counter', 1) .. ' ' .. now
+    local fields = {'global', stamp}
+    for scope in pairs(scopes) do
+        table.insert(fields, scope)
+        table.insert(fields, stamp)
+    end
+    redis.call('HSET', key, unpack(fields))
+end
+
+local function ref_scopes(refs, scopes)
+    for _, entry in ipairs(refs.zsets or {}) do
+        scopes[entry[1]] = true
+    end
+    for _, entry in ipairs(refs.counters or {}) do
+        scopes[entry[1]] = true
+    end
+    return scopes
+end
+
+local function remove_refs(refs, member)
+    for _, key in ipairs(refs.sets or {}) do
+        redis.call('SREM', key, member)
+    end
+    for _, entry in ipairs(refs.zsets or {}) do
+        redis.call('ZREM', entry[1], entry[3] or member)
+    end
+    for _, entry in ipairs(refs.counters or {}) do
+        local value = redis.call('HINCRBYFLOAT', entry[1], entry[2], negate(entry[3]))
+        if tonumber(value) == 0 then
+            redis.call('HDEL', entry[1], entry[2])
+        end
+    end
+end
+"""
+
+# Net worth history: ``history`` is {key, net_worth, max_points,
+# movers = {{deltas key, start values key, ttl}, ...}}.  A changed net worth
+# (read from the ranking before the write) appends "<time>:<net worth>" to the
+# capped history sorted set, scored by time, and adds the change to each
+# period's movers sorted set; the hash next to it keeps the net worth each
+# member started the period with.
+_HISTORY_HELPERS = """
+local function record_history(history, member, previous, now, scopes)
+    if previous and tonumber(previous) == tonumber(history.net_worth) then
+        return
+    end
+    redis.call('ZADD', history.key, now, now .. ':' .. history.net_worth)
+    redis.call('ZREMRANGEBYRANK', history.key, 0, -history.max_points - 1)
+    scopes[history.key] = true
+    if not previous then
+        return
+    end
+    local delta = string.format('%.17g', tonumber(history.net_worth) - tonumber(previous))
+    for _, bucket in ipairs(history.movers) do
+        redis.call('ZINCRBY', bucket[1], delta, member)
+        redis.call('HSETNX', bucket[2], member, previous)
+        redis.call('EXPIRE', bucket[1], bucket[3])
+        redis.call('EXPIRE', bucket[2], bucket[3])
+    end
+end
+"""
+
+# Change feed: ``event`` is {stream, maxlen, fields = {name, value, ...}}.
+# Each mutation appends one entry to the capped stream, so consumers see
+# every change in commit order.
+_EVENT_HELPERS = """
+local function append_event(event, kind, member, previous_worth)
+    local args = {'XADD', event.stream, 'MAXLEN', '~', event.maxlen, '*', 'type', kind, 'id', member}
+    if previous_worth then
+        table.insert(args, 'previous_net_worth')
+        table.insert(args, previous_worth)
+    end
+    for _, value in ipairs(event.fields) do
+        table.insert(args, value)
+    end
+    redis.call(unpack(args))
+end
+"""
+
+# KEYS[1] record key, KEYS[2] refs key, KEYS[3] generations hash, KEYS[4] net worth ranking
+# ARGV[1] 'create' or 'update', ARGV[2] payload ('' to only re-apply the
+# index entries of an existing record), ARGV[3] index member,
+# ARGV[4] new refs (JSON), ARGV[5] refs of the stored record when it predates
+# refs tracking ('' otherwise), ARGV[6] current unix time, ARGV[7] history
+# document (JSON, see record_history; '' to record none), ARGV[8] change feed
+# event (JSON, see append_event; '' to append none)
+# Returns 1 on success, 0 if the record already exists (create) or is missing (update).
+UPSERT_INDIVIDUAL = _REFS_HELPERS + _HISTORY_HELPERS + _EVENT_HELPERS + """
+local exists = redis.call('EXISTS', KEYS[1]) == 1
+if ARGV[1] == 'create' and exists then
+    return 0
+end
+if ARGV[1] == 'update' and not exists then
+    return 0
+end
+
+local scopes = {[KEYS[1]] = true}
+local history = ARGV[7] ~= '' and cjson.decode(ARGV[7])
+local previous_worth = redis.call('ZSCORE', KEYS[4], ARGV[3])
+local old_refs = redis.call('GET', KEYS[2])
+if not old_refs and ARGV[5] ~= '' then
+    old_refs = ARGV[5]
+end
+if old_refs then
+    old_refs = cjson.decode(old_refs)
+    remove_refs(old_refs, ARGV[3])
+    ref_scopes(old_refs, scopes)
+end
+
+if ARGV[2] ~= '' then
+    redis.call('SET', KEYS[1], ARGV[2])
+end
+redis.call('SET', KEYS[2], ARGV[4])
+local refs = cjson.decode(ARGV[4])
+add_refs(refs, ARGV[3])
+if history then
+    record_history(history, ARGV[3], previous_worth, ARGV[6], scopes)
+end
+if ARGV[8] ~= '' then
+    append_event(cjson.decode(ARGV[8]), ARGV[1] == 'create' and 'created' or 'updated', ARGV[3], previous_worth)
+end
+touch_generations(KEYS[3], ref_scopes(refs, scopes), ARGV[6])
+redis.call('PUBLISH', '""" + INVALIDATION_CHANNEL + """', KEYS[1])
+return 1
+"""
+
+# KEYS[1] record key, KEYS[2] refs key, KEYS[3] generations hash, KEYS[4] history key,
+# KEYS[5] net worth ranking
+# ARGV[1] index member, ARGV[2] refs of the stored record when it predates
+# refs tracking ('' otherwise), ARGV[3] current unix time, ARGV[4] change
+# feed event (JSON, see append_event; '' to append none)
+# Returns 1 on success, 0 if the record is missing, -1 if the record has no
+# refs and none were supplied.
+DELETE_INDIVIDUAL = _REFS_HELPERS + _EVENT_HELPERS + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+
+local refs = redis.call('GET', KEYS[2])
+if not refs then
+    if ARGV[2] == '' then
+        return -1
+    end
+    refs = ARGV[2]
+end
+
+refs = cjson.decode(refs)
+local previous_worth = redis.call('ZSCORE', KEYS[5], ARGV[1])
+remove_refs(refs, ARGV[1])
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[4])
+if ARGV[4] ~= '' then
+    append_event(cjson.decode(ARGV[4]), 'deleted', ARGV[1], previous_worth)
+end
+touch_generations(KEYS[3], ref_scopes(refs, {}), ARGV[3])
+redis.call('HDEL', KEYS[3], KEYS[1], KEYS[4])
+redis.call('PUBLISH', '""" + INVALIDATION_CHANNEL + """', KEYS[1])
+return 1
+"""
+
+# Stamps a write made outside the scripts above (statistics rebuilds, index repairs).
+# KEYS[1] generations hash, ARGV[1] current unix time, ARGV[2..] scopes
+TOUCH_GENERATIONS = _REFS_HELPERS + """
+local scopes = {}
+for i = 2, #ARGV do
+    scopes[ARGV[i]] = true
+end
+touch_generations(KEYS[1], scopes, ARGV[1])
+return 1
+"""
+
+# Portfolios are stored once under portfolio:<id> and found through a hash
+# mapping each individual to their portfolio ID.
+# KEYS[1] portfolio key, KEYS[2] portfolio index hash, KEYS[3] the
+# individual's legacy portfolio copy (also the key cached in-process),
+# KEYS[4] generations hash
+# ARGV[1] 'put' or 'migrate', ARGV[2] individual ID, ARGV[3] portfolio ID,
+# ARGV[4] payload, ARGV[5] portfolio key prefix, ARGV[6] current unix time,
+# ARGV[7] change feed event (JSON, see append_event; '' to append none)
+# A portfolio the individual held before is deleted.  'migrate' only moves a
+# legacy copy that still exists.
+# Returns 1 on success, 0 if there was nothing to migrate.
+PUT_PORTFOLIO = _REFS_HELPERS + _EVENT_HELPERS + """
+if ARGV[1] == 'migrate' and redis.call('EXISTS', KEYS[3]) == 0 then
+    return 0
+end
+
+local previous = redis.call('HGET', KEYS[2], ARGV[2])
+if previous and previous ~= ARGV[3] then
+    redis.call('DEL', ARGV[5] .. previous)
+end
+redis.call('SET', KEYS[1], ARGV[4])
+redis.call('HSET', KEYS[2], ARGV[2], ARGV[3])
+redis.call('DEL', KEYS[3])
+if ARGV[7] ~= '' then
+    append_event(cjson.decode(ARGV[7]), 'portfolio', ARGV[2])
+end
+touch_generations(KEYS[4], {}, ARGV[6])
+redis.call('PUBLISH', '""" + INVALIDATION_CHANNEL + """', KEYS[3])
+return 1
+"""
+
+# KEYS[1] portfolio index hash, KEYS[2] the individual's legacy portfolio copy
+# ARGV[1] individual ID, ARGV[2] portfolio key prefix
+# Returns the individual's portfolio, read from the legacy copy until
+# scripts/migrate_portfolios.py has run; nil if they have none.
+INDIVIDUAL_PORTFOLIO = """
+local portfolio_id = redis.call('HGET', KEYS[1], ARGV[1])
+if portfolio_id then
+    return redis.call('GET', ARGV[2] .. portfolio_id)
+end
+return redis.call('GET', KEYS[2])
+"""
+
+# Used by scripts/migrate_codec.py.
+# KEYS[1] key, ARGV[1] value read by the migration, ARGV[2] rewritten value
+# Returns 1 if replaced, 0 if the key changed (or vanished) since it was read.
+REPLACE_VALUE = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+return 1
+"""
+
+# KEYS[1] set or sorted set, ARGV[1] 'set' or 'zset', then pairs of
+# (old member, new member).  A member removed since it was scanned is skipped
+# rather than re-added; sorted set members keep their score.
+# Returns the number of members renamed.
+RENAME_MEMBERS = """
+local renamed = 0
+for i = 2, #ARGV, 2 do
+    if ARGV[1] == 'set' then
+        if redis.call('SREM', KEYS[1], ARGV[i]) == 1 then
+            redis.call('SADD', KEYS[1], ARGV[i + 1])
+            renamed = renamed + 1
+        end
+    else
+        local score = redis.call('ZSCORE', KEYS[1], ARGV[i])
+        if score then
+            redis.call('ZREM', KEYS[1], ARGV[i])
+            redis.call('ZADD', KEYS[1], score, ARGV[i + 1])
+            renamed = renamed + 1
+        end
+    end
+end
+return renamed
+"""
+
+# KEYS[1] ranking sorted set, ARGV[1] member
+# Returns false if the member is not ranked, else {score, members with a
+# strictly higher score, members with a lower or equal score, cardinality},
+# so ties share a rank.
+WEALTH_RANK = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not score then
+    return false
+end
+return {
+    score,
+    redis.call('ZCOUNT', KEYS[1], '(' .. score, '+inf'),
+    redis.call('ZCOUNT', KEYS[1], '-inf', score),
+    redis.call('ZCARD', KEYS[1])
+}
+"""
+
+# Listing pages.  A page starts right after ``anchor``, the last member of
+# the previous page, while it is still in the index with the score it was
+# read with, so inserts and deletes ahead of it do not shift the page;
+# otherwise (first page, anchor moved or removed) it starts at ``start``.
+# Returns {members (with scores when asked), start of the page, cardinality,
+# score of the last member (false on an empty page)}.
+_PAGE_HELPERS = """
+local function page_after(key, start, count, anchor, anchor_score, ascending, withscores)
+    start = tonumber(start)
+    if anchor ~= '' and redis.call('ZSCORE', key, anchor) == anchor_score then
+        if ascending then
+            start = redis.call('ZRANK', key, anchor) + 1
+        else
+            start = redis.call('ZREVRANK', key, anchor) + 1
+        end
+    end
+    local args = {ascending and 'ZRANGE' or 'ZREVRANGE', key, start, start + tonumber(count) - 1}
+    if withscores then
+        table.insert(args, 'WITHSCORES')
+    end
+    local page = redis.call(unpack(args))
+    local last_score = false
+    if #page > 0 then
+        last_score = withscores and page[#page] or redis.call('ZSCORE', key, page[#page])
+    end
+    return {page, start, redis.call('ZCARD', key), last_score}
+end
+"""
+
+# KEYS[1] sort index
+# ARGV[1] start, ARGV[2] page size, ARGV[3] anchor member ('' for none),
+# ARGV[4] anchor score, ARGV[5] 'asc' or 'desc', ARGV[6] '1' to return scores
+# Returns the page as described for page_after.
+LISTING_PAGE = _PAGE_HELPERS + """
+return page_after(KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5] == 'asc', ARGV[6] == '1')
+"""
+
+# KEYS[1] cache key, KEYS[2] sort index, KEYS[3..] filter sets
+# ARGV[1] cache TTL in seconds, ARGV[2] start, ARGV[3] page size,
+# ARGV[4] anchor member ('' for none), ARGV[5] anchor score
+# Intersects the filter sets with the sort index (keeping the sort scores)
+# into the cache key unless a live copy exists, then returns its page,
+# highest score first, as described for page_after.
+FILTER_PAGE = _PAGE_HELPERS + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    local args = {'ZINTERSTORE', KEYS[1], #KEYS - 1}
+    for i = 2, #KEYS do
+        table.insert(args, KEYS[i])
+    end
+    table.insert(args, 'WEIGHTS')
+    table.insert(args, 1)
+    for i = 3, #KEYS do
+        table.insert(args, 0)
+    end
+    redis.call(unpack(args))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return page_after(KEYS[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5], false, false)
+"""
+
+# KEYS[1] ranking sorted set
+# ARGV[1] number of entries, ARGV[2] record key prefix ('' to skip the records)
+# Returns {member, score, record, ...} for the top entries, highest score
+# first; record is nil when the member has no record or records are skipped.
+RANKED_RECORDS = """
+local ranked = redis.call('ZREVRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1, 'WITHSCORES')
+local result = {}
+for i = 1, #ranked, 2 do
+    table.insert(result, ranked[i])
+    table.insert(result, ranked[i + 1])
+    if ARGV[2] == '' then
+        table.insert(result, false)
+    else
+        table.insert(result, redis.call('GET', ARGV[2] .. ranked[i]))
+    end
+end
+return result
+"""
+
+# KEYS[1] history sorted set
+# ARGV[1] min and ARGV[2] max unix time, ARGV[3] bucket width in seconds
+# Downsamples the history within the window to one row per bucket:
+# {bucket start, first, lowest, highest, last, points, ...}, oldest first.
+# Values are returned as strings so they keep their precision.
+HISTORY_BUCKETS = """
+local entries = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+local width = tonumber(ARGV[3])
+local result = {}
+local bucket, first, lowest, highest, last, points
+local function flush()
+    if bucket then
+        for _, value in ipairs({string.format('%d', bucket), first, lowest, highest, last}) do
+            table.insert(result, value)
+        end
+        table.insert(result, points)
+    end
+end
+for i = 1, #entries, 2 do
+    local value = string.sub(entries[i], string.find(entries[i], ':', 1, true) + 1)
+    local start = math.floor(tonumber(entries[i + 1]) / width) * width
+    if start ~= bucket then
+        flush()
+        bucket, first, lowest, highest, points = start, value, value, value, 0
+    end
+    if tonumber(value) < tonumber(lowest) then
+        lowest = value
+    end
+    if tonumber(value) > tonumber(highest) then
+        highest = value
+    end
+    last = value
+    points = points + 1
+end
+flush()
+return result
+"""
+
+# KEYS[1] movers sorted set, KEYS[2] start values hash
+# ARGV[1] 'gainers' or 'losers', ARGV[2] number of entries
+# Returns {member, change, start value, ...}, largest change in the
+# requested direction first; members that did not move that way are left out.
+MOVERS = """
+local moved
+if ARGV[1] == 'gainers' then
+    moved = redis.call('ZREVRANGEBYSCORE', KEYS[1], '+inf', '(0', 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+else
+    moved = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', '(0', 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+end
+local result = {}
+for i = 1, #moved, 2 do
+    table.insert(result, moved[i])
+    table.insert(result, moved[i + 1])
+    table.insert(result, redis.call('HGET', KEYS[2], moved[i]) or false)
+end
+return result
+"""
+
+SCRIPTS = {
+    'upsert_individual': UPSERT_INDIVIDUAL,
+    'delete_individual': DELETE_INDIVIDUAL,
+    'touch_generations': TOUCH_GENERATIONS,
+    'put_portfolio': PUT_PORTFOLIO,
+    'individual_portfolio': INDIVIDUAL_PORTFOLIO,
+    'replace_value': REPLACE_VALUE,
+    'rename_members': RENAME_MEMBERS,
+    'wealth_rank': WEALTH_RANK,
+    'listing_page': LISTING_PAGE,
+    'filter_page': FILTER_PAGE,
+    'ranked_records': RANKED_RECORDS,
+    'history_buckets': HISTORY_BUCKETS,
+    'movers': MOVERS,
+}
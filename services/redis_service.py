@@ -1,19 +1,233 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import os
+import re
+import sys
+import time
+import warnings
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import redis
+from redis.client import NEVER_DECODE, Pipeline
+from redis.exceptions import NoScriptError
 from config.redis_config import redis_config
+from services.codecs import create_value_codec
+from services.metrics import (
+    metrics, redis_blocking_wait, redis_command_duration, redis_command_errors, redis_pipeline_size
+)
+from services.redis_scripts import SCRIPTS
 
 logger = logging.getLogger(__name__)
 
+# SHA -> script name, so EVALSHA timings are reported per script
+SCRIPT_NAMES: Dict[str, str] = {}
+# Key segments holding an ID (ind_<hex>, which may have no digit), date or other number are reported as '*'
+_VARIABLE_SEGMENT = re.compile(r'[^:]*\d[^:]*|(?<![^:])[a-z]+_[0-9a-f]{8,}(?![^:])')
+# Commands whose first argument is not a key
+_KEYLESS_COMMANDS = frozenset(('SCRIPT LOAD', 'PING', 'INFO', 'FLUSHDB', 'DBSIZE', 'SCAN', 'SELECT', 'CLIENT SETNAME'))
+# Frames in these files are skipped when looking for the caller of a slow command
+_CLIENT_FILES = (os.path.dirname(redis.__file__), __file__)
+
+# Stream reads that wait for new entries; redis-py sends the option as bytes
+_BLOCKING_READS = frozenset(('XREAD', 'XREADGROUP'))
+_BLOCK_OPTIONS = (b'BLOCK', 'BLOCK')
+
+def _command_label(args: tuple) -> str:
+    """Metric label of a command: scripts by name, and blocking stream reads as e.g. 'XREAD BLOCK'."""
+    command = str(args[0]).upper()
+    if command == 'EVALSHA' and len(args) > 1:
+        return f"EVALSHA {SCRIPT_NAMES.get(args[1], 'unknown')}"
+    if command in _BLOCKING_READS and any(option in args for option in _BLOCK_OPTIONS):
+        return f"{command} BLOCK"
+    return command
+
+def _key_pattern(args: tuple) -> Optional[str]:
+    """First key of a command, with its variable segments replaced by '*'."""
+    command = str(args[0]).upper()
+    if command in _KEYLESS_COMMANDS:
+        return None
+    if command in ('EVALSHA', 'EVAL'):
+        key = args[3] if len(args) > 3 and int(args[2]) > 0 else None
+    elif command in _BLOCKING_READS:
+        streams = [index for index, arg in enumerate(args) if arg in (b'STREAMS', 'STREAMS')]
+        key = args[streams[0] + 1] if streams else None
+    else:
+        key = args[1] if len(args) > 1 else None
+    if key is None:
+        return None
+    if isinstance(key, bytes):
+        key = key.decode('utf-8', 'replace')
+    return _VARIABLE_SEGMENT.sub('*', str(key))
+
+def _argument_bytes(args: tuple) -> int:
+    return sum(len(arg) if isinstance(arg, (bytes, str)) else len(str(arg)) for arg in args[1:])
+
+def _caller() -> Optional[str]:
+    """The WealthService method (or failing that, the first frame outside the client) behind a command."""
+    frame = sys._getframe(2)
+    outside = None
+    while frame is not None:
+        instance = frame.f_locals.get('self')
+        if type(instance).__name__ in ('WealthService', 'AsyncWealthService'):
+            return f"{type(instance).__name__}.{frame.f_code.co_name}"
+        if outside is None and not frame.f_code.co_filename.startswith(_CLIENT_FILES + ('<',)):
+            outside = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return outside
+
+class SlowOperationLog:
+    """Commands and pipelines whose round trip took at least ``threshold_ms``.
+    
+    Each one is logged at WARNING with its key pattern, argument size and
+    caller, and the last ``size`` are kept for /debug/slow-operations.
+    Nothing is computed for commands under the threshold.
+    """
+    
+    def __init__(self, threshold_ms: float = 100, size: int = 100):
+        self.threshold = threshold_ms / 1000
+        self.entries: deque = deque(maxlen=size)
+        self.slow_operations = metrics.counter(
+            'redis_slow_operations_total', 'Redis commands and pipelines over REDIS_SLOW_LOG_MS', ['command']
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+    
+    def record(self, label: str, elapsed: float, commands: List[tuple]) -> None:
+        patterns = list(dict.fromkeys(pattern for pattern in map(_key_pattern, commands) if pattern))
+        entry = {
+            'command': label,
+            'duration_ms': round(elapsed * 1000, 3),
+            'commands': len(commands),
+            'key_patterns': patterns[:5],
+            'argument_bytes': sum(map(_argument_bytes, commands)),
+            'caller': _caller(),
+            'at': time.time()
+        }
+        self.entries.append(entry)
+        self.slow_operations.inc(label)
+        logger.warning(
+            f"Slow Redis {label} ({entry['duration_ms']}ms, {entry['commands']} commands, "
+            f"{entry['argument_bytes']} argument bytes) on {', '.join(entry['key_patterns']) or 'no key'} "
+            f"from {entry['caller']}"
+        )
+    
+    def recent(self) -> List[Dict[str, Any]]:
+        return list(reversed(self.entries))
+
+slow_log = SlowOperationLog(float(os.getenv('REDIS_SLOW_LOG_MS', 100)), int(os.getenv('REDIS_SLOW_LOG_SIZE', 100)))
+
+def _record_round_trip(label: str, started: float, commands: List[tuple], error: Optional[Exception]) -> None:
+    # A blocking read lasts as long as it waits for entries, so its time says nothing about Redis
+    # latency: it goes to its own histogram and never to the slow log
+    blocking = label.endswith(' BLOCK')
+    elapsed = time.perf_counter() - started
+    if not blocking and slow_log.enabled and elapsed >= slow_log.threshold:
+        slow_log.record(label, elapsed, commands)
+    if not metrics.enabled:
+        return
+    (redis_blocking_wait if blocking else redis_command_duration).observe(elapsed, label)
+    if error is not None:
+        redis_command_errors.inc(label, type(error).__name__)
+    scope = metrics.current_request()
+    if scope is not None:
+        scope.round_trips += 1
+        scope.commands += len(commands)
+
+class InstrumentedPipeline(Pipeline):
+    """Pipeline whose ``execute`` is timed as one round trip, labelled PIPELINE or MULTI."""
+    
+    def execute(self, raise_on_error=True):
+        if not self.command_stack:
+            return super().execute(raise_on_error)
+        commands = [args for args, _ in self.command_stack]
+        label = 'MULTI' if self.transaction else 'PIPELINE'
+        started = time.perf_counter()
+        error = None
+        try:
+            return super().execute(raise_on_error)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _record_round_trip(label, started, commands, error)
+            if metrics.enabled:
+                redis_pipeline_size.observe(len(commands))
+
+class InstrumentedRedis(redis.Redis):
+    """Client that times every command and pipeline into the metrics registry and slow log.
+    
+    The cost per command is two clock reads, a bucket lookup and a counter
+    increment; nothing is logged unless the command is slow.  Commands run
+    while a request is being handled are also added to that request's
+    round trip count.
+    """
+    
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        error = None
+        try:
+            return super().execute_command(*args, **options)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _record_round_trip(_command_label(args), started, [args], error)
+    
+    def pipeline(self, transaction=True, shard_hint=None) -> InstrumentedPipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
 class RedisService:
     def __init__(self):
-        self.client = redis_config.get_client()
         self.default_ttl = 3600  # 1 hour in seconds
+        self.batch_size = int(os.getenv('REDIS_BATCH_SIZE', 500))
+        self.codec = create_value_codec()
+        self.script_shas: Dict[str, str] = {}
+        self.slow_log = slow_log
+        if metrics.enabled or slow_log.enabled:
+            redis_config.use_client_class(InstrumentedRedis)
+        self.load_scripts()
+    
+    @property
+    def client(self):
+        # Resolved on every use so that a forked worker picks up its own connection pool
+        return redis_config.get_client()
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        return redis_config.pool_stats()
+    
+    # Serialization helpers
+    def encode_value(self, value: Any) -> bytes:
+        """Serialize a value the way ``set`` stores it (tagged with the REDIS_CODEC format)."""
+        return self.codec.encode(value)
+    
+    def encode_member(self, member: Any) -> str:
+        """Set/sorted-set members are stored as raw strings."""
+        return str(member)
+    
+    def decode_member(self, member: str) -> Any:
+        """Inverse of ``encode_member``, for members read through a raw pipeline.
+        
+        Members written before raw storage are JSON strings; they are still
+        read correctly until scripts/migrate_codec.py rewrites them.
+        """
+        if member[:1] == '"':
+            return json.loads(member)
+        return member
+    
+    def decode_value(self, value: Optional[Union[bytes, str]]) -> Optional[Any]:
+        """Inverse of ``encode_value`` for any codec tag or legacy JSON; missing values stay None."""
+        return self.codec.decode(value)
+    
+    def execute_raw(self, *args) -> Any:
+        """Run a command and return its reply undecoded (bytes), so binary codecs survive decode_responses."""
+        return self.client.execute_command(*args, **{NEVER_DECODE: True})
     
     # Basic Key-Value operations
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         try:
-            serialized_value = json.dumps(value)
+            serialized_value = self.encode_value(value)
             if ttl:
                 return self.client.setex(key, ttl, serialized_value)
             else:
@@ -24,12 +238,32 @@ class RedisService:
     
     def get(self, key: str) -> Optional[Any]:
         try:
-            value = self.client.get(key)
-            return json.loads(value) if value else None
+            value = self.execute_raw('GET', key)
+            return self.decode_value(value)
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
             raise
     
+    def mget(self, keys: List[str], chunk_size: Optional[int] = None) -> List[Optional[Any]]:
+        """Fetch many keys with one MGET round trip per chunk.
+        
+        Results are returned in the same order as ``keys``; missing keys
+        come back as ``None``.
+        """
+        chunk_size = chunk_size or self.batch_size
+        values = []
+        try:
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                values.extend(
+                    self.decode_value(value)
+                    for value in self.execute_raw('MGET', *chunk)
+                )
+            return values
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            raise
+    
     def delete(self, key: str) -> bool:
         try:
             return bool(self.client.delete(key))
@@ -47,7 +281,7 @@ class RedisService:
     # Hash operations
     def hset(self, key: str, field: str, value: Any) -> bool:
         try:
-            serialized_value = json.dumps(value)
+            serialized_value = self.encode_value(value)
             return bool(self.client.hset(key, field, serialized_value))
         except Exception as e:
             logger.error(f"Redis HSET error for key {key}, field {field}: {e}")
@@ -55,20 +289,37 @@ class RedisService:
     
     def hget(self, key: str, field: str) -> Optional[Any]:
         try:
-            value = self.client.hget(key, field)
-            return json.loads(value) if value else None
+            value = self.execute_raw('HGET', key, field)
+            return self.decode_value(value)
         except Exception as e:
             logger.error(f"Redis HGET error for key {key}, field {field}: {e}")
             raise
     
     def hgetall(self, key: str) -> Dict[str, Any]:
         try:
-            result = self.client.hgetall(key)
-            return {k: json.loads(v) for k, v in result.items()}
+            result = self.execute_raw('HGETALL', key)
+            return {k.decode('utf-8'): self.decode_value(v) for k, v in result.items()}
         except Exception as e:
             logger.error(f"Redis HGETALL error for key {key}: {e}")
             raise
     
+    def hscan_batches(self, key: str, count: Optional[int] = None,
+                      match: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Walk a hash incrementally with HSCAN, yielding batches of decoded fields."""
+        count = count or self.batch_size
+        cursor = 0
+        try:
+            while True:
+                cursor, fields = self.execute_raw('HSCAN', key, cursor, *self._scan_args(match, count))
+                cursor = int(cursor)
+                if fields:
+                    yield {field.decode('utf-8'): self.decode_value(value) for field, value in fields.items()}
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.error(f"Redis HSCAN error for key {key}: {e}")
+            raise
+    
     def hdel(self, key: str, field: str) -> bool:
         try:
             return bool(self.client.hdel(key, field))
@@ -79,7 +330,7 @@ class RedisService:
     # Set operations
     def sadd(self, key: str, *members: Any) -> int:
         try:
-            serialized_members = [json.dumps(member) for member in members]
+            serialized_members = [self.encode_member(member) for member in members]
             return self.client.sadd(key, *serialized_members)
         except Exception as e:
             logger.error(f"Redis SADD error for key {key}: {e}")
@@ -88,23 +339,50 @@ class RedisService:
     def smembers(self, key: str) -> List[Any]:
         try:
             members = self.client.smembers(key)
-            return [json.loads(member) for member in members]
+            return [self.decode_member(member) for member in members]
         except Exception as e:
             logger.error(f"Redis SMEMBERS error for key {key}: {e}")
             raise
     
+    def sscan_batches(self, key: str, count: Optional[int] = None,
+                      match: Optional[str] = None) -> Iterator[List[Any]]:
+        """Walk a set incrementally with SSCAN, yielding one decoded batch per call.
+        
+        Members may be repeated if the set is resized while it is walked.
+        """
+        count = count or self.batch_size
+        cursor = 0
+        try:
+            while True:
+                cursor, members = self.client.sscan(key, cursor, match=match, count=count)
+                if members:
+                    yield [self.decode_member(member) for member in members]
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.error(f"Redis SSCAN error for key {key}: {e}")
+            raise
+    
     def srem(self, key: str, *members: Any) -> int:
         try:
-            serialized_members = [json.dumps(member) for member in members]
+            serialized_members = [self.encode_member(member) for member in members]
             return self.client.srem(key, *serialized_members)
         except Exception as e:
             logger.error(f"Redis SREM error for key {key}: {e}")
             raise
     
+    def sinter(self, *keys: str) -> List[Any]:
+        try:
+            members = self.client.sinter(*keys)
+            return [self.decode_member(member) for member in members]
+        except Exception as e:
+            logger.error(f"Redis SINTER error for keys {keys}: {e}")
+            raise
+    
     # Sorted Set operations
     def zadd(self, key: str, mapping: Dict[Any, float]) -> int:
         try:
-            serialized_mapping = {json.dumps(member): score for member, score in mapping.items()}
+            serialized_mapping = {self.encode_member(member): score for member, score in mapping.items()}
             return self.client.zadd(key, serialized_mapping)
         except Exception as e:
             logger.error(f"Redis ZADD error for key {key}: {e}")
@@ -114,9 +392,9 @@ class RedisService:
         try:
             result = self.client.zrange(key, start, stop, withscores=withscores)
             if withscores:
-                return [(json.loads(member), score) for member, score in result]
+                return [(self.decode_member(member), score) for member, score in result]
             else:
-                return [json.loads(member) for member in result]
+                return [self.decode_member(member) for member in result]
         except Exception as e:
             logger.error(f"Redis ZRANGE error for key {key}: {e}")
             raise
@@ -125,16 +403,39 @@ class RedisService:
         try:
             result = self.client.zrevrange(key, start, stop, withscores=withscores)
             if withscores:
-                return [(json.loads(member), score) for member, score in result]
+                return [(self.decode_member(member), score) for member, score in result]
             else:
-                return [json.loads(member) for member in result]
+                return [self.decode_member(member) for member in result]
         except Exception as e:
             logger.error(f"Redis ZREVRANGE error for key {key}: {e}")
             raise
     
+    def zcount(self, key: str, min_score: Union[float, str], max_score: Union[float, str]) -> int:
+        try:
+            return self.client.zcount(key, min_score, max_score)
+        except Exception as e:
+            logger.error(f"Redis ZCOUNT error for key {key}: {e}")
+            raise
+    
+    def zscan_batches(self, key: str, count: Optional[int] = None,
+                      match: Optional[str] = None) -> Iterator[List[Tuple[Any, float]]]:
+        """Walk a sorted set incrementally with ZSCAN, yielding (member, score) batches in no particular order."""
+        count = count or self.batch_size
+        cursor = 0
+        try:
+            while True:
+                cursor, entries = self.client.zscan(key, cursor, match=match, count=count)
+                if entries:
+                    yield [(self.decode_member(member), score) for member, score in entries]
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.error(f"Redis ZSCAN error for key {key}: {e}")
+            raise
+    
     def zrem(self, key: str, *members: Any) -> int:
         try:
-            serialized_members = [json.dumps(member) for member in members]
+            serialized_members = [self.encode_member(member) for member in members]
             return self.client.zrem(key, *serialized_members)
         except Exception as e:
             logger.error(f"Redis ZREM error for key {key}: {e}")
@@ -143,7 +444,7 @@ class RedisService:
     # List operations
     def lpush(self, key: str, *values: Any) -> int:
         try:
-            serialized_values = [json.dumps(value) for value in values]
+            serialized_values = [self.encode_value(value) for value in values]
             return self.client.lpush(key, *serialized_values)
         except Exception as e:
             logger.error(f"Redis LPUSH error for key {key}: {e}")
@@ -151,7 +452,7 @@ class RedisService:
     
     def rpush(self, key: str, *values: Any) -> int:
         try:
-            serialized_values = [json.dumps(value) for value in values]
+            serialized_values = [self.encode_value(value) for value in values]
             return self.client.rpush(key, *serialized_values)
         except Exception as e:
             logger.error(f"Redis RPUSH error for key {key}: {e}")
@@ -159,20 +460,93 @@ class RedisService:
     
     def lrange(self, key: str, start: int, stop: int) -> List[Any]:
         try:
-            values = self.client.lrange(key, start, stop)
-            return [json.loads(value) for value in values]
+            values = self.execute_raw('LRANGE', key, start, stop)
+            return [self.decode_value(value) for value in values]
         except Exception as e:
             logger.error(f"Redis LRANGE error for key {key}: {e}")
             raise
     
-    # Key pattern matching
-    def keys(self, pattern: str) -> List[str]:
+    # Keyspace iteration
+    def _scan_args(self, match: Optional[str], count: int) -> List[Any]:
+        args = ['MATCH', match] if match else []
+        return args + ['COUNT', count]
+    
+    def scan_batches(self, match: Optional[str] = None, count: Optional[int] = None,
+                     key_type: Optional[str] = None) -> Iterator[List[str]]:
+        """Walk the keyspace incrementally with SCAN, yielding one batch of key names per call.
+        
+        Unlike KEYS this never blocks the server for long.  ``count`` is a
+        hint for the work done per call, so batches vary in size (and may be
+        filtered down to nothing by ``match``/``key_type``, in which case none
+        is yielded).  Keys may be repeated if the keyspace is resized while it
+        is walked.
+        """
+        count = count or self.batch_size
+        cursor = 0
+        try:
+            while True:
+                cursor, keys = self.client.scan(cursor, match=match, count=count, _type=key_type)
+                if keys:
+                    yield keys
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.error(f"Redis SCAN error for pattern {match}: {e}")
+            raise
+    
+    def scan_values(self, match: str, count: Optional[int] = None) -> Iterator[List[Tuple[str, Any]]]:
+        """Walk the string keys matching ``match`` and fetch each batch with one MGET.
+        
+        Yields (key, decoded value) pairs; keys deleted between SCAN and MGET
+        are skipped.
+        """
         try:
-            return self.client.keys(pattern)
+            for keys in self.scan_batches(match, count, key_type='string'):
+                values = self.execute_raw('MGET', *keys)
+                batch = [(key, self.decode_value(value)) for key, value in zip(keys, values) if value is not None]
+                if batch:
+                    yield batch
         except Exception as e:
-            logger.error(f"Redis KEYS error for pattern {pattern}: {e}")
+            logger.error(f"Redis SCAN/MGET error for pattern {match}: {e}")
             raise
     
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete keys with UNLINK (memory is reclaimed in the background), one call per batch."""
+        deleted = 0
+        try:
+            for start in range(0, len(keys), self.batch_size):
+                deleted += self.client.unlink(*keys[start:start + self.batch_size])
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis UNLINK error for {len(keys)} keys: {e}")
+            raise
+    
+    def delete_matching(self, match: str, count: Optional[int] = None) -> int:
+        """Delete every key matching ``match``, pipelining one UNLINK per SCAN batch."""
+        deleted = 0
+        try:
+            pipe = self.pipeline()
+            for keys in self.scan_batches(match, count):
+                pipe.unlink(*keys)
+                if len(pipe) >= 10:
+                    deleted += sum(pipe.execute())
+            if len(pipe):
+                deleted += sum(pipe.execute())
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis UNLINK error for pattern {match}: {e}")
+            raise
+    
+    def keys(self, pattern: str) -> List[str]:
+        """Deprecated: collects ``scan_batches(pattern)`` into a list.
+        
+        KEYS blocks the whole server while it walks the keyspace, so it is
+        no longer issued; iterate ``scan_batches`` instead of materializing
+        every matching key.
+        """
+        warnings.warn("RedisService.keys() is deprecated, use scan_batches()", DeprecationWarning, stacklevel=2)
+        return list({key for batch in self.scan_batches(pattern) for key in batch})
+    
     # TTL operations
     def expire(self, key: str, ttl: int) -> bool:
         try:
@@ -188,6 +562,61 @@ class RedisService:
             logger.error(f"Redis TTL error for key {key}: {e}")
             raise
     
+    # Pipelines
+    def pipeline(self, transaction: bool = False):
+        """Return a raw client pipeline for callers batching several commands in one round trip."""
+        return self.client.pipeline(transaction=transaction)
+    
+    # Lua scripts
+    def load_scripts(self) -> None:
+        """Register every script in SCRIPTS with SCRIPT LOAD and remember its SHA."""
+        try:
+            for name, source in SCRIPTS.items():
+                self.script_shas[name] = self.client.script_load(source)
+                SCRIPT_NAMES[self.script_shas[name]] = name
+        except Exception as e:
+            logger.error(f"Redis SCRIPT LOAD error: {e}")
+            raise
+    
+    def evalsha(self, name: str, keys: List[str], args: List[Any], raw: bool = False) -> Any:
+        """Run a registered script by SHA, reloading the scripts once if the server lost them.
+        
+        ``raw`` returns the reply undecoded, for scripts that return stored values.
+        """
+        options = {NEVER_DECODE: True} if raw else {}
+        try:
+            try:
+                return self.client.execute_command('EVALSHA', self.script_shas[name], len(keys), *keys, *args, **options)
+            except NoScriptError:
+                logger.warning(f"Script {name} missing from Redis script cache, reloading")
+                self.load_scripts()
+                return self.client.execute_command('EVALSHA', self.script_shas[name], len(keys), *keys, *args, **options)
+        except Exception as e:
+            logger.error(f"Redis EVALSHA error for script {name}: {e}")
+            raise
+    
+    def evalsha_many(self, name: str, calls: List[Tuple[List[str], List[Any]]]) -> List[Any]:
+        """Run a registered script once per (keys, args) pair in a single pipelined round trip.
+        
+        The batch is retried once after reloading the scripts on NOSCRIPT, so the
+        script must be safe to re-run for the same arguments.
+        """
+        try:
+            for attempt in range(2):
+                pipe = self.client.pipeline(transaction=False)
+                for keys, args in calls:
+                    pipe.evalsha(self.script_shas[name], len(keys), *keys, *args)
+                try:
+                    return pipe.execute()
+                except NoScriptError:
+                    if attempt:
+                        raise
+                    logger.warning(f"Script {name} missing from Redis script cache, reloading")
+                    self.load_scripts()
+        except Exception as e:
+            logger.error(f"Redis EVALSHA error for {len(calls)} calls of script {name}: {e}")
+            raise
+    
     # Database operations
     def flushdb(self) -> bool:
         try:
@@ -196,6 +625,13 @@ class RedisService:
             logger.error(f"Redis FLUSHDB error: {e}")
             raise
     
+    def publish(self, channel: str, message: str) -> int:
+        try:
+            return self.client.publish(channel, message)
+        except Exception as e:
+            logger.error(f"Redis PUBLISH error for channel {channel}: {e}")
+            raise
+    
     def info(self) -> Dict[str, Any]:
         try:
             return self.client.info()
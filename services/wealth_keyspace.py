@@ -0,0 +1,775 @@
+import base64
+import hashlib
+import json
+import math
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from models.wealthy_individual import WealthyIndividual
+from models.portfolio import Portfolio
+from services.redis_scripts import INVALIDATION_CHANNEL
+from services.redis_service import redis_service
+
+class WealthKeyspace:
+    """Key layout of the wealth data and the pure helpers built on it.
+    
+    WealthService and AsyncWealthService both derive from this class, so
+    the script calls, cursors, listing plans and result decoding they send
+    and read are the same; the services only add the Redis I/O.  Nothing
+    here talks to Redis except the invalidation listener of ``cache``.
+    """
+    
+    def __init__(self, cache=None):
+        self.individual_prefix = "individual:"
+        self.portfolio_prefix = "portfolio:"
+        # individual ID -> portfolio ID; each portfolio is stored once, under portfolio_prefix
+        self.portfolio_index_key = "portfolios:by_individual"
+        self.individuals_set_key = "individuals:all"
+        self.wealth_ranking_key = "wealth:ranking"
+        self.industry_index_key = "industry:index"
+        self.industry_ranking_key = "industry:ranking"
+        # Secondary indexes: one set of IDs per value of each filterable field
+        self.filter_index_keys = {
+            'industry': self.industry_index_key,
+            'state': "state:index",
+            'city': "city:index",
+            'wealth_tier': "tier:index",
+            'source_of_wealth': "source:index"
+        }
+        self.filter_cache_key = "filter:cache"
+        # Leaderboards: net worth rankings per segment (industry:ranking doubles as the industry sort index)
+        self.leaderboard_keys = {
+            'industry': self.industry_ranking_key,
+            'state': "state:ranking"
+        }
+        self.max_ranking_limit = int(os.getenv('MAX_RANKING_LIMIT', 100))
+        self.filter_cache_ttl = int(os.getenv('FILTER_CACHE_TTL', 30))
+        self.sort_index_keys = {
+            'net_worth': (self.wealth_ranking_key, self.industry_ranking_key),
+            'last_name': ("individuals:by_last_name", "industry:by_last_name"),
+            'created_at': ("individuals:by_created_at", "industry:by_created_at")
+        }
+        self.stats_key = "stats:aggregates"
+        # Write generations for conditional requests, stamped by the mutation scripts
+        self.generation_key = "generations"
+        # Net worth history: a capped sorted set per individual (0 points disables it) and,
+        # per movers period, a sorted set of each individual's change since the period began
+        self.history_max_points = int(os.getenv('HISTORY_MAX_POINTS', 1000))
+        self.history_resolutions = {'raw': 0, 'hour': 3600, 'day': 86400, 'week': 7 * 86400, 'month': 30 * 86400}
+        self.movers_prefix = "movers"
+        # Longest length of each period in seconds; a period's movers are kept for two more
+        self.mover_periods = {'day': 86400, 'week': 7 * 86400, 'month': 31 * 86400,
+                              'quarter': 92 * 86400, 'year': 366 * 86400}
+        # Change feed: every mutation is appended to a capped stream (0 disables it)
+        self.events_stream_key = "events:changes"
+        self.stream_max_length = int(os.getenv('STREAM_MAX_LENGTH', 100000))
+        self.event_fields = ('first_name', 'last_name', 'company', 'industry', 'state', 'wealth_tier', 'net_worth')
+        self.search_trigram_key = "search:trigram"
+        self.search_prefix_key = "search:prefix"
+        self.search_fields = ('first_name', 'last_name', 'company', 'industry')
+        # Fields a ?fields= projection can be served from the net worth indexes alone
+        self.index_fields = ('id', 'net_worth')
+        self.cache = cache
+    
+    # In-process cache
+    def local_cache(self):
+        """The in-process cache, subscribed to invalidations in this process, or None when disabled."""
+        if self.cache:
+            self.cache.ensure_listener(redis_service.client, INVALIDATION_CHANNEL)
+        return self.cache
+    
+    def invalidate_local(self, key: str) -> None:
+        # Other workers are notified through INVALIDATION_CHANNEL; drop our copy right away
+        if self.cache:
+            self.cache.invalidate(key)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats() if self.cache else {'enabled': False}
+    
+    # Sparse fieldsets
+    def parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """Validate a comma-separated ``fields`` projection; the ID is always included."""
+        if not fields:
+            return None
+        requested = [field.strip() for field in fields.split(',') if field.strip()]
+        unknown = [field for field in requested if field not in WealthyIndividual.FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown field(s) {', '.join(unknown)}, expected any of {', '.join(WealthyIndividual.FIELDS)}")
+        return ['id'] + [field for field in dict.fromkeys(requested) if field != 'id']
+    
+    def _index_only(self, fields: Optional[List[str]]) -> bool:
+        return fields is not None and set(fields) <= set(self.index_fields)
+    
+    def _index_entry(self, individual_id: str, net_worth: float, fields: List[str]) -> Dict[str, Any]:
+        entry = {'id': individual_id, 'net_worth': net_worth}
+        return {field: entry[field] for field in fields}
+    
+    # Generations
+    def parse_generation(self, stamps: List[Optional[str]]) -> Optional[Tuple[int, float]]:
+        for stamp in stamps:
+            if stamp:
+                generation, modified = stamp.split(' ')
+                return int(generation), float(modified)
+        return None
+    
+    def dataset_scope(self) -> str:
+        """Scope of data derived from every record, which any write changes."""
+        return 'global'
+    
+    def record_scope(self, individual_id: str) -> str:
+        return f"{self.individual_prefix}{individual_id}"
+    
+    def listing_scope(self, sort: str, industry: Optional[str] = None,
+                      filters: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """The sorted index a listing reads, or None when it has no single generation.
+        
+        Filtered listings are served from cached intersections that can lag
+        writes, so they are not validated.
+        """
+        if filters or sort not in self.sort_index_keys:
+            return None
+        global_key, industry_key = self.sort_index_keys[sort]
+        return f"{industry_key}:{industry}" if industry else global_key
+    
+    def ranking_scope(self, segment: Optional[str] = None, value: Optional[str] = None) -> Optional[str]:
+        if segment is None:
+            return self.wealth_ranking_key
+        if segment in self.leaderboard_keys:
+            return f"{self.leaderboard_keys[segment]}:{value}"
+        return None
+    
+    # Index maintenance
+    def index_refs(self, individual: WealthyIndividual) -> Dict[str, Any]:
+        """Describe every index entry owned by an individual.
+        
+        The refs document is stored next to the record and consumed by the
+        Lua mutation scripts, which drop the old entries and add these ones
+        atomically with the record write.
+        """
+        return {
+            'sets': [
+                self.individuals_set_key,
+                *self._filter_keys(individual),
+                *self._search_keys(individual)
+            ],
+            'zsets': self._sort_index_entries(individual) + self._leaderboard_entries(individual),
+            'counters': [
+                [self.stats_key, 'count', '1'],
+                [self.stats_key, 'total_wealth', repr(individual.net_worth)],
+                [self.stats_key, f"tier:{individual.wealth_tier}", '1'],
+                [self.stats_key, f"industry:{individual.industry}", '1']
+            ]
+        }
+    
+    def _filter_keys(self, individual: WealthyIndividual) -> List[str]:
+        """Secondary index sets the individual belongs to; empty values are not indexed."""
+        return [
+            f"{prefix}:{getattr(individual, field)}"
+            for field, prefix in self.filter_index_keys.items()
+            if getattr(individual, field)
+        ]
+    
+    def _sort_index_entries(self, individual: WealthyIndividual) -> List[List[str]]:
+        """Sorted-set entries backing the paginated listings, globally and per industry.
+        
+        Net worth and creation time are scores; last name order is served
+        lexicographically from members that end with the ID.
+        """
+        try:
+            created_at = datetime.fromisoformat(individual.created_at).timestamp()
+        except (TypeError, ValueError):
+            created_at = 0
+        
+        name_member = redis_service.encode_member(
+            f"{individual.last_name.lower()}\x00{individual.first_name.lower()}\x00{individual.id}"
+        )
+        scores = {
+            'net_worth': (repr(individual.net_worth), None),
+            'last_name': ('0', name_member),
+            'created_at': (repr(created_at), None)
+        }
+        
+        entries = []
+        for sort, (global_key, industry_key) in self.sort_index_keys.items():
+            score, member = scores[sort]
+            for key in (global_key, f"{industry_key}:{individual.industry}"):
+                entries.append([key, score, member] if member else [key, score])
+        return entries
+    
+    def _leaderboard_entries(self, individual: WealthyIndividual) -> List[List[str]]:
+        """Segment rankings not already maintained as sort indexes (industry is)."""
+        if not individual.state:
+            return []
+        return [[f"{self.leaderboard_keys['state']}:{individual.state}", repr(individual.net_worth)]]
+    
+    def _search_keys(self, individual: WealthyIndividual) -> List[str]:
+        """Search index sets for an individual.
+        
+        Every trigram of the lower-cased searchable fields, plus the one and
+        two character prefixes of each word for queries shorter than a trigram.
+        """
+        trigrams = set()
+        prefixes = set()
+        for field in self.search_fields:
+            value = str(getattr(individual, field)).lower()
+            trigrams.update(value[i:i + 3] for i in range(len(value) - 2))
+            for word in value.split():
+                prefixes.update(word[:length] for length in (1, 2))
+        
+        return ([f"{self.search_trigram_key}:{trigram}" for trigram in sorted(trigrams)] +
+                [f"{self.search_prefix_key}:{prefix}" for prefix in sorted(prefixes)])
+    
+    def index_key_patterns(self) -> List[str]:
+        """Key patterns (SCAN MATCH syntax) covering every set and sorted set named by refs documents."""
+        patterns = [self.individuals_set_key]
+        patterns += [f"{prefix}:*" for prefix in self.filter_index_keys.values()]
+        for global_key, industry_key in self.sort_index_keys.values():
+            patterns += [global_key, f"{industry_key}:*"]
+        patterns += [
+            f"{self.leaderboard_keys['state']}:*",
+            f"{self.search_trigram_key}:*",
+            f"{self.search_prefix_key}:*"
+        ]
+        return patterns
+    
+    def upsert_call(self, mode: str, individual: WealthyIndividual,
+                     previous: Optional[WealthyIndividual] = None,
+                     write_record: bool = True) -> Tuple[List[str], List[str]]:
+        """Build the (keys, args) of an upsert_individual script call."""
+        individual_key = f"{self.individual_prefix}{individual.id}"
+        previous_refs = self.refs_json(previous) if previous else ''
+        payload = redis_service.encode_value(individual.to_dict()) if write_record else ''
+        now = time.time()
+        return [
+            individual_key,
+            f"{individual_key}:refs",
+            self.generation_key,
+            self.wealth_ranking_key
+        ], [
+            mode,
+            payload,
+            redis_service.encode_member(individual.id),
+            self.refs_json(individual),
+            previous_refs,
+            repr(now),
+            self._history_json(individual, now) if write_record else '',
+            self._event_json(self._individual_event_fields(individual)) if write_record else ''
+        ]
+    
+    def delete_call(self, individual_id: str, refs: str = '') -> Tuple[List[str], List[str]]:
+        """Build the (keys, args) of a delete_individual script call."""
+        individual_key = f"{self.individual_prefix}{individual_id}"
+        return [
+            individual_key,
+            f"{individual_key}:refs",
+            self.generation_key,
+            self.history_key(individual_id),
+            self.wealth_ranking_key
+        ], [
+            redis_service.encode_member(individual_id),
+            refs,
+            repr(time.time()),
+            self._event_json({})
+        ]
+    
+    def refs_json(self, individual: WealthyIndividual) -> str:
+        return json.dumps(self.index_refs(individual))
+    
+    def _event_json(self, fields: Dict[str, Any]) -> str:
+        """Change feed document for the mutation scripts (see append_event), or '' when the feed is disabled."""
+        if not self.stream_max_length:
+            return ''
+        return json.dumps({
+            'stream': self.events_stream_key,
+            'maxlen': self.stream_max_length,
+            'fields': [value for name, field in fields.items() for value in (name, field)]
+        })
+    
+    def _individual_event_fields(self, individual: WealthyIndividual) -> Dict[str, str]:
+        fields = {field: getattr(individual, field) or '' for field in self.event_fields}
+        fields['net_worth'] = repr(individual.net_worth)
+        return fields
+    
+    def _history_json(self, individual: WealthyIndividual, now: float) -> str:
+        """History document for the upsert script (see record_history), or '' when history is disabled."""
+        if not self.history_max_points:
+            return ''
+        when = datetime.fromtimestamp(now, timezone.utc)
+        return json.dumps({
+            'key': self.history_key(individual.id),
+            'net_worth': repr(individual.net_worth),
+            'max_points': self.history_max_points,
+            'movers': [
+                [*self._movers_keys(period, self._period_label(period, when)), 2 * length + 86400]
+                for period, length in self.mover_periods.items()
+            ]
+        })
+    
+    def merge_update(self, existing: WealthyIndividual, update_data: Dict[str, Any]) -> WealthyIndividual:
+        """Apply an update on top of an existing record; the ID is not updatable."""
+        updated_data = {**existing.to_dict(), **update_data, 'id': existing.id}
+        if 'net_worth' in update_data and 'wealth_tier' not in update_data:
+            # Let the tier follow the new net worth so the tier counters stay accurate
+            del updated_data['wealth_tier']
+        return WealthyIndividual(updated_data)
+    
+    # Portfolio operations
+    def portfolio_cache_key(self, individual_id: str) -> str:
+        # Portfolios used to be copied here; the key still names the in-process cache entry
+        return f"{self.individual_prefix}{individual_id}:portfolio"
+    
+    def put_portfolio_call(self, mode: str, portfolio: Portfolio) -> Tuple[List[str], List[str]]:
+        """Build the (keys, args) of a put_portfolio script call."""
+        return [
+            f"{self.portfolio_prefix}{portfolio.id}",
+            self.portfolio_index_key,
+            self.portfolio_cache_key(portfolio.individual_id),
+            self.generation_key
+        ], [
+            mode,
+            portfolio.individual_id,
+            portfolio.id,
+            redis_service.encode_value(portfolio.to_dict()),
+            self.portfolio_prefix,
+            repr(time.time()),
+            self._event_json({
+                'portfolio_id': portfolio.id,
+                'total_value': repr(portfolio.total_value)
+            }) if mode == 'put' else ''
+        ]
+    
+    def portfolio_lookup_call(self, individual_id: str) -> Tuple[List[str], List[str]]:
+        """Build the (keys, args) of an individual_portfolio script call."""
+        return [self.portfolio_index_key, self.portfolio_cache_key(individual_id)], [individual_id, self.portfolio_prefix]
+    
+    # Listings
+    def plan_listing(self, sort: str, limit: int, cursor: Optional[str] = None, industry: Optional[str] = None,
+                     filters: Optional[Dict[str, str]] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Validate a listing request and work out how its page is read.
+        
+        The page is one ``script`` call (``call`` holds its KEYS/ARGV):
+        filter_page for a filtered listing, listing_page over ``index_key``
+        otherwise.  ``index_only`` pages are served from the net worth index
+        without reading records.
+        """
+        if sort not in self.sort_index_keys:
+            raise ValueError(f"Unsupported sort '{sort}', expected one of {', '.join(self.sort_index_keys)}")
+        
+        filters = {field: value for field, value in (filters or {}).items() if value}
+        if filters and industry:
+            filters['industry'] = industry
+            industry = None
+        
+        global_key, industry_key = self.sort_index_keys[sort]
+        offset, after, after_score = self.decode_cursor(cursor, sort) if cursor else (0, '', '')
+        index_key = f"{industry_key}:{industry}" if industry else global_key
+        index_only = sort == 'net_worth' and not filters and self._index_only(fields)
+        if filters:
+            script = 'filter_page'
+            call = self.filter_page_call(sort, filters, offset, limit, after, after_score)
+        else:
+            script = 'listing_page'
+            order = 'asc' if sort == 'last_name' else 'desc'
+            call = [index_key], [offset, limit, after, after_score, order, int(index_only)]
+        return {
+            'sort': sort,
+            'index_key': index_key,
+            'index_only': index_only,
+            'fields': fields,
+            'script': script,
+            'call': call
+        }
+    
+    def listing_ids(self, plan: Dict[str, Any], members: List[Any]) -> List[str]:
+        """IDs of the page members of a plan that reads records."""
+        members = [redis_service.decode_member(member) for member in members]
+        if plan['sort'] == 'last_name':
+            members = [member.rsplit('\x00', 1)[-1] for member in members]
+        return members
+    
+    def listing_entries(self, plan: Dict[str, Any], members: List[Any]) -> List[Dict[str, Any]]:
+        """Projected entries of an ``index_only`` page, read as member, score, ..."""
+        return [
+            self._index_entry(redis_service.decode_member(member), float(net_worth), plan['fields'])
+            for member, net_worth in zip(members[::2], members[1::2])
+        ]
+    
+    def listing_result(self, plan: Dict[str, Any], individuals: List[Any], reply: List[Any]) -> Dict[str, Any]:
+        """The listing payload for a page script reply; ``next_cursor`` is None on the last page.
+        
+        The cursor carries the last member read and its score, so the next
+        page starts right after it even when members were added or removed
+        ahead of it in the meantime.
+        """
+        members, start, total, last_score = reply
+        step = 2 if plan['index_only'] else 1
+        next_offset = start + len(members) // step
+        next_cursor = None
+        if members and next_offset < total:
+            next_cursor = self.encode_cursor(plan['sort'], next_offset, members[-step], last_score)
+        return {'individuals': individuals, 'total': total, 'next_cursor': next_cursor}
+    
+    def filter_page_call(self, sort: str, filters: Dict[str, str], offset: int, limit: int,
+                         after: str = '', after_score: str = '') -> Tuple[List[str], List[Any]]:
+        """KEYS/ARGV for the filter_page script; the cache key is derived from the sort and filters."""
+        unknown = set(filters) - set(self.filter_index_keys)
+        if unknown:
+            raise ValueError(f"Unsupported filter {', '.join(sorted(unknown))}, "
+                             f"expected one of {', '.join(self.filter_index_keys)}")
+        if sort == 'last_name':
+            raise ValueError("Filters support sort=net_worth or sort=created_at")
+        
+        digest = hashlib.sha1(json.dumps(sorted(filters.items())).encode()).hexdigest()[:16]
+        keys = [
+            f"{self.filter_cache_key}:{sort}:{digest}",
+            self.sort_index_keys[sort][0],
+            *[f"{self.filter_index_keys[field]}:{value}" for field, value in sorted(filters.items())]
+        ]
+        return keys, [self.filter_cache_ttl, offset, limit, after, after_score]
+    
+    def encode_cursor(self, sort: str, offset: int, after: Optional[str] = None, after_score: Optional[str] = None) -> str:
+        data = {'sort': sort, 'offset': offset}
+        if after is not None:
+            data.update(after=after, score=after_score)
+        raw = json.dumps(data).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+    
+    def decode_cursor(self, cursor: str, sort: str) -> Tuple[int, str, str]:
+        """Offset, anchor member and anchor score of a cursor; the anchor is '' for offset-only cursors."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded))
+            offset = int(data['offset'])
+            after, after_score = str(data.get('after', '')), str(data.get('score', ''))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise ValueError("Invalid cursor")
+        if data.get('sort') != sort or offset < 0:
+            raise ValueError("Cursor does not match the requested sort")
+        return offset, after, after_score
+    
+    def leaderboard_call(self, limit: int, segment: Optional[str] = None, value: Optional[str] = None,
+                          fields: Optional[List[str]] = None) -> Tuple[List[str], List[Any]]:
+        """KEYS/ARGV for the ranked_records script over the global or a segment's ranking.
+        
+        Records are not read when ``fields`` can be served from the ranking alone.
+        """
+        if limit < 1:
+            raise ValueError('"limit" must be at least 1')
+        if segment is None:
+            ranking_key = self.wealth_ranking_key
+        elif segment in self.leaderboard_keys:
+            ranking_key = f"{self.leaderboard_keys[segment]}:{value}"
+        else:
+            raise ValueError(f"Unsupported leaderboard '{segment}', expected one of {', '.join(self.leaderboard_keys)}")
+        record_prefix = '' if self._index_only(fields) else self.individual_prefix
+        return [ranking_key], [min(limit, self.max_ranking_limit), record_prefix]
+    
+    def ranked_entries(self, reply: List[Any], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        index_only = self._index_only(fields)
+        entries = []
+        for index in range(0, len(reply), 3):
+            member, net_worth, record = reply[index:index + 3]
+            if index_only:
+                individual = self._index_entry(
+                    redis_service.decode_member(member.decode('utf-8')), float(net_worth), fields
+                )
+            elif record:
+                individual = WealthyIndividual.from_dict(redis_service.decode_value(record)).to_dict(fields)
+            else:
+                continue
+            entries.append({
+                'individual': individual,
+                'net_worth': float(net_worth)
+            })
+        return entries
+    
+    # Net worth queries, answered from the ranking sorted set alone
+    def _score_bounds(self, min_worth: Optional[float], max_worth: Optional[float]) -> Tuple[str, str]:
+        if min_worth is not None and max_worth is not None and min_worth > max_worth:
+            raise ValueError('"min" must not be greater than "max"')
+        return (
+            '-inf' if min_worth is None else repr(float(min_worth)),
+            '+inf' if max_worth is None else repr(float(max_worth))
+        )
+    
+    def queue_net_worth_extremes(self, pipe) -> None:
+        """Queue the lowest and highest ranking entries, with their net worth."""
+        pipe.zrange(self.wealth_ranking_key, 0, 0, withscores=True)
+        pipe.zrevrange(self.wealth_ranking_key, 0, 0, withscores=True)
+    
+    def queue_net_worth_range(self, pipe, low: str, high: str, offset: int, limit: int) -> None:
+        """Queue one page of a score range, richest first, and the size of the whole range."""
+        pipe.zrevrangebyscore(self.wealth_ranking_key, high, low, start=offset, num=limit, withscores=True)
+        pipe.zcount(self.wealth_ranking_key, low, high)
+    
+    def net_worth_range_page(self, ranked: List[Tuple[Any, float]], offset: int, total: int) -> Dict[str, Any]:
+        entries = [
+            {'id': redis_service.decode_member(member), 'net_worth': net_worth}
+            for member, net_worth in ranked
+        ]
+        next_offset = offset + len(entries)
+        return {
+            'entries': entries,
+            'total': total,
+            'next_cursor': self.encode_cursor('net_worth_range', next_offset) if next_offset < total else None
+        }
+    
+    def attach_records(self, entries: List[Dict[str, Any]], individuals: List[WealthyIndividual],
+                       fields: Optional[List[str]] = None) -> None:
+        """Add each entry's record (projected to ``fields``), None for IDs whose record is gone."""
+        found = {ind.id: ind for ind in individuals}
+        for entry in entries:
+            individual = found.get(entry['id'])
+            entry['individual'] = individual.to_dict(fields) if individual else None
+    
+    def wealth_rank_call(self, individual_id: str) -> Tuple[List[str], List[str]]:
+        """Build the (keys, args) of a wealth_rank script call."""
+        return [self.wealth_ranking_key], [redis_service.encode_member(individual_id)]
+    
+    def format_wealth_rank(self, individual_id: str, result: Optional[List[Any]]) -> Optional[Dict[str, Any]]:
+        if not result:
+            return None
+        score, above, at_or_below, total = result
+        return {
+            'individual_id': individual_id,
+            'net_worth': float(score),
+            'rank': above + 1,
+            'total': total,
+            'percentile': 100.0 * at_or_below / total
+        }
+    
+    def histogram_edges(self, lowest: List, highest: List, per_decade: int) -> Optional[List[float]]:
+        """Logarithmic edges spanning the ranking extremes, None when nobody is ranked."""
+        if not lowest:
+            return None
+        return self._log_edges(lowest[0][1], highest[0][1], per_decade)
+    
+    def _log_edges(self, lowest: float, highest: float, per_decade: int) -> List[float]:
+        """Powers of ten (``per_decade`` steps each) covering [lowest, highest]; values below 1 fall in ``below``."""
+        if per_decade < 1 or per_decade > 10:
+            raise ValueError('"per_decade" must be between 1 and 10')
+        start = math.floor(math.log10(max(lowest, 1.0)) * per_decade)
+        stop = max(math.ceil(math.log10(max(highest, 1.0)) * per_decade), start + 1)
+        return [10 ** (step / per_decade) for step in range(start, stop + 1)]
+    
+    def queue_histogram_counts(self, pipe, edges: List[float]) -> None:
+        """Validate ``edges`` and queue a ZCOUNT per bucket, the two outer ranges and the total."""
+        if len(edges) < 2 or any(low >= high for low, high in zip(edges, edges[1:])):
+            raise ValueError('Histogram edges must be at least two strictly increasing values')
+        if len(edges) > 201:
+            raise ValueError('Histogram is limited to 200 buckets')
+        
+        pipe.zcount(self.wealth_ranking_key, '-inf', f"({edges[0]!r}")
+        for index, (low, high) in enumerate(zip(edges, edges[1:])):
+            upper = repr(high) if index == len(edges) - 2 else f"({high!r}"
+            pipe.zcount(self.wealth_ranking_key, repr(low), upper)
+        pipe.zcount(self.wealth_ranking_key, f"({edges[-1]!r}", '+inf')
+        pipe.zcard(self.wealth_ranking_key)
+    
+    def format_histogram(self, edges: Optional[List[float]], counts: List[int]) -> Dict[str, Any]:
+        if edges is None:
+            return {'buckets': [], 'below': 0, 'above': 0, 'total': 0}
+        below, *counts, above, total = counts
+        return {
+            'buckets': [
+                {'min': low, 'max': high, 'count': count}
+                for (low, high), count in zip(zip(edges, edges[1:]), counts)
+            ],
+            'below': below,
+            'above': above,
+            'total': total
+        }
+    
+    # Net worth history
+    def history_key(self, individual_id: str) -> str:
+        return f"{self.individual_prefix}{individual_id}:history"
+    
+    def _movers_keys(self, period: str, label: str) -> Tuple[str, str]:
+        """(changes sorted set, start values hash) of one movers period."""
+        deltas_key = f"{self.movers_prefix}:{period}:{label}"
+        return deltas_key, f"{deltas_key}:start"
+    
+    def _period_start(self, period: str, when: datetime) -> datetime:
+        day = when.replace(hour=0, minute=0, second=0, microsecond=0)
+        if period == 'day':
+            return day
+        if period == 'week':
+            return day - timedelta(days=day.weekday())
+        if period == 'month':
+            return day.replace(day=1)
+        if period == 'quarter':
+            return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+        return day.replace(month=1, day=1)
+    
+    def _period_label(self, period: str, when: datetime) -> str:
+        """Calendar period (UTC) containing ``when``, e.g. 2024-05-17, 2024-W20, 2024-05, 2024-Q2, 2024."""
+        start = self._period_start(period, when)
+        if period == 'week':
+            year, week, _ = start.isocalendar()
+            return f"{year}-W{week:02d}"
+        if period == 'quarter':
+            return f"{start.year}-Q{(start.month - 1) // 3 + 1}"
+        return start.strftime({'day': '%Y-%m-%d', 'month': '%Y-%m', 'year': '%Y'}[period])
+    
+    def _movers_label(self, period: str, previous: bool = False) -> str:
+        if period not in self.mover_periods:
+            raise ValueError(f"Unknown period '{period}', expected one of {', '.join(self.mover_periods)}")
+        when = datetime.now(timezone.utc)
+        if previous:
+            when = self._period_start(period, when) - timedelta(microseconds=1)
+        return self._period_label(period, when)
+    
+    def movers_scope(self, period: str) -> Optional[str]:
+        """Movers pages embed the movers' records, which deletes and edits change without
+        touching the movers sets, so they are validated against the whole dataset."""
+        if period not in self.mover_periods:
+            return None
+        return self.dataset_scope()
+    
+    def _timestamp(self, seconds: float) -> str:
+        return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+    
+    def history_query(self, start: Optional[float], end: Optional[float], resolution: str) -> Tuple[List[str], int]:
+        """Validate a history request: the score bounds to read and the bucket width (0 for raw points)."""
+        if resolution not in self.history_resolutions:
+            raise ValueError(f"Unknown resolution '{resolution}', expected one of {', '.join(self.history_resolutions)}")
+        if start is not None and end is not None and start > end:
+            raise ValueError('"from" must not be later than "to"')
+        bounds = ['-inf' if start is None else repr(float(start)), '+inf' if end is None else repr(float(end))]
+        return bounds, self.history_resolutions[resolution]
+    
+    def format_history(self, individual_id: str, resolution: str, width: int, reply: List[Any]) -> Dict[str, Any]:
+        """Shape a history_buckets reply (or, for raw points, the history entries) into the payload."""
+        if width:
+            points = [
+                {
+                    'timestamp': self._timestamp(float(reply[i])),
+                    'first': float(reply[i + 1]),
+                    'low': float(reply[i + 2]),
+                    'high': float(reply[i + 3]),
+                    'last': float(reply[i + 4]),
+                    'changes': reply[i + 5]
+                }
+                for i in range(0, len(reply), 6)
+            ]
+        else:
+            points = [
+                {'timestamp': self._timestamp(float(recorded)), 'net_worth': float(net_worth)}
+                for recorded, net_worth in (entry.split(':', 1) for entry in reply)
+            ]
+        return {
+            'individual_id': individual_id,
+            'resolution': resolution,
+            'points': points
+        }
+    
+    def movers_call(self, period: str, direction: str, limit: int,
+                    previous: bool = False) -> Tuple[str, List[str], List[Any]]:
+        """The period label and (keys, args) of a movers script call."""
+        if direction not in ('gainers', 'losers'):
+            raise ValueError('Query parameter "direction" must be "gainers" or "losers"')
+        label = self._movers_label(period, previous)
+        return label, list(self._movers_keys(period, label)), [direction, limit]
+    
+    def mover_ids(self, reply: List[Any]) -> List[str]:
+        return [redis_service.decode_member(member) for member in reply[0::3]]
+    
+    def format_movers(self, period: str, label: str, direction: str, reply: List[Any],
+                      individuals: List[WealthyIndividual], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Shape a movers reply; individuals deleted since they moved are left out."""
+        found = {individual.id: individual for individual in individuals}
+        movers = []
+        for member, change, start in zip(self.mover_ids(reply), reply[1::3], reply[2::3]):
+            if member not in found:
+                continue
+            change = float(change)
+            start = float(start) if start else None
+            movers.append({
+                'rank': len(movers) + 1,
+                'individual': found[member].to_dict(fields),
+                'change': change,
+                'start_net_worth': start,
+                'change_percent': 100.0 * change / start if start else None
+            })
+        return {
+            'period': period,
+            'bucket': label,
+            'direction': direction,
+            'movers': movers
+        }
+    
+    # Search
+    def search_candidate_keys(self, query: str) -> Tuple[str, List[str]]:
+        """The lower-cased search term and the index sets whose intersection holds its candidates.
+        
+        Queries of three or more characters intersect their trigram sets;
+        shorter ones read the set of words starting with them.
+        """
+        search_term = query.lower()
+        if len(search_term) >= 3:
+            trigrams = sorted({search_term[i:i + 3] for i in range(len(search_term) - 2)})
+            return search_term, [f"{self.search_trigram_key}:{trigram}" for trigram in trigrams]
+        return search_term, [f"{self.search_prefix_key}:{search_term}"]
+    
+    def rank_matches(self, candidates: List[WealthyIndividual], search_term: str,
+                     limit: int) -> List[WealthyIndividual]:
+        """Candidates that match ``search_term``, best rank first, then by net worth."""
+        ranked = []
+        for ind in candidates:
+            rank = self._search_rank(ind, search_term)
+            if rank is not None:
+                ranked.append((rank, -ind.net_worth, ind))
+        
+        ranked.sort(key=lambda match: match[:2])
+        return [ind for _, _, ind in ranked[:limit]]
+    
+    def _search_rank(self, individual: WealthyIndividual, search_term: str) -> Optional[int]:
+        """Relevance of an individual for a lower-cased query (lower is better), None if it does not match."""
+        values = [str(getattr(individual, field)).lower() for field in self.search_fields]
+        
+        if search_term in values:
+            return 0
+        if any(value.startswith(search_term) for value in values):
+            return 1
+        if any(word.startswith(search_term) for value in values for word in value.split()):
+            return 2
+        if len(search_term) >= 3 and any(search_term in value for value in values):
+            return 3
+        return None
+    
+    # Analytics
+    def format_statistics(self, counters: Dict[str, str], lowest: List, highest: List) -> Dict[str, Any]:
+        """Shape the stats hash and the ranking extremes into the /stats payload."""
+        total_individuals = int(float(counters.get('count', 0)))
+        if not total_individuals:
+            return {}
+        
+        total_wealth = float(counters.get('total_wealth', 0))
+        wealth_tiers = {}
+        industries = {}
+        for field, value in counters.items():
+            if field.startswith('tier:'):
+                wealth_tiers[field[len('tier:'):]] = int(float(value))
+            elif field.startswith('industry:'):
+                industries[field[len('industry:'):]] = int(float(value))
+        
+        return {
+            'total_individuals': total_individuals,
+            'total_wealth': total_wealth,
+            'average_wealth': total_wealth / total_individuals,
+            'max_wealth': highest[0][1] if highest else 0,
+            'min_wealth': lowest[0][1] if lowest else 0,
+            'wealth_tier_distribution': wealth_tiers,
+            'industry_distribution': industries
+        }
+    
+    def format_redis_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'connected_clients': info.get('connected_clients', 0),
+            'used_memory_human': info.get('used_memory_human', '0'),
+            'used_memory_peak_human': info.get('used_memory_peak_human', '0'),
+            'keyspace_hits': info.get('keyspace_hits', 0),
+            'keyspace_misses': info.get('keyspace_misses', 0),
+            'total_commands_processed': info.get('total_commands_processed', 0)
+        }
@@ -1,39 +1,85 @@
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from models.wealthy_individual import WealthyIndividual
 from models.portfolio import Portfolio
+from services.local_cache import create_local_cache
+from services.metrics import metrics
 from services.redis_service import redis_service
+from services.wealth_keyspace import WealthKeyspace
 
 logger = logging.getLogger(__name__)
 
-class WealthService:
+individual_lookups = metrics.counter(
+    'individual_lookups_total', 'Single individual reads by where the record was found', ['result']
+)
+
+class WealthService(WealthKeyspace):
     def __init__(self):
-        self.individual_prefix = "individual:"
-        self.portfolio_prefix = "portfolio:"
-        self.individuals_set_key = "individuals:all"
-        self.wealth_ranking_key = "wealth:ranking"
-        self.industry_index_key = "industry:index"
+        super().__init__(create_local_cache())
     
-    # Individual CRUD operations
-    def create_individual(self, individual_data: Dict[str, Any]) -> WealthyIndividual:
+    # Generations
+    def get_generation(self, scope: str) -> Optional[Tuple[int, float]]:
+        """(generation, unix time) of the latest write to ``scope``.
+        
+        Scopes are record keys, sorted set indexes and counter hashes.  Falls
+        back to the latest write of any kind when ``scope`` has not been
+        written since generations were introduced; None if nothing has.
+        """
         try:
-            individual = WealthyIndividual(individual_data)
-            individual_key = f"{self.individual_prefix}{individual.id}"
+            return self.parse_generation(redis_service.client.hmget(self.generation_key, scope, 'global'))
             
-            # Store individual data
-            redis_service.set(individual_key, individual.to_dict())
+        except Exception as e:
+            logger.error(f"Error getting generation of {scope}: {e}")
+            raise
+    
+    def touch_generations(self, *scopes: str) -> None:
+        """Stamp a write made outside the mutation scripts."""
+        redis_service.evalsha('touch_generations', [self.generation_key], [repr(time.time()), *scopes])
+    
+    # Index maintenance
+    def _upsert_individual(self, mode: str, individual: WealthyIndividual,
+                           previous: Optional[WealthyIndividual] = None) -> bool:
+        keys, args = self.upsert_call(mode, individual, previous)
+        result = bool(redis_service.evalsha('upsert_individual', keys, args))
+        self.invalidate_local(keys[0])
+        return result
+    
+    def reindex_individuals(self) -> int:
+        """Re-apply the index entries of every stored individual.
+        
+        Used after new indexes are introduced: each record's current refs are
+        replaced by freshly computed ones, one pipelined batch of script calls
+        per chunk.  Records themselves are not rewritten.
+        """
+        try:
+            reindexed = 0
             
-            # Add to individuals set
-            redis_service.sadd(self.individuals_set_key, individual.id)
+            # SSCAN may repeat an ID; re-applying a record's index entries is idempotent
+            for chunk in redis_service.sscan_batches(self.individuals_set_key):
+                calls = [
+                    self.upsert_call('update', individual, previous=individual, write_record=False)
+                    for individual in self.get_individuals(chunk)
+                ]
+                if calls:
+                    reindexed += sum(redis_service.evalsha_many('upsert_individual', calls))
             
-            # Add to wealth ranking sorted set
-            redis_service.zadd(self.wealth_ranking_key, {
-                individual.id: individual.net_worth
-            })
+            logger.info(f"Reindexed {reindexed} individuals")
+            return reindexed
             
-            # Add to industry index
-            industry_key = f"{self.industry_index_key}:{individual.industry}"
-            redis_service.sadd(industry_key, individual.id)
+        except Exception as e:
+            logger.error(f"Error reindexing individuals: {e}")
+            raise
+    
+    # Individual CRUD operations
+    def create_individual(self, individual_data: Dict[str, Any]) -> WealthyIndividual:
+        try:
+            individual = WealthyIndividual(individual_data)
+            
+            # Store the record and all of its index entries in one atomic round trip
+            if not self._upsert_individual('create', individual):
+                raise ValueError(f"Individual {individual.id} already exists")
             
             logger.info(f"Created individual: {individual.id}")
             return individual
@@ -42,16 +88,27 @@ class WealthService:
             logger.error(f"Error creating individual: {e}")
             raise
     
-    def get_individual(self, individual_id: str) -> Optional[WealthyIndividual]:
+    def get_individual(self, individual_id: str, use_cache: bool = True) -> Optional[WealthyIndividual]:
         try:
             individual_key = f"{self.individual_prefix}{individual_id}"
+            local_cache = self.local_cache() if use_cache else None
+            if local_cache:
+                individual = local_cache.get(individual_key)
+                if individual:
+                    individual_lookups.inc('local')
+                    return individual
+                generation = local_cache.generation
+            
             cached = redis_service.get(individual_key)
             
             if cached:
-                logger.info(f"Cache hit for individual: {individual_id}")
-                return WealthyIndividual.from_dict(cached)
+                individual_lookups.inc('redis')
+                individual = WealthyIndividual.from_dict(cached)
+                if local_cache:
+                    local_cache.set(individual_key, individual, generation)
+                return individual
             
-            logger.info(f"Cache miss for individual: {individual_id}")
+            individual_lookups.inc('missing')
             return None
             
         except Exception as e:
@@ -60,22 +117,17 @@ class WealthService:
     
     def update_individual(self, individual_id: str, update_data: Dict[str, Any]) -> Optional[WealthyIndividual]:
         try:
-            existing = self.get_individual(individual_id)
+            existing = self.get_individual(individual_id, use_cache=False)
             if not existing:
                 raise ValueError(f"Individual {individual_id} not found")
             
             # Merge existing data with updates
-            updated_data = {**existing.to_dict(), **update_data}
-            updated_individual = WealthyIndividual(updated_data)
-            
-            individual_key = f"{self.individual_prefix}{individual_id}"
-            redis_service.set(individual_key, updated_individual.to_dict())
+            updated_individual = self.merge_update(existing, update_data)
             
-            # Update wealth ranking if net worth changed
-            if 'net_worth' in update_data and update_data['net_worth'] != existing.net_worth:
-                redis_service.zadd(self.wealth_ranking_key, {
-                    updated_individual.id: updated_individual.net_worth
-                })
+            # Rewrite the record and move its index entries (ranking score,
+            # industry set) in one atomic round trip
+            if not self._upsert_individual('update', updated_individual, previous=existing):
+                raise ValueError(f"Individual {individual_id} not found")
             
             return updated_individual
             
@@ -85,24 +137,22 @@ class WealthService:
     
     def delete_individual(self, individual_id: str) -> bool:
         try:
-            individual = self.get_individual(individual_id)
-            if not individual:
-                raise ValueError(f"Individual {individual_id} not found")
-            
-            individual_key = f"{self.individual_prefix}{individual_id}"
+            keys, args = self.delete_call(individual_id)
             
-            # Remove from main storage
-            redis_service.delete(individual_key)
+            # Remove the record and every index entry it owns in one atomic round trip
+            result = redis_service.evalsha('delete_individual', keys, args)
+            self.invalidate_local(keys[0])
             
-            # Remove from individuals set
-            redis_service.srem(self.individuals_set_key, individual.id)
-            
-            # Remove from wealth ranking
-            redis_service.zrem(self.wealth_ranking_key, individual.id)
+            if result == -1:
+                # Record predates refs tracking: derive its index entries from the record
+                individual = self.get_individual(individual_id, use_cache=False)
+                if individual:
+                    result = redis_service.evalsha('delete_individual', *self.delete_call(
+                        individual_id, self.refs_json(individual)
+                    ))
             
-            # Remove from industry index
-            industry_key = f"{self.industry_index_key}:{individual.industry}"
-            redis_service.srem(industry_key, individual.id)
+            if result != 1:
+                raise ValueError(f"Individual {individual_id} not found")
             
             logger.info(f"Deleted individual: {individual_id}")
             return True
@@ -111,16 +161,99 @@ class WealthService:
             logger.error(f"Error deleting individual {individual_id}: {e}")
             raise
     
+    # Bulk operations
+    def bulk_create_individuals(self, rows: Iterable[Dict[str, Any]], batch_size: Optional[int] = None,
+                                max_errors: int = 1000) -> Dict[str, Any]:
+        """Validate and create many individuals, pipelining one batch of script calls at a time.
+        
+        Rows are validated through WealthyIndividual; invalid rows and IDs that
+        already exist are reported by their 1-based row number instead of
+        aborting the import.  Only the first ``max_errors`` errors are kept.
+        """
+        batch_size = batch_size or redis_service.batch_size
+        report = {'created': 0, 'failed': 0, 'errors': []}
+        batch = []
+        
+        try:
+            for row_number, row in enumerate(rows, 1):
+                if isinstance(row, Exception):
+                    self._add_import_error(report, row_number, f"Invalid row: {row}", max_errors)
+                    continue
+                if not isinstance(row, dict):
+                    self._add_import_error(report, row_number, "Row must be an object", max_errors)
+                    continue
+                
+                try:
+                    batch.append((row_number, WealthyIndividual(row)))
+                except KeyError as e:
+                    self._add_import_error(report, row_number, f"Missing required field {e}", max_errors)
+                except (ValueError, TypeError) as e:
+                    self._add_import_error(report, row_number, f"Invalid row: {e}", max_errors)
+                
+                if len(batch) >= batch_size:
+                    self._flush_individual_batch(batch, report, max_errors)
+                    batch = []
+            
+            if batch:
+                self._flush_individual_batch(batch, report, max_errors)
+            
+            logger.info(f"Bulk import created {report['created']} individuals, {report['failed']} failed")
+            return report
+            
+        except Exception as e:
+            logger.error(f"Error bulk creating individuals: {e}")
+            raise
+    
+    def _flush_individual_batch(self, batch: List[Tuple[int, WealthyIndividual]],
+                                report: Dict[str, Any], max_errors: int) -> None:
+        calls = [self.upsert_call('create', individual) for _, individual in batch]
+        results = redis_service.evalsha_many('upsert_individual', calls)
+        
+        for (row_number, individual), created in zip(batch, results):
+            self.invalidate_local(f"{self.individual_prefix}{individual.id}")
+            if created:
+                report['created'] += 1
+            else:
+                self._add_import_error(report, row_number, f"Individual {individual.id} already exists", max_errors)
+    
+    def _add_import_error(self, report: Dict[str, Any], row_number: int, error: str, max_errors: int) -> None:
+        report['failed'] += 1
+        if len(report['errors']) < max_errors:
+            report['errors'].append({'row': row_number, 'error': error})
+    
+    def bulk_create_portfolios(self, rows: Iterable[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+        """Create many portfolios with one pipelined round trip of script calls per batch."""
+        batch_size = batch_size or redis_service.batch_size
+        created = 0
+        
+        try:
+            calls = []
+            for row in rows:
+                calls.append(self.put_portfolio_call('put', Portfolio(row)))
+                if len(calls) == batch_size:
+                    created += self._put_portfolios(calls)
+                    calls = []
+            
+            if calls:
+                created += self._put_portfolios(calls)
+            return created
+            
+        except Exception as e:
+            logger.error(f"Error bulk creating portfolios: {e}")
+            raise
+    
     # Portfolio operations
+    def _put_portfolios(self, calls: List[Tuple[List[str], List[str]]]) -> int:
+        stored = sum(redis_service.evalsha_many('put_portfolio', calls))
+        for keys, _ in calls:
+            self.invalidate_local(keys[2])
+        return stored
+    
     def create_portfolio(self, portfolio_data: Dict[str, Any]) -> Portfolio:
+        """Store a portfolio and index it under its individual, replacing any portfolio they had."""
         try:
             portfolio = Portfolio(portfolio_data)
-            portfolio_key = f"{self.portfolio_prefix}{portfolio.id}"
-            individual_portfolio_key = f"{self.individual_prefix}{portfolio.individual_id}:portfolio"
-            
-            redis_service.set(portfolio_key, portfolio.to_dict())
-            redis_service.set(individual_portfolio_key, portfolio.to_dict())
-            
+            self._put_portfolios([self.put_portfolio_call('put', portfolio)])
             return portfolio
             
         except Exception as e:
@@ -129,82 +262,348 @@ class WealthService:
     
     def get_portfolio_by_individual_id(self, individual_id: str) -> Optional[Portfolio]:
         try:
-            individual_portfolio_key = f"{self.individual_prefix}{individual_id}:portfolio"
-            cached = redis_service.get(individual_portfolio_key)
+            portfolio_cache_key = self.portfolio_cache_key(individual_id)
+            local_cache = self.local_cache()
+            if local_cache:
+                portfolio = local_cache.get(portfolio_cache_key)
+                if portfolio:
+                    return portfolio
+                generation = local_cache.generation
+            
+            # Index lookup and record read in one round trip
+            keys, args = self.portfolio_lookup_call(individual_id)
+            cached = redis_service.decode_value(redis_service.evalsha('individual_portfolio', keys, args, raw=True))
             
             if cached:
-                return Portfolio.from_dict(cached)
+                portfolio = Portfolio.from_dict(cached)
+                if local_cache:
+                    local_cache.set(portfolio_cache_key, portfolio, generation)
+                return portfolio
             return None
             
         except Exception as e:
             logger.error(f"Error getting portfolio for individual {individual_id}: {e}")
             raise
     
+    def iter_portfolio_batches(self, batch_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream every indexed portfolio as stored dicts, one HSCAN page and MGET per batch.
+        
+        HSCAN may return an entry twice if the index is rehashed during the
+        walk; each portfolio is yielded once, so totals are not double-counted.
+        The IDs already read are kept for that, a small fraction of what a
+        caller loading every portfolio holds anyway.
+        """
+        batch_size = batch_size or redis_service.batch_size
+        cursor = 0
+        seen = set()
+        try:
+            while True:
+                cursor, entries = redis_service.client.hscan(self.portfolio_index_key, cursor, count=batch_size)
+                portfolio_ids = [portfolio_id for portfolio_id in dict.fromkeys(entries.values()) if portfolio_id not in seen]
+                seen.update(portfolio_ids)
+                if portfolio_ids:
+                    keys = [f"{self.portfolio_prefix}{portfolio_id}" for portfolio_id in portfolio_ids]
+                    batch = [portfolio for portfolio in redis_service.mget(keys, batch_size) if portfolio]
+                    if batch:
+                        yield batch
+                if cursor == 0:
+                    break
+                    
+        except Exception as e:
+            logger.error(f"Error iterating portfolios: {e}")
+            raise
+    
+    def migrate_portfolios(self) -> int:
+        """Move portfolios still stored as per-individual copies behind the portfolio index.
+        
+        Each individual:<id>:portfolio copy is written as its portfolio:<id>
+        record, indexed and deleted.  Copies replaced since they were
+        scanned are skipped, so the migration can run against a live store.
+        """
+        try:
+            migrated = 0
+            for batch in redis_service.scan_values(self.portfolio_cache_key('*')):
+                calls = [self.put_portfolio_call('migrate', Portfolio.from_dict(payload)) for _, payload in batch]
+                migrated += self._put_portfolios(calls)
+            
+            logger.info(f"Migrated {migrated} portfolios")
+            return migrated
+            
+        except Exception as e:
+            logger.error(f"Error migrating portfolios: {e}")
+            raise
+    
     # Query operations
+    def get_individuals(self, individual_ids: List[str]) -> List[WealthyIndividual]:
+        """Load many individuals with chunked MGETs, preserving the order of ``individual_ids``.
+        
+        IDs whose record no longer exists are skipped.
+        """
+        try:
+            keys = [f"{self.individual_prefix}{individual_id}" for individual_id in individual_ids]
+            local_cache = self.local_cache()
+            if not local_cache:
+                return [
+                    WealthyIndividual.from_dict(data)
+                    for data in redis_service.mget(keys)
+                    if data
+                ]
+            
+            # Serve what we can from the in-process cache and MGET only the misses
+            generation = local_cache.generation
+            found = {key: local_cache.get(key) for key in keys}
+            missing = [key for key, individual in found.items() if individual is None]
+            for key, data in zip(missing, redis_service.mget(missing)):
+                if data:
+                    found[key] = WealthyIndividual.from_dict(data)
+                    local_cache.set(key, found[key], generation)
+            
+            return [found[key] for key in keys if found[key] is not None]
+            
+        except Exception as e:
+            logger.error(f"Error getting {len(individual_ids)} individuals: {e}")
+            raise
+    
+    def iter_individual_batches(self, batch_size: Optional[int] = None) -> Iterator[List[WealthyIndividual]]:
+        """Stream every individual in batches without holding the whole dataset, oldest first.
+        
+        Pages through the creation time index with ZRANGEBYSCORE and loads
+        each page with MGET, so memory stays proportional to ``batch_size``.
+        Each page starts at the score the previous one ended on and skips
+        the IDs already read at that score, so writes during the walk never
+        repeat an individual (SSCAN over individuals:all could) and never
+        skip one that exists throughout.
+        """
+        batch_size = batch_size or redis_service.batch_size
+        index_key = self.sort_index_keys['created_at'][0]
+        try:
+            score, read_at_score = '-inf', set()
+            while True:
+                limit = batch_size + len(read_at_score)
+                page = redis_service.client.zrangebyscore(index_key, score, '+inf', start=0, num=limit, withscores=True)
+                entries = [(member, member_score) for member, member_score in page if member not in read_at_score]
+                if entries:
+                    individuals = self.get_individuals([redis_service.decode_member(member) for member, _ in entries])
+                    if individuals:
+                        yield individuals
+                    
+                    last_score = entries[-1][1]
+                    if last_score != score:
+                        read_at_score = set()
+                    read_at_score.update(member for member, member_score in entries if member_score == last_score)
+                    score = last_score
+                if len(page) < limit:
+                    break
+                    
+        except Exception as e:
+            logger.error(f"Error iterating individuals: {e}")
+            raise
+    
     def get_all_individuals(self) -> List[WealthyIndividual]:
         try:
             individual_ids = redis_service.smembers(self.individuals_set_key)
-            individuals = []
-            
-            for individual_id in individual_ids:
-                individual = self.get_individual(individual_id)
-                if individual:
-                    individuals.append(individual)
-            
-            return individuals
+            return self.get_individuals(individual_ids)
             
         except Exception as e:
             logger.error(f"Error getting all individuals: {e}")
             raise
     
-    def get_wealth_ranking(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def list_individuals(self, sort: str = 'net_worth', limit: int = 50, cursor: Optional[str] = None,
+                         industry: Optional[str] = None, filters: Optional[Dict[str, str]] = None,
+                         fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Return one page of individuals from a sorted index.
+        
+        Net worth and creation time are listed newest/richest first, last name
+        alphabetically.  Each page costs one script call ranging over the page
+        plus chunked MGETs of its records, whatever the total number of
+        individuals.  A cursor resumes right after the last individual of its
+        page, so individuals added or removed ahead of it do not shift the
+        next page.
+        ``filters`` (field -> value, see ``filter_index_keys``) are ANDed; their
+        intersection with the sort index is cached for FILTER_CACHE_TTL
+        seconds, so it can lag recent writes by that much.
+        With ``fields`` the individuals are dicts holding only those fields;
+        when the net worth index holds them all no record is fetched.
+        ``next_cursor`` is None on the last page.
+        """
         try:
-            ranked_ids = redis_service.zrevrange(self.wealth_ranking_key, 0, limit - 1, withscores=True)
-            ranking = []
+            plan = self.plan_listing(sort, limit, cursor, industry, filters, fields)
             
-            for individual_id, net_worth in ranked_ids:
-                individual = self.get_individual(individual_id)
-                if individual:
-                    ranking.append({
-                        'individual': individual.to_dict(),
-                        'net_worth': net_worth
-                    })
+            reply = redis_service.evalsha(plan['script'], *plan['call'])
             
-            return ranking
+            if plan['index_only']:
+                individuals = self.listing_entries(plan, reply[0])
+            else:
+                individuals = self.get_individuals(self.listing_ids(plan, reply[0]))
+                if fields:
+                    individuals = [ind.to_dict(fields) for ind in individuals]
+            
+            return self.listing_result(plan, individuals, reply)
+            
+        except Exception as e:
+            logger.error(f"Error listing individuals sorted by {sort}: {e}")
+            raise
+    
+    def get_wealth_ranking(self, limit: int = 10, segment: Optional[str] = None,
+                           value: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Top individuals by net worth, globally or within one industry/state, records included.
+        
+        One script call returns the ranked IDs and their records together;
+        ``limit`` is capped at MAX_RANKING_LIMIT.  ``fields`` projects the records.
+        """
+        try:
+            keys, args = self.leaderboard_call(limit, segment, value, fields)
+            return self.ranked_entries(redis_service.evalsha('ranked_records', keys, args, raw=True), fields)
             
         except Exception as e:
             logger.error(f"Error getting wealth ranking: {e}")
             raise
     
+    # Net worth queries, answered from the ranking sorted set alone
+    def get_net_worth_range(self, min_worth: Optional[float] = None, max_worth: Optional[float] = None,
+                            limit: int = 50, cursor: Optional[str] = None,
+                            include_records: bool = False, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """One page of the individuals whose net worth is within [min_worth, max_worth], richest first.
+        
+        Entries hold only the ID and net worth unless ``include_records`` is
+        set (projected to ``fields`` when given); ``total`` is the ZCOUNT of
+        the whole range.
+        """
+        try:
+            low, high = self._score_bounds(min_worth, max_worth)
+            offset = self.decode_cursor(cursor, 'net_worth_range')[0] if cursor else 0
+            
+            pipe = redis_service.pipeline()
+            self.queue_net_worth_range(pipe, low, high, offset, limit)
+            ranked, total = pipe.execute()
+            page = self.net_worth_range_page(ranked, offset, total)
+            if include_records:
+                individuals = self.get_individuals([entry['id'] for entry in page['entries']])
+                self.attach_records(page['entries'], individuals, fields)
+            return page
+            
+        except Exception as e:
+            logger.error(f"Error getting net worth range {min_worth}-{max_worth}: {e}")
+            raise
+    
+    def count_by_net_worth(self, min_worth: Optional[float] = None, max_worth: Optional[float] = None) -> int:
+        try:
+            low, high = self._score_bounds(min_worth, max_worth)
+            return redis_service.zcount(self.wealth_ranking_key, low, high)
+            
+        except Exception as e:
+            logger.error(f"Error counting net worth range {min_worth}-{max_worth}: {e}")
+            raise
+    
+    def get_wealth_rank(self, individual_id: str) -> Optional[Dict[str, Any]]:
+        """Rank (1 = richest, ties share a rank) and percentile of one individual, or None if unranked.
+        
+        The percentile is the share of individuals whose net worth is lower
+        than or equal to this one's.
+        """
+        try:
+            result = redis_service.evalsha('wealth_rank', *self.wealth_rank_call(individual_id))
+            return self.format_wealth_rank(individual_id, result)
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth rank for {individual_id}: {e}")
+            raise
+    
+    def get_wealth_histogram(self, edges: Optional[List[float]] = None, per_decade: int = 1) -> Dict[str, Any]:
+        """Count individuals per net worth bucket with one pipelined ZCOUNT per bucket.
+        
+        Without ``edges`` the buckets are logarithmic, ``per_decade`` per power
+        of ten, spanning the lowest to the highest net worth.  Each bucket
+        includes its lower edge; the last one also includes its upper edge.
+        Individuals outside the edges are counted in ``below`` and ``above``.
+        """
+        try:
+            if edges is None:
+                pipe = redis_service.pipeline()
+                self.queue_net_worth_extremes(pipe)
+                edges = self.histogram_edges(*pipe.execute(), per_decade)
+                if edges is None:
+                    return self.format_histogram(None, [])
+            
+            pipe = redis_service.pipeline()
+            self.queue_histogram_counts(pipe, edges)
+            return self.format_histogram(edges, pipe.execute())
+            
+        except Exception as e:
+            logger.error(f"Error getting wealth histogram: {e}")
+            raise
+    
+    # Net worth history
+    def get_net_worth_history(self, individual_id: str, start: Optional[float] = None, end: Optional[float] = None,
+                              resolution: str = 'raw') -> Optional[Dict[str, Any]]:
+        """Net worth changes of one individual between two unix times, oldest first.
+        
+        ``raw`` returns every recorded change.  Other resolutions are
+        downsampled by a script to one row per fixed-width bucket (counted from
+        the Unix epoch) with the first, lowest, highest and last net worth.
+        None if the individual has no history and does not exist.
+        """
+        bounds, width = self.history_query(start, end, resolution)
+        
+        try:
+            key = self.history_key(individual_id)
+            if width:
+                reply = redis_service.evalsha('history_buckets', [key], [*bounds, width])
+            else:
+                reply = redis_service.client.zrangebyscore(key, *bounds)
+            history = self.format_history(individual_id, resolution, width, reply)
+            
+            if not history['points'] and not self.get_individual(individual_id):
+                return None
+            return history
+            
+        except Exception as e:
+            logger.error(f"Error getting net worth history of {individual_id}: {e}")
+            raise
+    
+    def get_movers(self, period: str = 'month', direction: str = 'gainers', limit: int = 10,
+                   previous: bool = False, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Largest net worth changes within the current (or previous) calendar period.
+        
+        Changes are summed into the period's sorted set as they are written,
+        so this reads the top entries directly.  Individuals deleted since
+        they moved are left out, which can return fewer than ``limit``.
+        """
+        label, keys, args = self.movers_call(period, direction, limit, previous)
+        
+        try:
+            reply = redis_service.evalsha('movers', keys, args)
+            individuals = self.get_individuals(self.mover_ids(reply))
+            return self.format_movers(period, label, direction, reply, individuals, fields)
+            
+        except Exception as e:
+            logger.error(f"Error getting {direction} for {period} {label}: {e}")
+            raise
+    
     def get_individuals_by_industry(self, industry: str) -> List[WealthyIndividual]:
         try:
             industry_key = f"{self.industry_index_key}:{industry}"
             individual_ids = redis_service.smembers(industry_key)
-            individuals = []
-            
-            for individual_id in individual_ids:
-                individual = self.get_individual(individual_id)
-                if individual:
-                    individuals.append(individual)
-            
-            return individuals
+            return self.get_individuals(individual_ids)
             
         except Exception as e:
             logger.error(f"Error getting individuals by industry {industry}: {e}")
             raise
     
-    def search_individuals(self, query: str) -> List[WealthyIndividual]:
+    def search_individuals(self, query: str, limit: int = 50) -> List[WealthyIndividual]:
+        """Search first name, last name, company and industry.
+        
+        Queries of three or more characters keep plain substring semantics:
+        candidates come from the intersection of the query's trigram sets
+        and are then checked against the fields.  Shorter queries match the
+        start of any word.  Results are ranked (exact field match, field
+        prefix, word prefix, substring), then by net worth, and capped at
+        ``limit``.
+        """
         try:
-            all_individuals = self.get_all_individuals()
-            search_term = query.lower()
-            
-            return [
-                ind for ind in all_individuals
-                if (search_term in ind.first_name.lower() or
-                    search_term in ind.last_name.lower() or
-                    search_term in ind.company.lower() or
-                    search_term in ind.industry.lower())
-            ]
+            search_term, candidate_keys = self.search_candidate_keys(query)
+            candidates = self.get_individuals(redis_service.sinter(*candidate_keys))
+            return self.rank_matches(candidates, search_term, limit)
             
         except Exception as e:
             logger.error(f"Error searching individuals: {e}")
@@ -212,52 +611,61 @@ class WealthService:
     
     # Analytics
     def get_wealth_statistics(self) -> Dict[str, Any]:
+        """Read the aggregates maintained by the mutation scripts.
+        
+        Costs one pipelined round trip of three constant-time commands,
+        whatever the number of individuals.
+        """
         try:
-            all_individuals = self.get_all_individuals()
-            
-            if not all_individuals:
-                return {}
-            
-            total_wealth = sum(ind.net_worth for ind in all_individuals)
-            avg_wealth = total_wealth / len(all_individuals)
-            max_wealth = max(ind.net_worth for ind in all_individuals)
-            min_wealth = min(ind.net_worth for ind in all_individuals)
-            
-            # Wealth tier distribution
-            wealth_tiers = {}
-            for ind in all_individuals:
-                wealth_tiers[ind.wealth_tier] = wealth_tiers.get(ind.wealth_tier, 0) + 1
-            
-            # Industry distribution
-            industries = {}
-            for ind in all_individuals:
-                industries[ind.industry] = industries.get(ind.industry, 0) + 1
-            
-            return {
-                'total_individuals': len(all_individuals),
-                'total_wealth': total_wealth,
-                'average_wealth': avg_wealth,
-                'max_wealth': max_wealth,
-                'min_wealth': min_wealth,
-                'wealth_tier_distribution': wealth_tiers,
-                'industry_distribution': industries
-            }
+            pipe = redis_service.pipeline()
+            pipe.hgetall(self.stats_key)
+            self.queue_net_worth_extremes(pipe)
+            return self.format_statistics(*pipe.execute())
             
         except Exception as e:
             logger.error(f"Error getting wealth statistics: {e}")
             raise
     
+    def rebuild_statistics(self) -> Dict[str, Any]:
+        """Recompute the aggregate counters from the stored records.
+        
+        Also rewrites each record's refs document so later updates and
+        deletes reverse exactly what the rebuilt counters contain.  Writes
+        that land while the rebuild runs may need another rebuild.
+        """
+        try:
+            individual_ids = redis_service.smembers(self.individuals_set_key)
+            counters: Dict[str, float] = {}
+            
+            for start in range(0, len(individual_ids), redis_service.batch_size):
+                chunk = individual_ids[start:start + redis_service.batch_size]
+                pipe = redis_service.pipeline()
+                
+                for individual in self.get_individuals(chunk):
+                    refs = self.index_refs(individual)
+                    for _, field, amount in refs['counters']:
+                        counters[field] = counters.get(field, 0) + float(amount)
+                    pipe.set(f"{self.individual_prefix}{individual.id}:refs", json.dumps(refs))
+                
+                pipe.execute()
+            
+            pipe = redis_service.pipeline(transaction=True)
+            pipe.delete(self.stats_key)
+            if counters:
+                pipe.hset(self.stats_key, mapping={field: repr(value) for field, value in counters.items()})
+            pipe.execute()
+            self.touch_generations(self.stats_key)
+            
+            logger.info(f"Rebuilt statistics from {len(individual_ids)} individuals")
+            return self.get_wealth_statistics()
+            
+        except Exception as e:
+            logger.error(f"Error rebuilding wealth statistics: {e}")
+            raise
+    
     def get_redis_info(self) -> Dict[str, Any]:
         try:
-            info = redis_service.info()
-            return {
-                'connected_clients': info.get('connected_clients', 0),
-                'used_memory_human': info.get('used_memory_human', '0'),
-                'used_memory_peak_human': info.get('used_memory_peak_human', '0'),
-                'keyspace_hits': info.get('keyspace_hits', 0),
-                'keyspace_misses': info.get('keyspace_misses', 0),
-                'total_commands_processed': info.get('total_commands_processed', 0)
-            }
+            return self.format_redis_info(redis_service.info())
         except Exception as e:
             logger.error(f"Error getting Redis info: {e}")
             raise
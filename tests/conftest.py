@@ -0,0 +1,77 @@
+"""Shared fixtures: the app and services run against an in-process fakeredis server.
+
+Every Redis connection pool the app builds is swapped for one that talks to
+SERVER before any app module is imported, so the module-level clients,
+dedicated clients and the asyncio client all share one fake dataset.
+fakeredis runs the Lua scripts through lupa.
+"""
+import os
+
+import fakeredis
+import pytest
+import redis
+import redis.asyncio
+
+SERVER = fakeredis.FakeServer()
+
+# The fake connections answer no health-check PINGs
+os.environ['REDIS_HEALTH_CHECK_INTERVAL'] = '0'
+os.environ.pop('REDIS_UNIX_SOCKET', None)
+os.environ.pop('REDIS_POOL_TIMEOUT', None)
+
+class FakeConnectionPool(redis.ConnectionPool):
+    def __init__(self, **kwargs):
+        kwargs.pop('path', None)
+        super().__init__(**kwargs, connection_class=fakeredis.FakeRedisConnection, server=SERVER)
+
+class AsyncFakeConnectionPool(redis.asyncio.ConnectionPool):
+    def __init__(self, **kwargs):
+        kwargs.pop('path', None)
+        super().__init__(**kwargs, connection_class=fakeredis.FakeAsyncRedisConnection, server=SERVER)
+
+redis.ConnectionPool = FakeConnectionPool
+redis.asyncio.ConnectionPool = AsyncFakeConnectionPool
+
+from app import create_app
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+@pytest.fixture(autouse=True)
+def clean_redis():
+    redis_service.client.flushall()
+    if wealth_service.cache:
+        wealth_service.cache.clear()
+    yield
+
+@pytest.fixture(scope='session')
+def app():
+    return create_app()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def make_individual():
+    """Create an individual through the service; keyword arguments override the defaults."""
+    created = 0
+    
+    def make(**overrides):
+        nonlocal created
+        created += 1
+        data = {
+            'first_name': 'Ada',
+            'last_name': f'Example{created}',
+            'company': 'Example Holdings',
+            'title': 'Founder',
+            'net_worth': 1_000_000_000 + created,
+            'industry': 'Technology',
+            'source_of_wealth': 'Software',
+            'email': f'person{created}@example.com',
+            'state': 'CA',
+            'city': 'San Francisco',
+            **overrides
+        }
+        return wealth_service.create_individual(data)
+    
+    return make
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+import anyio.to_thread
+import pytest
+from controllers.async_event_controller import AsyncEventController
+from services.change_feed import change_broadcaster
+from services.wealth_service import wealth_service
+
+@pytest.fixture
+def fast_broadcaster(monkeypatch):
+    monkeypatch.setattr(change_broadcaster, 'block_ms', 50)
+
+def test_stream_follows_the_feed_without_holding_a_thread(fast_broadcaster, make_individual):
+    first = make_individual()
+    
+    async def run():
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        subscription = change_broadcaster.subscribe(lambda: loop.call_soon_threadsafe(ready.set))
+        stream = AsyncEventController.event_stream(subscription, ready, '0-0', keepalive_s=0.3)
+        try:
+            messages = [await stream.__anext__() for _ in range(3)]
+            
+            # Waiting for the next batch borrows no thread-pool worker
+            waiting = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.1)
+            assert anyio.to_thread.current_default_thread_limiter().borrowed_tokens == 0
+            
+            writer = threading.Thread(target=wealth_service.update_individual, args=(first.id, {'net_worth': 5e9}))
+            writer.start()
+            messages.append(await asyncio.wait_for(waiting, 5))
+            writer.join()
+            messages.append(await asyncio.wait_for(stream.__anext__(), 5))
+            messages.append(await asyncio.wait_for(stream.__anext__(), 5))
+            return messages
+        finally:
+            await stream.aclose()
+            change_broadcaster.unsubscribe(subscription)
+    
+    retry, created, stats, updated, changed_stats, keepalive = asyncio.run(run())
+    assert retry == 'retry: 3000\n\n'
+    assert created.startswith('event: individual') and '"type":"created"' in created
+    assert stats.startswith('event: stats')
+    assert updated.startswith('event: individual') and '"type":"updated"' in updated and '"rank":1' in updated
+    assert changed_stats.startswith('event: stats') and '"total_wealth":5000000000.0' in changed_stats
+    assert keepalive == ': keepalive\n\n'
+
+def test_dropped_subscription_ends_the_stream(make_individual):
+    async def run():
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        subscription = change_broadcaster.subscribe(lambda: loop.call_soon_threadsafe(ready.set))
+        change_broadcaster.unsubscribe(subscription)
+        subscription.dropped = True
+        return [message async for message in AsyncEventController.event_stream(subscription, ready, '0-0')]
+    
+    assert asyncio.run(run()) == ['retry: 3000\n\n']
@@ -0,0 +1,24 @@
+import asyncio
+import pytest
+from config.redis_config import redis_config
+from services.async_redis_service import async_redis_service
+from services.async_wealth_service import async_wealth_service
+
+@pytest.fixture
+def small_async_pool(monkeypatch):
+    """Two-key MGET chunks over a pool of three connections."""
+    monkeypatch.setenv('REDIS_MAX_CONNECTIONS', '3')
+    monkeypatch.setattr(async_redis_service, 'batch_size', 2)
+    monkeypatch.setattr(redis_config, 'async_client', None)
+
+def test_more_chunks_than_connections(small_async_pool, make_individual):
+    created = [make_individual(first_name='Ada') for _ in range(20)]
+    
+    async def load():
+        individuals = await async_wealth_service.get_individuals([individual.id for individual in created])
+        matches = await async_wealth_service.search_individuals('ada', 5)
+        return individuals, matches
+    
+    individuals, matches = asyncio.run(load())
+    assert [individual.id for individual in individuals] == [individual.id for individual in created]
+    assert len(matches) == 5
@@ -0,0 +1,52 @@
+import json
+import pytest
+from services.codecs import TAG_PREFIX, ValueCodec
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+@pytest.fixture(params=['json', 'orjson', 'msgpack'])
+def codec(request, monkeypatch):
+    codec = ValueCodec(request.param)
+    monkeypatch.setattr(redis_service, 'codec', codec)
+    return codec
+
+def store_as_legacy_json(individual):
+    """Rewrite a record the way it was stored before values were tagged."""
+    record_key = f"{wealth_service.individual_prefix}{individual.id}"
+    redis_service.client.set(record_key, json.dumps(individual.to_dict()))
+    return record_key
+
+@pytest.mark.parametrize('value', [{'a': 1, 'b': [1.5, 'x', None]}, 'text', 12, [True, False]])
+def test_values_round_trip_and_legacy_json_still_decodes(codec, value):
+    encoded = codec.encode(value)
+    
+    assert encoded.startswith(TAG_PREFIX + codec.codec.tag)
+    assert codec.decode(encoded) == value
+    assert codec.decode(json.dumps(value).encode()) == value
+    assert codec.decode(json.dumps(value)) == value
+
+def test_payloads_of_any_codec_decode_under_another(codec):
+    for name in ('json', 'orjson', 'msgpack'):
+        assert codec.decode(ValueCodec(name).encode({'net_worth': 1e9})) == {'net_worth': 1e9}
+
+def test_legacy_records_are_read_through_the_services(codec, make_individual, client):
+    individual = make_individual(last_name='Lovelace')
+    store_as_legacy_json(individual)
+    
+    assert wealth_service.get_individual(individual.id, use_cache=False).to_dict() == individual.to_dict()
+    assert [ind.id for ind in wealth_service.get_individuals([individual.id])] == [individual.id]
+    assert [ind.id for ind in wealth_service.search_individuals('lovelace')] == [individual.id]
+    assert client.get(f'/individuals/{individual.id}').json['individual']['last_name'] == 'Lovelace'
+
+def test_updating_a_legacy_record_rewrites_it_with_the_codec(codec, make_individual):
+    individual = make_individual()
+    record_key = store_as_legacy_json(individual)
+    
+    wealth_service.update_individual(individual.id, {'title': 'Chair'})
+    
+    assert redis_service.execute_raw('GET', record_key).startswith(codec.tag)
+    assert wealth_service.get_individual(individual.id, use_cache=False).title == 'Chair'
+
+def test_legacy_json_members_decode():
+    assert redis_service.decode_member('"ind_1234"') == 'ind_1234'
+    assert redis_service.decode_member('ind_1234') == 'ind_1234'
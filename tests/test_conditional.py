@@ -0,0 +1,73 @@
+import pytest
+from starlette.testclient import TestClient
+from asgi import app as asgi_app
+
+@pytest.fixture
+def asgi_client():
+    with TestClient(asgi_app) as client:
+        yield client
+
+def revalidate(client, url, response):
+    return client.get(url, headers={'If-None-Match': response.headers['ETag']})
+
+def test_unchanged_record_answers_304(client, make_individual):
+    individual = make_individual()
+    url = f'/individuals/{individual.id}'
+    
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+    
+    not_modified = revalidate(client, url, response)
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
+    assert not_modified.headers['ETag'] == response.headers['ETag']
+    
+    since = client.get(url, headers={'If-Modified-Since': response.headers['Last-Modified']})
+    assert since.status_code == 304
+
+def test_record_etag_changes_only_with_the_record(client, make_individual):
+    individual = make_individual()
+    other = make_individual()
+    url = f'/individuals/{individual.id}'
+    response = client.get(url)
+    
+    client.put(f'/individuals/{other.id}', json={'title': 'Chair'})
+    assert revalidate(client, url, response).status_code == 304
+    
+    client.put(url, json={'title': 'Chair'})
+    refreshed = revalidate(client, url, response)
+    assert refreshed.status_code == 200
+    assert refreshed.json['individual']['title'] == 'Chair'
+    assert refreshed.headers['ETag'] != response.headers['ETag']
+
+def test_listing_etag_changes_with_any_write(client, make_individual):
+    make_individual()
+    response = client.get('/individuals')
+    assert revalidate(client, '/individuals', response).status_code == 304
+    
+    make_individual()
+    refreshed = revalidate(client, '/individuals', response)
+    assert refreshed.status_code == 200
+    assert refreshed.json['total'] == 2
+
+def test_stale_or_unknown_etags_get_the_full_response(client, make_individual):
+    individual = make_individual()
+    response = client.get(f'/individuals/{individual.id}', headers={'If-None-Match': '"0"'})
+    
+    assert response.status_code == 200
+    assert 'ETag' in response.headers
+
+def test_missing_record_has_no_validators(client):
+    response = client.get('/individuals/ind_missing')
+    
+    assert response.status_code == 404
+    assert 'ETag' not in response.headers
+
+def test_asgi_app_answers_304(asgi_client, make_individual):
+    individual = make_individual()
+    url = f'/individuals/{individual.id}'
+    
+    response = asgi_client.get(url)
+    assert response.status_code == 200
+    assert asgi_client.get(url, headers={'If-None-Match': response.headers['etag']}).status_code == 304
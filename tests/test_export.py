@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+from services.wealth_service import wealth_service
+
+def exported_ids(batches, between_batches=None):
+    ids = []
+    for batch in batches:
+        ids += [individual.id for individual in batch]
+        if between_batches:
+            between_batches()
+    return ids
+
+def test_batches_cover_every_individual_once_oldest_first(make_individual):
+    created = [make_individual() for _ in range(7)]
+    
+    assert exported_ids(wealth_service.iter_individual_batches(2)) == [individual.id for individual in created]
+
+def test_individuals_created_at_the_same_time_span_batches(make_individual):
+    created = [make_individual(created_at='2024-01-01T00:00:00') for _ in range(5)]
+    later = make_individual(created_at='2024-01-02T00:00:00')
+    
+    ids = exported_ids(wealth_service.iter_individual_batches(2))
+    assert sorted(ids[:5]) == sorted(individual.id for individual in created)
+    assert ids[5:] == [later.id]
+
+def test_writes_during_the_walk_repeat_and_skip_nobody(make_individual):
+    created = [make_individual(created_at=f'2024-01-0{day}T00:00:00') for day in range(1, 8)]
+    deleted = iter([created[0], created[1], created[6]])
+    
+    def write():
+        make_individual()
+        individual = next(deleted, None)
+        if individual:
+            wealth_service.delete_individual(individual.id)
+        wealth_service.update_individual(created[2].id, {'net_worth': 7_000_000_000})
+    
+    ids = exported_ids(wealth_service.iter_individual_batches(2), write)
+    
+    assert len(ids) == len(set(ids))
+    # Individuals that existed throughout are all exported
+    assert {individual.id for individual in created[2:6]} <= set(ids)
+
+def test_export_endpoint_streams_ndjson_and_csv(client, make_individual):
+    created = [make_individual() for _ in range(3)]
+    
+    ndjson = client.get('/individuals/export', query_string={'fields': 'last_name'})
+    rows = [json.loads(line) for line in ndjson.data.decode().splitlines()]
+    assert rows == [{'id': individual.id, 'last_name': individual.last_name} for individual in created]
+    
+    exported = client.get('/individuals/export', query_string={'format': 'csv', 'fields': 'last_name'})
+    assert list(csv.DictReader(io.StringIO(exported.data.decode()))) == rows
+    assert client.get('/individuals/export', query_string={'format': 'xml'}).status_code == 400
@@ -0,0 +1,45 @@
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+def industry_members(industry):
+    return set(redis_service.smembers(f"{wealth_service.industry_index_key}:{industry}"))
+
+def ranking_score(key, individual_id):
+    return redis_service.client.zscore(key, individual_id)
+
+def test_create_indexes_the_record(make_individual):
+    individual = make_individual(industry='Energy', net_worth=2_000_000_000)
+    
+    assert industry_members('Energy') == {individual.id}
+    assert individual.id in redis_service.smembers(wealth_service.individuals_set_key)
+    assert ranking_score(wealth_service.wealth_ranking_key, individual.id) == 2_000_000_000
+    assert ranking_score(f"{wealth_service.industry_ranking_key}:Energy", individual.id) == 2_000_000_000
+
+def test_create_of_an_existing_id_is_rejected(make_individual):
+    individual = make_individual()
+    keys, args = wealth_service.upsert_call('create', individual)
+    
+    assert redis_service.evalsha('upsert_individual', keys, args) == 0
+
+def test_update_moves_index_entries(make_individual):
+    moved = make_individual(industry='Energy', net_worth=2_000_000_000)
+    
+    wealth_service.update_individual(moved.id, {'industry': 'Retail', 'net_worth': 300_000_000})
+    
+    assert moved.id not in industry_members('Energy')
+    assert industry_members('Retail') == {moved.id}
+    assert ranking_score(f"{wealth_service.industry_ranking_key}:Energy", moved.id) is None
+    assert ranking_score(f"{wealth_service.industry_ranking_key}:Retail", moved.id) == 300_000_000
+    assert ranking_score(wealth_service.wealth_ranking_key, moved.id) == 300_000_000
+
+def test_delete_removes_every_index_entry(make_individual):
+    kept = make_individual(industry='Energy')
+    deleted = make_individual(industry='Energy')
+    
+    assert wealth_service.delete_individual(deleted.id)
+    
+    assert industry_members('Energy') == {kept.id}
+    assert ranking_score(wealth_service.wealth_ranking_key, deleted.id) is None
+    assert ranking_score(f"{wealth_service.industry_ranking_key}:Energy", deleted.id) is None
+    assert deleted.id not in redis_service.smembers(wealth_service.individuals_set_key)
+    assert not redis_service.client.exists(f"{wealth_service.individual_prefix}{deleted.id}:refs")
@@ -0,0 +1,71 @@
+import time
+import pytest
+from config.redis_config import redis_config
+from services.local_cache import LocalCache
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = LocalCache(max_size=100, ttl=60)
+    monkeypatch.setattr(wealth_service, 'cache', cache)
+    yield cache
+    if cache._listener is not None:
+        cache._listener.stop()
+
+@pytest.fixture
+def other_client():
+    """A connection of its own, standing in for another worker process."""
+    client = redis_config.create_dedicated_client()
+    yield client
+    client.close()
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+def test_reads_are_served_from_the_cache(cache, make_individual):
+    individual = make_individual()
+    
+    wealth_service.get_individual(individual.id)
+    wealth_service.get_individual(individual.id)
+    wealth_service.get_individuals([individual.id])
+    
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['size'] == 1
+
+def test_own_writes_invalidate_immediately(cache, make_individual):
+    individual = make_individual()
+    wealth_service.get_individual(individual.id)
+    
+    wealth_service.update_individual(individual.id, {'title': 'Chair'})
+    assert wealth_service.get_individual(individual.id).title == 'Chair'
+    
+    wealth_service.delete_individual(individual.id)
+    assert wealth_service.get_individual(individual.id) is None
+
+def test_write_from_another_client_invalidates_the_cache(cache, other_client, make_individual):
+    individual = make_individual()
+    assert wealth_service.get_individual(individual.id).title == 'Founder'
+    
+    # Another worker runs the same mutation script on its own connection
+    updated = wealth_service.merge_update(individual, {'title': 'Chair'})
+    keys, args = wealth_service.upsert_call('update', updated, previous=individual)
+    assert other_client.evalsha(redis_service.script_shas['upsert_individual'], len(keys), *keys, *args) == 1
+    
+    assert wait_for(lambda: cache.stats()['invalidations'] == 1)
+    assert wealth_service.get_individual(individual.id).title == 'Chair'
+
+def test_delete_from_another_client_invalidates_the_cache(cache, other_client, make_individual):
+    individual = make_individual()
+    wealth_service.get_individual(individual.id)
+    
+    keys, args = wealth_service.delete_call(individual.id)
+    other_client.evalsha(redis_service.script_shas['delete_individual'], len(keys), *keys, *args)
+    
+    assert wait_for(lambda: cache.stats()['invalidations'] == 1)
+    assert wealth_service.get_individual(individual.id) is None
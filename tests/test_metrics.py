@@ -0,0 +1,40 @@
+import pytest
+from services.metrics import Counter, Histogram, MetricsRegistry, _Metric
+
+def test_metric_types_must_implement_samples():
+    class Gauge(_Metric):
+        type_name = 'gauge'
+    
+    with pytest.raises(TypeError):
+        Gauge('queue_depth', 'Items waiting')
+
+def test_registry_renders_counters_and_histograms():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'Requests served', ['route'])
+    latency = registry.histogram('latency_seconds', 'Request latency', buckets=(0.1, 1.0))
+    requests.inc('/individuals')
+    requests.inc('/individuals', amount=2)
+    latency.observe(0.05)
+    latency.observe(5.0)
+    
+    assert isinstance(requests, Counter) and isinstance(latency, Histogram)
+    assert registry.render().splitlines() == [
+        '# HELP latency_seconds Request latency',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1.0"} 1',
+        'latency_seconds_bucket{le="+Inf"} 2',
+        'latency_seconds_sum 5.05',
+        'latency_seconds_count 2',
+        '# HELP requests_total Requests served',
+        '# TYPE requests_total counter',
+        'requests_total{route="/individuals"} 3',
+    ]
+
+def test_registering_a_name_again_returns_the_same_metric():
+    registry = MetricsRegistry()
+    counter = registry.counter('errors_total', 'Errors', ['kind'])
+    
+    assert registry.counter('errors_total', 'Errors', ['kind']) is counter
+    with pytest.raises(ValueError):
+        registry.histogram('errors_total', 'Errors', ['kind'])
@@ -0,0 +1,46 @@
+from services.wealth_service import wealth_service
+
+def mover_ids(response):
+    return [mover['individual']['id'] for mover in response.json['movers']]
+
+def revalidate(client, url, response):
+    return client.get(url, headers={'If-None-Match': response.headers['ETag']})
+
+def test_net_worth_changes_rank_movers(client, make_individual):
+    gainer = make_individual(net_worth=1_000_000_000)
+    loser = make_individual(net_worth=1_000_000_000)
+    wealth_service.update_individual(gainer.id, {'net_worth': 3_000_000_000})
+    wealth_service.update_individual(loser.id, {'net_worth': 500_000_000})
+    
+    gainers = client.get('/individuals/movers', query_string={'period': 'day'})
+    losers = client.get('/individuals/movers', query_string={'period': 'day', 'direction': 'losers'})
+    
+    assert mover_ids(gainers) == [gainer.id]
+    assert gainers.json['movers'][0]['change'] == 2_000_000_000
+    assert mover_ids(losers) == [loser.id]
+
+def test_deleting_a_mover_refreshes_the_etag(client, make_individual):
+    mover = make_individual(net_worth=1_000_000_000)
+    wealth_service.update_individual(mover.id, {'net_worth': 2_000_000_000})
+    url = '/individuals/movers?period=week'
+    response = client.get(url)
+    assert mover_ids(response) == [mover.id]
+    assert revalidate(client, url, response).status_code == 304
+    
+    wealth_service.delete_individual(mover.id)
+    
+    refreshed = revalidate(client, url, response)
+    assert refreshed.status_code == 200
+    assert mover_ids(refreshed) == []
+
+def test_renaming_a_mover_refreshes_the_etag(client, make_individual):
+    mover = make_individual(net_worth=1_000_000_000)
+    wealth_service.update_individual(mover.id, {'net_worth': 2_000_000_000})
+    url = '/individuals/movers?period=month&fields=last_name'
+    response = client.get(url)
+    
+    wealth_service.update_individual(mover.id, {'last_name': 'Renamed'})
+    
+    refreshed = revalidate(client, url, response)
+    assert refreshed.status_code == 200
+    assert refreshed.json['movers'][0]['individual']['last_name'] == 'Renamed'
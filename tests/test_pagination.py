@@ -0,0 +1,69 @@
+import pytest
+from services.wealth_service import wealth_service
+
+def walk(sort='net_worth', limit=2, between_pages=None, **options):
+    """IDs of every page of a listing, calling ``between_pages`` after each page."""
+    ids, cursor = [], None
+    while True:
+        page = wealth_service.list_individuals(sort=sort, limit=limit, cursor=cursor, **options)
+        ids += [individual['id'] if isinstance(individual, dict) else individual.id for individual in page['individuals']]
+        cursor = page['next_cursor']
+        if not cursor:
+            return ids
+        if between_pages:
+            between_pages()
+
+@pytest.fixture
+def individuals(make_individual):
+    return [make_individual(net_worth=(index + 1) * 1_000_000_000, last_name=f'Name{index}') for index in range(7)]
+
+@pytest.mark.parametrize('sort', ['net_worth', 'last_name', 'created_at'])
+def test_pages_cover_every_individual_once(individuals, sort):
+    ids = walk(sort)
+    assert sorted(ids) == sorted(individual.id for individual in individuals)
+    if sort == 'net_worth':
+        assert ids == [individual.id for individual in reversed(individuals)]
+    if sort == 'last_name':
+        assert ids == [individual.id for individual in individuals]
+
+@pytest.mark.parametrize('options', [{}, {'fields': ['id', 'net_worth']}, {'filters': {'state': 'CA'}}])
+def test_inserts_ahead_of_the_cursor_do_not_shift_pages(individuals, make_individual, options):
+    def insert_richest():
+        make_individual(net_worth=100_000_000_000)
+    
+    ids = walk(between_pages=insert_richest, **options)
+    
+    assert len(ids) == len(set(ids))
+    assert ids == [individual.id for individual in reversed(individuals)]
+
+def test_deletes_ahead_of_the_cursor_do_not_skip_individuals(individuals):
+    remaining = [individual.id for individual in reversed(individuals)]
+    
+    def delete_richest():
+        wealth_service.delete_individual(remaining.pop(0))
+    
+    ids = walk(between_pages=delete_richest)
+    
+    assert ids == [individual.id for individual in reversed(individuals)]
+
+def test_cursor_falls_back_to_its_offset_when_the_anchor_moves(individuals):
+    first = wealth_service.list_individuals(limit=2)
+    # The last member of the page moves to the end of the ranking, so the
+    # cursor resumes at offset 2 of the new order
+    wealth_service.update_individual(first['individuals'][-1].id, {'net_worth': 1})
+    
+    second = wealth_service.list_individuals(limit=2, cursor=first['next_cursor'])
+    assert [individual.id for individual in second['individuals']] == [individuals[3].id, individuals[2].id]
+
+def test_offset_only_cursors_are_still_accepted(individuals):
+    cursor = wealth_service.encode_cursor('net_worth', 5)
+    page = wealth_service.list_individuals(limit=5, cursor=cursor)
+    
+    assert [individual.id for individual in page['individuals']] == [individuals[1].id, individuals[0].id]
+    assert page['next_cursor'] is None
+
+def test_invalid_cursors_are_rejected(client, individuals):
+    other_sort = wealth_service.list_individuals(sort='last_name', limit=2)['next_cursor']
+    
+    assert client.get('/individuals', query_string={'cursor': 'garbage'}).status_code == 400
+    assert client.get('/individuals', query_string={'cursor': other_sort}).status_code == 400
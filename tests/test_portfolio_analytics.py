@@ -0,0 +1,49 @@
+import pytest
+from services.portfolio_analytics import portfolio_analytics
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+@pytest.fixture
+def portfolios(make_individual):
+    created = []
+    for index, industry in enumerate(['Energy', 'Energy', 'Retail']):
+        individual = make_individual(industry=industry)
+        created.append(wealth_service.create_portfolio({
+            'individual_id': individual.id,
+            'liquid_assets': 100 * (index + 1),
+            'real_estate_value': 300,
+            'risk_tolerance': 'Aggressive' if index else 'Conservative'
+        }))
+    return created
+
+@pytest.fixture
+def repeating_hscan(monkeypatch):
+    """HSCAN that returns its first page again, as it may while the hash is rehashed."""
+    client_class = type(redis_service.client)
+    hscan = client_class.hscan
+    
+    def replay(self, name, cursor=0, **kwargs):
+        next_cursor, entries = hscan(self, name, cursor, **kwargs)
+        if cursor == 0:
+            return 1, entries
+        return 0, hscan(self, name, 0, **kwargs)[1]
+    
+    monkeypatch.setattr(client_class, 'hscan', replay)
+
+def test_analytics_totals_and_groups(portfolios):
+    analytics = portfolio_analytics.get_analytics(['industry', 'risk_tolerance'])
+    
+    assert analytics['portfolios'] == 3
+    assert analytics['overall']['liquid_assets']['total'] == 600
+    assert analytics['overall']['total_value']['total'] == 1500
+    assert analytics['groups']['industry']['Energy']['count'] == 2
+    assert analytics['groups']['industry']['Retail']['liquid_assets']['total'] == 300
+    assert analytics['groups']['risk_tolerance']['Aggressive']['count'] == 2
+
+def test_repeated_scan_entries_are_counted_once(portfolios, repeating_hscan):
+    batches = list(wealth_service.iter_portfolio_batches())
+    assert sorted(row['id'] for batch in batches for row in batch) == sorted(portfolio.id for portfolio in portfolios)
+    
+    analytics = portfolio_analytics.get_analytics(['industry'])
+    assert analytics['portfolios'] == 3
+    assert analytics['overall']['liquid_assets']['total'] == 600
@@ -0,0 +1,49 @@
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+def search_ids(query):
+    return [individual.id for individual in wealth_service.search_individuals(query)]
+
+def test_search_matches_substrings_and_word_prefixes(make_individual):
+    lovelace = make_individual(first_name='Ada', last_name='Lovelace', company='Analytical Engines')
+    make_individual(first_name='Grace', last_name='Hopper', company='Compilers Inc')
+    
+    assert search_ids('lovel') == [lovelace.id]
+    assert search_ids('ELACE') == [lovelace.id]
+    assert search_ids('an') == [lovelace.id]
+    assert search_ids('zzz') == []
+
+def test_search_ranks_exact_matches_first(make_individual):
+    prefix = make_individual(last_name='Smithson', net_worth=9_000_000_000)
+    exact = make_individual(last_name='Smith', net_worth=1_000_000_000)
+    
+    assert search_ids('smith') == [exact.id, prefix.id]
+
+def test_update_moves_search_terms(make_individual):
+    individual = make_individual(last_name='Lovelace', company='Analytical Engines')
+    
+    wealth_service.update_individual(individual.id, {'last_name': 'Babbage', 'company': 'Difference Engines'})
+    
+    assert search_ids('lovelace') == []
+    assert search_ids('analytical') == []
+    assert search_ids('babbage') == [individual.id]
+    assert search_ids('difference') == [individual.id]
+    assert search_ids('engines') == [individual.id]
+    # No stale trigram or prefix entries are left for the old name
+    assert individual.id not in redis_service.smembers(f"{wealth_service.search_trigram_key}:lov")
+    assert individual.id not in redis_service.smembers(f"{wealth_service.search_prefix_key}:lo")
+
+def test_deleted_individual_is_not_found(make_individual):
+    individual = make_individual(last_name='Lovelace')
+    wealth_service.delete_individual(individual.id)
+    
+    assert search_ids('lovelace') == []
+    assert search_ids('lo') == []
+
+def test_search_endpoint_requires_a_query(client, make_individual):
+    individual = make_individual(last_name='Lovelace')
+    
+    response = client.get('/individuals/search', query_string={'q': 'lovelace', 'fields': 'last_name'})
+    assert response.status_code == 200
+    assert response.json['individuals'] == [{'id': individual.id, 'last_name': 'Lovelace'}]
+    assert client.get('/individuals/search').status_code == 400
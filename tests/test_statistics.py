@@ -0,0 +1,47 @@
+from services.redis_service import redis_service
+from services.wealth_service import wealth_service
+
+def assert_statistics_consistent():
+    # The aggregates kept by the scripts match a full rebuild from the records
+    assert wealth_service.get_wealth_statistics() == wealth_service.rebuild_statistics()
+
+def test_create_counts_the_individual(make_individual):
+    make_individual(industry='Energy', net_worth=2_000_000_000)
+    
+    stats = wealth_service.get_wealth_statistics()
+    assert stats['total_individuals'] == 1
+    assert stats['industry_distribution'] == {'Energy': 1}
+    assert stats['wealth_tier_distribution'] == {'Ultra High Net Worth': 1}
+    assert_statistics_consistent()
+
+def test_update_moves_counters(make_individual):
+    moved = make_individual(industry='Energy', net_worth=2_000_000_000)
+    make_individual(industry='Energy', net_worth=600_000_000)
+    
+    wealth_service.update_individual(moved.id, {'industry': 'Retail', 'net_worth': 300_000_000})
+    
+    stats = wealth_service.get_wealth_statistics()
+    assert stats['industry_distribution'] == {'Energy': 1, 'Retail': 1}
+    assert stats['total_wealth'] == 900_000_000
+    assert stats['max_wealth'] == 600_000_000
+    assert stats['min_wealth'] == 300_000_000
+    assert_statistics_consistent()
+
+def test_delete_reverses_counters(make_individual):
+    make_individual(industry='Energy')
+    deleted = make_individual(industry='Retail')
+    
+    wealth_service.delete_individual(deleted.id)
+    
+    stats = wealth_service.get_wealth_statistics()
+    assert stats['total_individuals'] == 1
+    assert stats['industry_distribution'] == {'Energy': 1}
+    assert_statistics_consistent()
+
+def test_delete_of_last_individual_empties_statistics(make_individual):
+    individual = make_individual()
+    wealth_service.delete_individual(individual.id)
+    
+    assert wealth_service.get_wealth_statistics() == {}
+    assert not redis_service.client.exists(wealth_service.stats_key)
+    assert_statistics_consistent()